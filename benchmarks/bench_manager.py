@@ -0,0 +1,77 @@
+"""
+Benchmark for the event routing of `pygwin.WindowManager`.
+
+This script measures the cost of dispatching a frame's worth of window events
+with 1 to 64 open windows, and compares it to the naive approach of scanning
+every window to find the owner of each event. The cost per event of the
+manager should stay flat as the number of windows grows.
+
+Run it from the root directory of the repository:
+
+    python benchmarks/bench_manager.py
+"""
+
+import os
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# pylint: disable=C0413
+import pygame
+
+import pygwin
+
+EVENTS_PER_FRAME = 256
+WINDOW_COUNTS = (1, 4, 16, 64)
+REPEAT = 200
+
+
+def handler(window, event):
+    pass
+
+
+def scan(windows, events):
+    for event in events:
+        for window in windows:
+            if window == event.window:
+                handler(window, event)
+                break
+
+
+def route(manager, events):
+    dispatch = manager.dispatch
+    for event in events:
+        dispatch(event)
+
+
+def main():
+    pygame.init()
+    print(f"{'windows':>8} {'manager (us/event)':>20} {'scan (us/event)':>17}")
+
+    for count in WINDOW_COUNTS:
+        windows = [pygwin.Window() for _ in range(count)]
+        manager = pygwin.WindowManager(*windows)
+        for window in windows:
+            manager.bind(window, pygame.WINDOWMOVED, handler)
+
+        # Spread the events evenly so the scan hits its average case
+        events = [
+            pygame.event.Event(
+                pygame.WINDOWMOVED, window=windows[i % count].__window__, x=0, y=0
+            )
+            for i in range(EVENTS_PER_FRAME)
+        ]
+
+        total = EVENTS_PER_FRAME * REPEAT / 1e6
+        routed = timeit.timeit(lambda: route(manager, events), number=REPEAT)
+        scanned = timeit.timeit(lambda: scan(windows, events), number=REPEAT)
+        print(f"{count:>8} {routed / total:>20.3f} {scanned / total:>17.3f}")
+
+        for window in windows:
+            window.destroy()
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
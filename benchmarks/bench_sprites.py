@@ -0,0 +1,101 @@
+"""
+Benchmark for `pygwin.SpriteBatch`.
+
+This script draws 1k, 10k and 100k sprites spread over a handful of textures,
+once with one `Texture.draw` call per sprite in submission order and once
+through a sprite batch, which groups the draws by texture and blend mode
+before submitting them, and once through `SpriteBatch.draw_many` with the
+sprites already grouped by the caller. Each measurement includes presenting
+the frame, which is where SDL executes the queued render commands.
+
+With the dummy video driver, which uses the software renderer, presenting
+takes most of the time and changing the blend mode of a texture is cheap, so
+`draw_many` is on par with the direct draws and `draw` is slower, because of
+the cost of recording each sprite.
+
+Run it from the root directory of the repository:
+
+    python benchmarks/bench_sprites.py
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# pylint: disable=C0413
+import pygame
+
+import pygwin
+
+SPRITE_COUNTS = (1_000, 10_000, 100_000)
+TEXTURE_COUNT = 8
+
+
+def draw_naive(window, sprites):
+    for texture, blend_mode, dstrect in sprites:
+        texture.blend_mode = blend_mode
+        texture.draw(None, dstrect)
+    window.update()
+
+
+def draw_batch(window, batch, sprites):
+    draw = batch.draw
+    for texture, blend_mode, dstrect in sprites:
+        draw(texture, None, dstrect, blend_mode=blend_mode)
+    batch.flush()
+    window.update()
+
+
+def draw_bulk(window, batch, groups):
+    draw_many = batch.draw_many
+    for (texture, blend_mode), dstrects in groups.items():
+        draw_many(texture, dstrects, blend_mode=blend_mode)
+    batch.flush()
+    window.update()
+
+
+def measure(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    pygame.init()
+    window = pygwin.Window(size=(800, 600))
+    batch = pygwin.SpriteBatch(window)
+    textures = [
+        window.textures.get(pygame.Surface((16, 16))) for _ in range(TEXTURE_COUNT)
+    ]
+    modes = (pygame.BLENDMODE_BLEND, pygame.BLENDMODE_ADD)
+
+    print(f"{'sprites':>8} {'naive (ms)':>11} {'batch (ms)':>11} {'bulk (ms)':>10}")
+    for count in SPRITE_COUNTS:
+        sprites = [
+            (
+                random.choice(textures),
+                random.choice(modes),
+                (random.randrange(784), random.randrange(584), 16, 16),
+            )
+            for _ in range(count)
+        ]
+        groups = {}
+        for texture, blend_mode, dstrect in sprites:
+            groups.setdefault((texture, blend_mode), []).append(dstrect)
+
+        naive = measure(draw_naive, window, sprites)
+        batched = measure(draw_batch, window, batch, sprites)
+        bulk = measure(draw_bulk, window, batch, groups)
+        print(
+            f"{count:>8} {naive * 1e3:>11.2f} {batched * 1e3:>11.2f} "
+            f"{bulk * 1e3:>10.2f}"
+        )
+
+    window.destroy()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
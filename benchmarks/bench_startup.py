@@ -0,0 +1,54 @@
+"""
+Benchmark for the startup cost of `pygwin.Window`.
+
+This script measures how long it takes to open a batch of auxiliary windows
+that are never drawn to, and compares it to opening the same windows with a
+renderer created right away. Since the renderer of a `Window` is created on
+first use, the first case should be noticeably cheaper.
+
+Run it from the root directory of the repository:
+
+    python benchmarks/bench_startup.py
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# pylint: disable=C0413
+import pygame
+
+import pygwin
+
+WINDOW_COUNTS = (1, 8, 32)
+REPEAT = 5
+
+
+def open_windows(count, draw):
+    start = time.perf_counter()
+    windows = [pygwin.Window() for _ in range(count)]
+    if draw:
+        for window in windows:
+            window.create_renderer()
+    elapsed = time.perf_counter() - start
+
+    for window in windows:
+        window.destroy()
+    return elapsed
+
+
+def main():
+    pygame.init()
+    print(f"{'windows':>8} {'lazy (ms)':>10} {'eager (ms)':>11}")
+
+    for count in WINDOW_COUNTS:
+        lazy = min(open_windows(count, False) for _ in range(REPEAT))
+        eager = min(open_windows(count, True) for _ in range(REPEAT))
+        print(f"{count:>8} {lazy * 1e3:>10.3f} {eager * 1e3:>11.3f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
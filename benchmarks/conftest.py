@@ -0,0 +1,30 @@
+"""
+Shared fixtures of the benchmark suite.
+
+The suite runs headless: SDL is pointed at its dummy video driver unless
+another driver is explicitly requested through `SDL_VIDEODRIVER`.
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# pylint: disable=C0413
+import pygame
+import pytest
+
+import pygwin
+
+
+@pytest.fixture(scope="session", autouse=True)
+def video():
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def window():
+    window = pygwin.Window()
+    yield window
+    window.destroy()
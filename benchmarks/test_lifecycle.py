@@ -0,0 +1,25 @@
+import pygwin
+
+
+def test_create_destroy(benchmark):
+    def lifecycle():
+        pygwin.Window().destroy()
+
+    benchmark(lifecycle)
+
+
+def test_create_configured(benchmark):
+    def lifecycle():
+        window = pygwin.Window(title="bench", size=(320, 240), position=(0, 0))
+        window.destroy()
+
+    benchmark(lifecycle)
+
+
+def test_create_with_renderer(benchmark):
+    def lifecycle():
+        window = pygwin.Window()
+        window.create_renderer()
+        window.destroy()
+
+    benchmark(lifecycle)
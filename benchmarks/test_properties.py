@@ -0,0 +1,37 @@
+import pytest
+
+from pygwin.window import WindowState
+
+VALUES = {
+    "title": ("first", "second"),
+    "size": ((320, 240), (640, 480)),
+    "position": ((0, 0), (10, 10)),
+    "fullscreen": (True, False),
+    "visible": (True, False),
+    "borderless": (True, False),
+    "resizable": (True, False),
+    "minimized": (True, False),
+    "maximized": (True, False),
+}
+
+
+@pytest.mark.parametrize("name", WindowState.__slots__)
+def test_get(benchmark, window, name):
+    benchmark(getattr, window, name)
+
+
+@pytest.mark.parametrize("name", WindowState.__slots__)
+def test_set(benchmark, window, name):
+    first, second = VALUES[name]
+
+    def toggle():
+        setattr(window, name, first)
+        setattr(window, name, second)
+
+    benchmark(toggle)
+
+
+@pytest.mark.parametrize("name", WindowState.__slots__)
+def test_set_unchanged(benchmark, window, name):
+    value = getattr(window, name)
+    benchmark(setattr, window, name, value)
@@ -0,0 +1,16 @@
+def test_fill_update(benchmark, window):
+    def frame():
+        window.fill((30, 30, 30))
+        window.update()
+
+    benchmark(frame)
+
+
+def test_fill_rects(benchmark, window):
+    rects = [(x % 640, x % 480, 8, 8) for x in range(1000)]
+
+    def frame():
+        window.fill_rects(rects, (200, 50, 50))
+        window.update()
+
+    benchmark(frame)
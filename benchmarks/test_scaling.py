@@ -0,0 +1,29 @@
+import pytest
+
+import pygwin
+
+
+@pytest.fixture(params=(1, 4, 16, 64))
+def manager(request):
+    windows = [pygwin.Window() for _ in range(request.param)]
+    yield pygwin.WindowManager(*windows)
+    for window in windows:
+        window.destroy()
+
+
+def test_frame(benchmark, manager):
+    def frame():
+        manager.pump()
+        for window in manager:
+            window.fill()
+        manager.present_all()
+
+    benchmark(frame)
+
+
+def test_idle_frame(benchmark, manager):
+    def frame():
+        manager.pump()
+        manager.present_all()
+
+    benchmark(frame)
@@ -12,5 +12,43 @@ window creation and management.
 from pygwin.__attr__ import *  # isort: skip
 
 # Import window tools
-from pygwin import window
+from pygwin import (
+    aio,
+    clock,
+    command,
+    draw,
+    idle,
+    layer,
+    layout,
+    lifecycle,
+    manager,
+    mirror,
+    pool,
+    record,
+    resize,
+    scaling,
+    session,
+    sprite,
+    stats,
+    target,
+    texture,
+    window,
+)
+from pygwin.aio import EventPump
+from pygwin.clock import PACE_CATCHUP, PACE_SKIP, FramePacer
+from pygwin.command import CommandList
+from pygwin.idle import IdlePolicy
+from pygwin.layer import Layer, LayerStack
+from pygwin.layout import WindowLayout
+from pygwin.lifecycle import ResourceUsage
+from pygwin.manager import WindowManager
+from pygwin.mirror import Mirror, MirrorSet
+from pygwin.pool import WindowPool
+from pygwin.record import RECORD_PNG, RECORD_RAW, FrameRecorder
+from pygwin.resize import ResizeDebouncer
+from pygwin.scaling import ResolutionController
+from pygwin.session import LazyWindow, WindowSession
+from pygwin.sprite import SpriteBatch
+from pygwin.stats import WindowStats
+from pygwin.texture import StreamingTexture, TextureCache
 from pygwin.window import WINDOWPOS_CENTERED, WINDOWPOS_UNDEFINED, Window
@@ -0,0 +1,213 @@
+"""
+This module integrates pygwin with `asyncio`. It defines an `EventPump` class
+that pumps the SDL event queue from the event loop at a fixed cadence and
+fans the events out to per-window asynchronous queues, which back
+`Window.events`. Pumping runs as a task of the event loop, on the thread that
+runs it, so SDL is only ever called from that thread.
+"""
+
+import asyncio
+import time
+import weakref
+from collections import deque
+
+import pygame
+
+from pygwin.resize import coalesce
+
+# Define the default number of times per second the event queue is pumped
+PUMP_RATE = 250
+
+# Define the default longest time the pump may hold the event loop, in seconds
+PUMP_SLICE = 0.002
+
+# Define the default number of events no queue is subscribed to that are kept
+PUMP_BACKLOG = 256
+
+# Define the event pumps of the running event loops
+PUMPS = weakref.WeakKeyDictionary()
+
+
+class EventPump:
+    """
+    An asynchronous pump of the SDL event queue.
+
+    The pump only runs while something is subscribed to it. Each time it
+    runs, it fetches every pending event and puts each of them in the queues
+    subscribed to the window it belongs to, or in the queues subscribed to
+    every event. Events no queue is subscribed to, such as `pygame.QUIT` when
+    only windows are subscribed, are given to the fallback of the pump, or
+    kept in its backlog for the caller to handle. They are never put back in
+    the SDL event queue, where the pump would fetch them again. It yields to
+    the event loop whenever it has held it for longer than its time slice.
+
+    :ivar float interval: The time between two pumps, in seconds.
+    :ivar float slice: The longest time the pump may hold the event loop, in
+        seconds.
+    :ivar Optional[Callable] fallback: The function called with each event
+        no queue is subscribed to, or None to keep these events in the
+        backlog.
+    :ivar Deque[pygame.event.Event] backlog: The latest events no queue was
+        subscribed to, when there is no fallback. The oldest events are
+        dropped once it is full.
+    :ivar Dict[Optional[int], List[asyncio.Queue]] __queues__: The subscribed
+        queues, indexed by SDL window ID, or by None for the queues that
+        receive every event.
+    :ivar Dict[asyncio.Queue, Optional[int]] __keys__: The key each queue was
+        subscribed with. SDL resets the ID of a window to 0 when it is
+        destroyed, so queues are unsubscribed with the key saved here.
+    :ivar Optional[asyncio.Task] __task__: The task running the pump.
+    """
+
+    def __init__(
+        self, rate=PUMP_RATE, slice=PUMP_SLICE, fallback=None, backlog=PUMP_BACKLOG
+    ):
+        """
+        Initializes a new event pump.
+
+        :param float rate: The number of times per second the event queue is
+            pumped. Default is `PUMP_RATE`.
+        :param float slice: The longest time the pump may hold the event loop,
+            in seconds. Default is `PUMP_SLICE`.
+        :param Optional[Callable] fallback: The function called as
+            `fallback(event)` with each event no queue is subscribed to. If
+            not specified, these events are kept in the backlog.
+        :param int backlog: The number of events no queue is subscribed to
+            that are kept when there is no fallback. Default is
+            `PUMP_BACKLOG`.
+        """
+        # pylint: disable=W0622
+        self.interval = 1 / rate
+        self.slice = slice
+        self.fallback = fallback
+        self.backlog = deque(maxlen=backlog)
+        self.__queues__ = {}
+        self.__keys__ = {}
+        self.__task__ = None
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<EventPump(rate subscribers)>`.
+        """
+        count = sum(len(queues) for queues in self.__queues__.values())
+        return f"<EventPump({round(1 / self.interval)} {count})>"
+
+    @property
+    def running(self):
+        """
+        Get whether the pump is running.
+
+        :return: True if the task of the pump is running, False otherwise.
+        """
+        return self.__task__ is not None and not self.__task__.done()
+
+    def subscribe(self, window=None):
+        """
+        Subscribe a new queue to the events of a window, and start the pump
+        if needed. This method must be called from a running event loop.
+
+        :param Optional[Window] window: The window to receive the events of.
+            If not specified, the queue receives every event.
+        :return: The `asyncio.Queue` the events are put in.
+        """
+        queue = asyncio.Queue()
+        key = None if window is None else window.id
+        self.__queues__.setdefault(key, []).append(queue)
+        self.__keys__[queue] = key
+        if not self.running:
+            self.__task__ = asyncio.ensure_future(self.__run__())
+        return queue
+
+    def unsubscribe(self, queue):
+        """
+        Unsubscribe a queue. The pump stops once nothing is subscribed to it.
+        The queue is found through the key it was subscribed with, so it can
+        be unsubscribed after its window was destroyed.
+
+        :param asyncio.Queue queue: The queue to unsubscribe.
+        """
+        if queue not in self.__keys__:
+            return
+
+        key = self.__keys__.pop(queue)
+        queues = self.__queues__[key]
+        queues.remove(queue)
+        if not queues:
+            del self.__queues__[key]
+
+    def route(self, event):
+        """
+        Put an event in the queues subscribed to it.
+
+        :param pygame.event.Event event: The event to route.
+        :return: The number of queues the event was put in.
+        """
+        count = 0
+        source = getattr(event, "window", None)
+        if source is not None:
+            for queue in self.__queues__.get(source.id, ()):
+                queue.put_nowait(event)
+                count += 1
+        for queue in self.__queues__.get(None, ()):
+            queue.put_nowait(event)
+            count += 1
+        return count
+
+    async def pump(self):
+        """
+        Pump the event queue once and route every pending event, yielding to
+        the event loop whenever the time slice is exhausted. Only the latest
+        move and resize events of each window are routed, and the events no
+        queue is subscribed to are given to the fallback, or kept in the
+        backlog.
+
+        :return: The number of events routed.
+        """
+        start = time.perf_counter()
+        events = coalesce(pygame.event.get())
+        count = 0
+        for event in events:
+            if self.route(event):
+                count += 1
+            elif self.fallback is None:
+                self.backlog.append(event)
+            else:
+                self.fallback(event)
+            if time.perf_counter() - start > self.slice:
+                await asyncio.sleep(0)
+                start = time.perf_counter()
+        return count
+
+    async def __run__(self):
+        """
+        Pump the event queue at the rate of the pump for as long as something
+        is subscribed to it.
+        """
+        while self.__queues__:
+            await self.pump()
+            await asyncio.sleep(self.interval)
+
+
+def get_pump(rate=None, slice=None):
+    """
+    Get the event pump of the running event loop, creating it if needed.
+
+    :param Optional[float] rate: The number of times per second the event
+        queue should be pumped. If not specified, the rate is left unchanged.
+    :param Optional[float] slice: The longest time the pump may hold the event
+        loop, in seconds. If not specified, the slice is left unchanged.
+    :return: The `EventPump` shared by every window on the running loop.
+    :raises RuntimeError: If no event loop is running.
+    """
+    # pylint: disable=W0622
+    loop = asyncio.get_running_loop()
+    pump = PUMPS.get(loop)
+    if pump is None:
+        pump = PUMPS[loop] = EventPump()
+    if rate is not None:
+        pump.interval = 1 / rate
+    if slice is not None:
+        pump.slice = slice
+    return pump
@@ -0,0 +1,40 @@
+import asyncio
+from typing import Callable, Deque, Dict, List, Optional
+from weakref import WeakKeyDictionary
+
+from pygame.event import Event
+
+from pygwin.window import Window
+
+PUMP_RATE: float
+PUMP_SLICE: float
+PUMP_BACKLOG: int
+PUMPS: WeakKeyDictionary[asyncio.AbstractEventLoop, EventPump]
+
+class EventPump:
+    interval: float
+    slice: float
+    fallback: Optional[Callable[[Event], object]]
+    backlog: Deque[Event]
+    __queues__: Dict[Optional[int], List[asyncio.Queue[Event]]]
+    __keys__: Dict[asyncio.Queue[Event], Optional[int]]
+    __task__: Optional[asyncio.Future[None]]
+
+    def __init__(
+        self,
+        rate: float = ...,
+        slice: float = ...,
+        fallback: Optional[Callable[[Event], object]] = None,
+        backlog: int = ...,
+    ) -> None: ...
+    @property
+    def running(self) -> bool: ...
+    def subscribe(self, window: Optional[Window] = None) -> asyncio.Queue[Event]: ...
+    def unsubscribe(self, queue: asyncio.Queue[Event]) -> None: ...
+    def route(self, event: Event) -> int: ...
+    async def pump(self) -> int: ...
+    async def __run__(self) -> None: ...
+
+def get_pump(
+    rate: Optional[float] = None, slice: Optional[float] = None
+) -> EventPump: ...
@@ -0,0 +1,514 @@
+"""
+This module defines a `FramePacer` class that paces a frame loop to a target
+frame rate. Unlike `pygame.time.Clock`, it sleeps for most of the remaining
+frame time and spins for the last moment, which gives stable frame times
+without keeping a core busy for the whole frame.
+
+It also defines the `LoopMixin` class, which gives `Window` its paced frame
+loops and the policies they apply between frames: throttling windows the user
+cannot see and debouncing resizes.
+"""
+
+import asyncio
+import inspect
+import time
+
+from pygwin.aio import get_pump
+from pygwin.idle import HIDDEN_FPS, IDLE_FPS, IdlePolicy
+from pygwin.resize import RESIZE_SETTLE_TIME, ResizeDebouncer
+
+# Define the frame pacing policies
+PACE_SKIP = "skip"
+PACE_CATCHUP = "catchup"
+
+# Define the default time spent spinning at the end of each frame, in seconds
+SPIN_TIME = 0.002
+
+
+class FramePacer:
+    """
+    A hybrid sleep-then-spin frame pacer.
+
+    Each call to `tick` waits until the deadline of the current frame and
+    schedules the next one. When a frame overruns its budget, the policy
+    decides what happens to the frames that were missed: `PACE_SKIP` drops
+    them and starts a new schedule from the current time, while
+    `PACE_CATCHUP` keeps the original schedule and runs the late frames back
+    to back until it has caught up, up to `max_catchup` frames.
+
+    :ivar float interval: The target duration of a frame in seconds, or 0 for
+        an unlimited frame rate.
+    :ivar str policy: The policy applied to late frames.
+    :ivar float spin: The time spent spinning before each deadline, in
+        seconds.
+    :ivar int max_catchup: The maximum number of late frames run back to back
+        with the `PACE_CATCHUP` policy.
+    :ivar int frames: The number of frames paced so far.
+    :ivar int overruns: The number of frames whose work took longer than the
+        frame budget.
+    :ivar float frame_time: The duration of the last frame in seconds, from
+        the end of one `tick` to the end of the next one.
+    :ivar float work_time: The time spent working during the last frame, in
+        seconds, excluding the time spent waiting.
+    """
+
+    def __init__(self, fps=60, policy=PACE_SKIP, spin=SPIN_TIME, max_catchup=5):
+        """
+        Initializes a new frame pacer.
+
+        :param Optional[float] fps: The target frame rate. If None or 0, frames
+            are not limited and only timed. Default is 60.
+        :param str policy: The policy applied to late frames, either
+            `PACE_SKIP` or `PACE_CATCHUP`. Default is `PACE_SKIP`.
+        :param float spin: The time spent spinning before each deadline, in
+            seconds. Default is `SPIN_TIME`.
+        :param int max_catchup: The maximum number of late frames run back to
+            back with the `PACE_CATCHUP` policy. Default is 5.
+        :raises ValueError: If any parameter has an invalid value.
+        """
+        if policy not in (PACE_SKIP, PACE_CATCHUP):
+            raise ValueError(f"invalid frame pacing policy '{policy}'")
+        if fps is not None and fps < 0:
+            raise ValueError("fps must not be negative")
+
+        self.interval = 1 / fps if fps else 0.0
+        self.policy = policy
+        self.spin = spin
+        self.max_catchup = max_catchup
+        self.frames = 0
+        self.overruns = 0
+        self.frame_time = 0.0
+        self.work_time = 0.0
+        self.__deadline__ = None
+        self.__last__ = None
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<FramePacer(fps policy)>`.
+        """
+        fps = round(1 / self.interval, 2) if self.interval else None
+        return f"<FramePacer({fps} {self.policy})>"
+
+    @property
+    def fps(self):
+        """
+        Get the frame rate measured over the last frame.
+
+        :return: The inverse of the duration of the last frame, or 0.0 if no
+            frame has been paced yet.
+        """
+        return 1 / self.frame_time if self.frame_time else 0.0
+
+    def reset(self):
+        """
+        Forget the current schedule, so the next `tick` starts a new one.
+        """
+        self.__deadline__ = None
+        self.__last__ = None
+
+    def tick(self):
+        """
+        Wait for the end of the current frame and schedule the next one.
+
+        :return: The duration of the frame that just ended in seconds, or 0.0
+            on the first call.
+        """
+        if self.__begin__():
+            return 0.0
+
+        deadline = self.__deadline__
+        remaining = deadline - time.perf_counter()
+        if remaining > self.spin:
+            time.sleep(remaining - self.spin)
+        while time.perf_counter() < deadline:
+            pass
+        return self.__advance__()
+
+    async def tick_async(self):
+        """
+        Wait for the end of the current frame without blocking the event
+        loop, and schedule the next one.
+
+        The remaining frame time is spent in `asyncio.sleep`, so other tasks
+        keep running while the frame waits. There is no spinning, so the
+        precision is that of the timers of the event loop.
+
+        :return: The duration of the frame that just ended in seconds, or 0.0
+            on the first call.
+        """
+        if self.__begin__():
+            return 0.0
+
+        remaining = self.__deadline__ - time.perf_counter()
+        await asyncio.sleep(max(remaining, 0))
+        return self.__advance__()
+
+    def __begin__(self):
+        """
+        Record the end of the work of the current frame.
+
+        :return: True if this is the first frame, which starts the schedule
+            and needs no waiting, False otherwise.
+        """
+        now = time.perf_counter()
+        if self.__last__ is None:
+            self.__last__ = now
+            self.__deadline__ = now + self.interval
+            return True
+
+        self.work_time = now - self.__last__
+        if self.interval and self.work_time > self.interval:
+            self.overruns += 1
+        return False
+
+    def __advance__(self):
+        """
+        Schedule the next frame once the deadline of the current one has
+        passed, applying the policy if the frame is late.
+
+        :return: The duration of the frame that just ended in seconds.
+        """
+        now = time.perf_counter()
+        deadline = self.__deadline__
+        if now - deadline > self.interval:
+            if self.policy == PACE_SKIP:
+                deadline = now
+            else:
+                deadline = max(deadline, now - self.interval * self.max_catchup)
+
+        self.__deadline__ = deadline + self.interval
+        self.frame_time = now - self.__last__
+        self.__last__ = now
+        self.frames += 1
+        return self.frame_time
+
+
+class LoopMixin:
+    """
+    The frame loops of a `Window` and the policies applied between frames.
+
+    :ivar Optional[FramePacer] __pacer__: The pacer of `next_frame`.
+    :ivar Optional[IdlePolicy] __idle__: The throttling policy of the window,
+        if enabled.
+    :ivar Optional[ResizeDebouncer] __resize__: The resize debouncer of the
+        window, if enabled.
+    """
+
+    def __init__(self, **options):
+        """
+        Initializes the frame loop state of a new window.
+
+        :param options: The options of the other parts of the window.
+        """
+        self.__pacer__ = None
+        self.__idle__ = None
+        self.__resize__ = None
+        super().__init__(**options)
+
+    def run(self, frame_callback, fps=60, policy=PACE_SKIP):
+        """
+        Run a paced frame loop on the window.
+
+        The callback is called once per frame as `frame_callback(window,
+        delta)`, where `delta` is the duration of the previous frame in
+        seconds. The window is updated after each frame it was drawn to, and
+        the loop is paced by a `FramePacer`, which also feeds the dynamic
+        resolution controller of the window if it has one. While a throttled
+        window is not `active`, the loop waits for the idle rate of the window
+        between frames. The callback is responsible for pumping events, and
+        the loop stops when it returns False.
+
+        :param Callable frame_callback: The function to call every frame.
+        :param Optional[float] fps: The target frame rate, or None for an
+            unlimited frame rate. Default is 60.
+        :param str policy: The policy applied to late frames, either
+            `PACE_SKIP` or `PACE_CATCHUP`. Default is `PACE_SKIP`.
+        :return: The `FramePacer` that paced the loop, with its frame time
+            statistics.
+        """
+        pacer = FramePacer(fps, policy)
+        delta = pacer.tick()
+        while frame_callback(self, delta) is not False:
+            if self.__dirty__:
+                self.update()
+            delta = pacer.tick()
+            wait = self.__step__(pacer)
+            if wait:
+                time.sleep(wait)
+                pacer.reset()
+        return pacer
+
+    async def events(self):
+        """
+        Iterate asynchronously over the events sent to the window.
+
+        The events are fetched by the `EventPump` of the running event loop,
+        which pumps SDL at a fixed cadence and yields to the other tasks of
+        the loop between pumps. Window events are applied to the state of the
+        window before they are yielded. Use it as `async for event in
+        window.events()`.
+
+        :return: An asynchronous iterator over the events of the window.
+        """
+        pump = get_pump()
+        queue = pump.subscribe(self)
+        try:
+            while True:
+                event = await queue.get()
+                self.apply_event(event)
+                yield event
+        finally:
+            pump.unsubscribe(queue)
+
+    async def next_frame(self, fps=60, policy=PACE_SKIP):
+        """
+        Update the window if it was drawn to, then wait for the next frame
+        without blocking the event loop.
+
+        The frames are paced by a `FramePacer` kept by the window, which is
+        created again whenever `fps` or `policy` changes.
+
+        :param Optional[float] fps: The target frame rate, or None to only
+            yield to the event loop. Default is 60.
+        :param str policy: The policy applied to late frames, either
+            `PACE_SKIP` or `PACE_CATCHUP`. Default is `PACE_SKIP`.
+        :return: The duration of the frame that just ended in seconds, or 0.0
+            on the first call.
+        """
+        if self.__dirty__:
+            self.update()
+
+        pacer = self.__pacer__
+        interval = 1 / fps if fps else 0.0
+        if pacer is None or pacer.interval != interval or pacer.policy != policy:
+            pacer = self.__pacer__ = FramePacer(fps, policy)
+        return await pacer.tick_async()
+
+    async def run_async(self, frame_callback, fps=60, policy=PACE_SKIP):
+        """
+        Run a paced frame loop on the window without blocking the event loop.
+
+        This is the asynchronous counterpart of `run`. The callback is called
+        once per frame as `frame_callback(window, delta)` and may be a plain
+        function or a coroutine function. The time left in each frame is spent
+        in `asyncio.sleep`, so the other tasks of the event loop keep running,
+        and the loop stops when the callback returns False.
+
+        :param Callable frame_callback: The function to call every frame.
+        :param Optional[float] fps: The target frame rate, or None to only
+            yield to the event loop between frames. Default is 60.
+        :param str policy: The policy applied to late frames, either
+            `PACE_SKIP` or `PACE_CATCHUP`. Default is `PACE_SKIP`.
+        :return: The `FramePacer` that paced the loop, with its frame time
+            statistics.
+        """
+        pacer = FramePacer(fps, policy)
+        delta = await pacer.tick_async()
+        while True:
+            result = frame_callback(self, delta)
+            if inspect.isawaitable(result):
+                result = await result
+            if result is False:
+                break
+            if self.__dirty__:
+                self.update()
+            delta = await pacer.tick_async()
+            wait = self.__step__(pacer)
+            if wait:
+                await asyncio.sleep(wait)
+                pacer.reset()
+        return pacer
+
+    def apply_event(self, event):
+        """
+        Update the window from an SDL window event.
+
+        The event is applied to the state of the window, to its idle policy if
+        it is throttled and to its resize debouncer if it has one.
+        `WindowManager` and `events` call this for every event sent to the
+        window; loops pumping events themselves should call it too.
+
+        When a debounced resize starts, a window rendering straight to the
+        screen gets a logical size equal to the size of its buffers. SDL then
+        scales each frame uniformly to fit the window and letterboxes it,
+        leaving black bars where the aspect ratios differ, until the resize is
+        settled.
+
+        :param pygame.event.Event event: The event to apply.
+        """
+        self.__state__.apply_event(event)
+        if self.__idle__ is not None:
+            self.__idle__.apply_event(event)
+        resize = self.__resize__
+        if resize is not None and resize.apply_event(event):
+            if self.__renderer__ is not None and self.__direct__():
+                self.__renderer__.logical_size = resize.size
+
+    def enable_throttling(self, unfocused_fps=IDLE_FPS, hidden_fps=HIDDEN_FPS):
+        """
+        Stop rendering the window at full rate while the user cannot see it.
+
+        Once enabled, `update` skips every frame of a hidden or minimized
+        window and renders an unfocused window at `unfocused_fps`. Exposing,
+        showing, restoring or focusing the window renders one catch-up frame
+        at once. Drawing code can check `active` to skip the frames that would
+        be dropped.
+
+        :param float unfocused_fps: The frame rate of the window while it does
+            not have the input focus. Default is `IDLE_FPS`.
+        :param float hidden_fps: The rate the frame loops of the window wake up
+            at while it is hidden or minimized. Default is `HIDDEN_FPS`.
+        :return: The `IdlePolicy` of the window.
+        :raises ValueError: If a frame rate is not positive.
+        """
+        self.__idle__ = IdlePolicy(unfocused_fps, hidden_fps)
+        return self.__idle__
+
+    def disable_throttling(self):
+        """
+        Render the window at full rate again, whatever its state.
+        """
+        self.__idle__ = None
+
+    def enable_resize_debounce(self, callback=None, delay=RESIZE_SETTLE_TIME):
+        """
+        Defer the reallocation of the buffers of the window until the user
+        stops resizing it.
+
+        While a resize is in progress, the streaming texture, the layers and
+        the reduced resolution target keep their size. A window rendering
+        straight to the screen letterboxes its frames into the window, see
+        `apply_event`, and a window rendered at a reduced resolution stretches
+        them over the window. Once the size has not changed for `delay` seconds, the
+        resize is settled by `settle`: the buffers are allocated again at the
+        new size on their next use and the callback is called.
+
+        :param Optional[Callable] callback: The function called as
+            `callback(window, size)` when a resize is settled. Default is
+            None.
+        :param float delay: The time the size of the window must hold before
+            the resize is settled, in seconds. Default is
+            `RESIZE_SETTLE_TIME`.
+        :return: The `ResizeDebouncer` of the window.
+        """
+        self.__resize__ = ResizeDebouncer(self.__state__.size, delay, callback)
+        return self.__resize__
+
+    def disable_resize_debounce(self):
+        """
+        Reallocate the buffers of the window as soon as it is resized again,
+        settling any resize in progress.
+        """
+        resize = self.__resize__
+        if resize is not None and resize.pending:
+            resize.delay = 0.0
+            self.settle()
+        self.__resize__ = None
+
+    def settle(self):
+        """
+        Settle the resize in progress if the size of the window has held long
+        enough.
+
+        The frame loops of the window call this every frame, and
+        `WindowManager.pump` calls it for every managed window. Loops pumping
+        events themselves should call it once per frame too.
+
+        :return: True if a resize was settled, False otherwise.
+        """
+        resize = self.__resize__
+        if resize is None or not resize.poll(self.__state__.size):
+            return False
+
+        if self.__renderer__ is not None and self.__direct__():
+            self.__renderer__.logical_size = (0, 0)
+        if self.__renderer__ is not None and self.__resolution__ < 1:
+            self.__retarget__()
+        if self.__layers__ is not None:
+            self.__layers__.invalidate()
+        if resize.callback is not None:
+            resize.callback(self, resize.size)
+        return True
+
+    def __throttle__(self):
+        """
+        Decide whether the current frame of a throttled window is rendered.
+        A skipped frame drops the submitted command lists and leaves the
+        window clean.
+
+        :return: True if the frame is rendered, False if it is skipped.
+        """
+        idle = self.__idle__
+        if idle is None:
+            return True
+        if not idle.active(self.__state__):
+            idle.skipped += 1
+            self.__commands__.clear()
+            self.__dirty__ = False
+            return False
+        idle.rendered()
+        return True
+
+    def __step__(self, pacer):
+        """
+        Finish a frame of a run loop once its pacer has ticked: settle a
+        resize in progress and feed the dynamic resolution controller.
+
+        :param FramePacer pacer: The pacer of the loop.
+        :return: The time to wait before the next frame while the window is
+            throttled and not `active`, in seconds, or 0.0.
+        """
+        if self.__resize__ is not None:
+            self.settle()
+        if self.__scaler__ is not None:
+            self.adapt_resolution(pacer.work_time)
+        if self.__idle__ is not None:
+            return self.__idle__.wait_time(self.__state__)
+        return 0.0
+
+    # Getters
+    @property
+    def active(self):
+        """
+        Get whether the current frame of the window will be rendered.
+
+        :return: False if the window is throttled and its next update would be
+            skipped, True otherwise.
+        """
+        if self.__idle__ is None:
+            return True
+        return self.__idle__.active(self.__state__)
+
+    @property
+    def buffer_size(self):
+        """
+        Get the size the buffers of the window are allocated at.
+
+        :return: The size of the window, or the size of the last settled
+            resize while a debounced resize is in progress.
+        """
+        if self.__resize__ is None:
+            return self.__state__.size
+        return self.__resize__.size
+
+    @property
+    def resizing(self):
+        """
+        Get whether a debounced resize of the window is in progress.
+
+        :return: True if the window was resized and the resize is not settled
+            yet, False otherwise.
+        """
+        return self.__resize__ is not None and self.__resize__.pending
+
+    @property
+    def debouncer(self):
+        """
+        Get the resize debouncer of the window.
+
+        :return: The `ResizeDebouncer` of the window, or None if resize
+            debouncing is disabled.
+        """
+        return self.__resize__
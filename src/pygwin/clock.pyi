@@ -0,0 +1,81 @@
+from typing import Any, AsyncIterator, Callable, Optional, Tuple
+
+from pygame.event import Event
+
+from pygwin.idle import IdlePolicy
+from pygwin.resize import ResizeDebouncer
+from pygwin.window import Window
+
+PACE_SKIP: str
+PACE_CATCHUP: str
+SPIN_TIME: float
+
+class FramePacer:
+    interval: float
+    policy: str
+    spin: float
+    max_catchup: int
+    frames: int
+    overruns: int
+    frame_time: float
+    work_time: float
+    __deadline__: Optional[float]
+    __last__: Optional[float]
+
+    def __init__(
+        self,
+        fps: Optional[float] = 60,
+        policy: str = ...,
+        spin: float = ...,
+        max_catchup: int = 5,
+    ) -> None: ...
+    @property
+    def fps(self) -> float: ...
+    def reset(self) -> None: ...
+    def tick(self) -> float: ...
+    async def tick_async(self) -> float: ...
+
+class LoopMixin:
+    __pacer__: Optional[FramePacer]
+    __idle__: Optional[IdlePolicy]
+    __resize__: Optional[ResizeDebouncer]
+
+    def __init__(self, **options: Any) -> None: ...
+    @property
+    def active(self) -> bool: ...
+    @property
+    def buffer_size(self) -> Tuple[int, int]: ...
+    @property
+    def resizing(self) -> bool: ...
+    @property
+    def debouncer(self) -> Optional[ResizeDebouncer]: ...
+    def run(
+        self,
+        frame_callback: Callable[[Window, float], object],
+        fps: Optional[float] = 60,
+        policy: str = ...,
+    ) -> FramePacer: ...
+    def events(self) -> AsyncIterator[Event]: ...
+    async def next_frame(
+        self, fps: Optional[float] = 60, policy: str = ...
+    ) -> float: ...
+    async def run_async(
+        self,
+        frame_callback: Callable[[Window, float], object],
+        fps: Optional[float] = 60,
+        policy: str = ...,
+    ) -> FramePacer: ...
+    def apply_event(self, event: Event) -> None: ...
+    def enable_throttling(
+        self, unfocused_fps: float = ..., hidden_fps: float = ...
+    ) -> IdlePolicy: ...
+    def disable_throttling(self) -> None: ...
+    def enable_resize_debounce(
+        self,
+        callback: Optional[Callable[[Window, Tuple[int, int]], object]] = None,
+        delay: float = ...,
+    ) -> ResizeDebouncer: ...
+    def disable_resize_debounce(self) -> None: ...
+    def settle(self) -> bool: ...
+    def __throttle__(self) -> bool: ...
+    def __step__(self, pacer: FramePacer) -> float: ...
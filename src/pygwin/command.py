@@ -0,0 +1,185 @@
+"""
+This module defines a `CommandList` class that records draw calls for a
+`Window` without touching SDL. SDL only allows window and renderer calls from
+the main thread, so scenes can be prepared on worker threads or processes as
+command lists, handed to `Window.submit`, and replayed on the main thread in
+one tight loop just before the window is presented.
+"""
+
+from pygwin.draw import to_color, to_sequence
+
+
+class CommandList:
+    """
+    A recorded list of draw calls.
+
+    Recording a command only converts its arguments to plain Python objects,
+    so it can be done from any thread: colors become `pygame.Color` objects,
+    NumPy batches become lists, and raw frames are copied to `bytes`. A
+    command list that holds no surfaces can also be pickled and sent to
+    another process. Each command is stored as a tuple holding the name of
+    the `Window` method that replays it followed by its arguments.
+
+    A command list belongs to the thread that records it until it is
+    submitted to a window. It must not be modified after that.
+
+    :ivar List[Tuple] __commands__: The recorded commands, in order.
+    """
+
+    def __init__(self):
+        """
+        Initializes a new, empty command list.
+        """
+        self.__commands__ = []
+
+    def __len__(self):
+        """
+        Get the number of recorded commands.
+
+        :return: The number of commands waiting to be replayed.
+        """
+        return len(self.__commands__)
+
+    def __iter__(self):
+        """
+        Iterate over the recorded commands.
+
+        :return: An iterator over the command tuples, in recording order.
+        """
+        return iter(self.__commands__)
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<CommandList(count)>`.
+        """
+        return f"<CommandList({len(self.__commands__)})>"
+
+    def fill(self, color=(0, 0, 0)):
+        """
+        Record a call to `Window.fill`.
+
+        :param Union[Tuple[int, int, int], ColorValue] color: The color to
+            fill the window with. Default is (0, 0, 0).
+        """
+        self.__commands__.append(("fill", to_color(color)))
+
+    def fill_rects(self, rects, color=(255, 255, 255)):
+        """
+        Record a call to `Window.fill_rects`.
+
+        :param Union[Sequence[RectValue], numpy.ndarray] rects: The rectangles
+            to fill.
+        :param Union[Tuple[int, int, int], ColorValue] color: The color of the
+            rectangles. Default is (255, 255, 255).
+        """
+        self.__commands__.append(
+            ("fill_rects", list(to_sequence(rects)), to_color(color))
+        )
+
+    def draw_rects(self, rects, color=(255, 255, 255)):
+        """
+        Record a call to `Window.draw_rects`.
+
+        :param Union[Sequence[RectValue], numpy.ndarray] rects: The rectangles
+            to draw the outlines of.
+        :param Union[Tuple[int, int, int], ColorValue] color: The color of the
+            outlines. Default is (255, 255, 255).
+        """
+        self.__commands__.append(
+            ("draw_rects", list(to_sequence(rects)), to_color(color))
+        )
+
+    def draw_lines(self, points, color=(255, 255, 255)):
+        """
+        Record a call to `Window.draw_lines`.
+
+        :param Union[Sequence[Tuple[int, int]], numpy.ndarray] points: The
+            points to join.
+        :param Union[Tuple[int, int, int], ColorValue] color: The color of the
+            lines. Default is (255, 255, 255).
+        """
+        self.__commands__.append(
+            ("draw_lines", list(to_sequence(points)), to_color(color))
+        )
+
+    def draw_points(self, points, color=(255, 255, 255)):
+        """
+        Record a call to `Window.draw_points`.
+
+        :param Union[Sequence[Tuple[int, int]], numpy.ndarray] points: The
+            points to draw.
+        :param Union[Tuple[int, int, int], ColorValue] color: The color of the
+            points. Default is (255, 255, 255).
+        """
+        self.__commands__.append(
+            ("draw_points", list(to_sequence(points)), to_color(color))
+        )
+
+    def blit(self, surface, dest=(0, 0), area=None, version=0):
+        """
+        Record a call to `Window.blit`.
+
+        The surface is referenced, not copied, and is uploaded when the
+        command is replayed. The caller must not draw into it until then, or
+        must change `version` every time it does.
+
+        :param pygame.Surface surface: The surface to draw.
+        :param Union[Tuple[int, int], RectValue] dest: The position or
+            rectangle to draw the surface at. Default is (0, 0).
+        :param Optional[RectValue] area: The portion of the surface to draw.
+            If not specified, the whole surface is drawn.
+        :param Hashable version: The version of the content of the surface.
+            Default is 0.
+        """
+        self.__commands__.append(("blit", surface, tuple(dest), area, version))
+
+    def blit_array(self, array, format="RGB", dest=None, copy=True):
+        """
+        Record a call to `Window.blit_array`.
+
+        :param Buffer array: The frame to draw, as a NumPy array or any other
+            buffer object of the size of the window.
+        :param str format: The pixel format of the frame. Default is "RGB".
+        :param Optional[RectValue] dest: The rectangle to stretch the frame
+            into. If not specified, the frame covers the whole window.
+        :param bool copy: Whether the frame is copied when it is recorded. If
+            False, the frame is referenced and must not be modified until the
+            command is replayed. Default is True.
+        """
+        # pylint: disable=W0622
+        if copy:
+            array = memoryview(array).tobytes()
+        self.__commands__.append(("blit_array", array, format, dest))
+
+    def extend(self, other):
+        """
+        Append every command of another command list to this one.
+
+        :param CommandList other: The command list to append.
+        """
+        self.__commands__.extend(other)
+
+    def clear(self):
+        """
+        Discard every recorded command.
+        """
+        self.__commands__.clear()
+
+    def replay(self, window):
+        """
+        Replay every recorded command on a window. This method must be called
+        from the main thread.
+
+        :param Window window: The window to draw onto.
+        :return: The number of commands that were replayed.
+        """
+        methods = {}
+        for command in self.__commands__:
+            name = command[0]
+            method = methods.get(name)
+            if method is None:
+                method = methods[name] = getattr(window, name)
+            method(*command[1:])
+        return len(self.__commands__)
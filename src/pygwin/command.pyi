@@ -0,0 +1,43 @@
+from typing import Any, Hashable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from pygame import Surface
+
+from pygwin.draw import ColorValue, PointValue, RectValue
+from pygwin.window import Window
+
+class CommandList:
+    __commands__: List[Tuple[Any, ...]]
+
+    def __init__(self) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]: ...
+    def fill(self, color: ColorValue = (0, 0, 0)) -> None: ...
+    def fill_rects(
+        self, rects: Sequence[RectValue], color: ColorValue = (255, 255, 255)
+    ) -> None: ...
+    def draw_rects(
+        self, rects: Sequence[RectValue], color: ColorValue = (255, 255, 255)
+    ) -> None: ...
+    def draw_lines(
+        self, points: Sequence[PointValue], color: ColorValue = (255, 255, 255)
+    ) -> None: ...
+    def draw_points(
+        self, points: Sequence[PointValue], color: ColorValue = (255, 255, 255)
+    ) -> None: ...
+    def blit(
+        self,
+        surface: Surface,
+        dest: Union[PointValue, RectValue] = (0, 0),
+        area: Optional[RectValue] = None,
+        version: Hashable = 0,
+    ) -> None: ...
+    def blit_array(
+        self,
+        array: Any,
+        format: str = "RGB",
+        dest: Optional[RectValue] = None,
+        copy: bool = True,
+    ) -> None: ...
+    def extend(self, other: CommandList) -> None: ...
+    def clear(self) -> None: ...
+    def replay(self, window: Window) -> int: ...
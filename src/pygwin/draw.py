@@ -0,0 +1,307 @@
+"""
+This module defines the drawing methods of a `Window` beyond `Window.fill`:
+batched rectangles, lines and points drawn with a single color, surfaces
+drawn through the texture cache of the window, raw frames streamed into a
+persistent texture, and command lists recorded on other threads. It also
+defines the helpers converting colors and batches of coordinates, which
+`CommandList` uses to record draw calls without touching SDL.
+"""
+
+from collections import deque
+from functools import lru_cache
+
+import pygame
+
+from pygwin.texture import TEXTURE_BUDGET, StreamingTexture, TextureCache
+
+# Define the number of distinct colors kept by the color cache
+COLOR_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def cached_color(color):
+    """
+    Convert a hashable color value to a `pygame.Color`, caching the result.
+
+    :param Union[Tuple[int, ...], str, int] color: The color value to convert.
+    :return: The corresponding `pygame.Color` object. The object is shared
+        between calls and must not be modified.
+    """
+    return pygame.Color(color)
+
+
+def to_color(color):
+    """
+    Convert any color value accepted by pygame to a `pygame.Color`.
+
+    Hashable values such as tuples and color names go through a small bounded
+    cache, so drawing repeatedly with the same color does not build a new
+    `pygame.Color` every time.
+
+    :param Union[pygame.Color, Tuple[int, ...], str, int] color: The color
+        value to convert.
+    :return: The corresponding `pygame.Color` object.
+    """
+    if isinstance(color, pygame.Color):
+        return color
+    try:
+        return cached_color(color)
+    except TypeError:
+        return pygame.Color(color)
+
+
+def to_sequence(items):
+    """
+    Convert a batch of rectangles or points to a sequence of Python objects.
+
+    NumPy arrays and other objects with a `tolist` method are converted in a
+    single call instead of being iterated element by element.
+
+    :param Union[Sequence, numpy.ndarray] items: The batch to convert.
+    :return: The batch as a sequence.
+    """
+    if hasattr(items, "tolist"):
+        return items.tolist()
+    return items
+
+
+class DrawMixin:
+    """
+    The drawing methods of a `Window`.
+
+    Every drawing method marks the window as drawn to, so that `update` and
+    `WindowManager.present_all` know it has something new to present.
+
+    :ivar int __budget__: The number of bytes the textures cached by `blit`
+        may use.
+    :ivar Deque[CommandList] __commands__: The command lists submitted to the
+        window and not replayed yet.
+    """
+
+    def __init__(self, *, texture_budget=TEXTURE_BUDGET, **options):
+        """
+        Initializes the drawing state of a new window.
+
+        :param int texture_budget: The number of bytes the textures cached by
+            `blit` may use. Default is `TEXTURE_BUDGET`.
+        :param options: The options of the other parts of the window.
+        """
+        self.__budget__ = texture_budget
+        self.__commands__ = deque()
+        super().__init__(**options)
+
+    def blit(self, surface, dest=(0, 0), area=None, version=0):
+        """
+        Draw a surface onto the window.
+
+        The surface is uploaded to a texture the first time it is drawn, and
+        the texture is kept in the texture cache of the window. It is only
+        uploaded again when `version` changes, so static surfaces cost a
+        single upload no matter how many frames they are drawn on.
+
+        :param pygame.Surface surface: The surface to draw.
+        :param Union[Tuple[int, int], RectValue] dest: The position of the
+            top-left corner of the surface on the window, or the rectangle to
+            stretch it into. Default is (0, 0).
+        :param Optional[RectValue] area: The portion of the surface to draw.
+            If not specified, the whole surface is drawn.
+        :param Hashable version: The version of the content of the surface.
+            Change it whenever the surface is drawn into. Default is 0.
+        """
+        texture = self.textures.get(surface, version)
+        if len(dest) == 2:
+            if area is None:
+                dest = (dest[0], dest[1], texture.width, texture.height)
+            else:
+                dest = (dest[0], dest[1], area[2], area[3])
+        texture.draw(srcrect=area, dstrect=dest)
+        self.__dirty__ = True
+
+    def stream(self, format="RGB"):
+        """
+        Get the streaming texture of the window, creating it if needed.
+
+        The streaming texture always has the size of the window. It is created
+        again only when the size of the window or the requested format
+        changes, so frames can be streamed without allocating memory.
+
+        :param str format: The pixel format of the frames, as accepted by
+            `pygame.image.frombuffer`. "BGRA" is the native format of textures
+            and needs no conversion. Default is "RGB".
+        :return: The `StreamingTexture` of the window.
+        """
+        # pylint: disable=W0622
+        stream = self.__stream__
+        size = self.buffer_size
+        if stream is None or stream.size != size or stream.format != format:
+            stream = StreamingTexture(self.renderer, size, format)
+            self.__stream__ = stream
+        return stream
+
+    def framebuffer(self, format="RGB"):
+        """
+        Get a buffer to write the next frame of the window into.
+
+        The buffer is persistent and shaped as (height, width, channels).
+        `numpy.asarray` turns it into an array sharing its memory. Once the
+        frame is written, call `blit_array` without an array to display it.
+
+        :param str format: The pixel format of the frame. Default is "RGB".
+        :return: A writable `memoryview` of the frame buffer.
+        """
+        # pylint: disable=W0622
+        return self.stream(format).buffer()
+
+    def blit_array(self, array=None, format="RGB", dest=None):
+        """
+        Draw a raw frame onto the window.
+
+        The frame is copied into the persistent streaming texture of the
+        window, without building an intermediate `pygame.Surface`.
+
+        :param Optional[Buffer] array: The frame to draw, as a C-contiguous
+            NumPy array or any other buffer object of the size of the window.
+            If not specified, the content of `framebuffer` is drawn.
+        :param str format: The pixel format of the frame. Default is "RGB".
+        :param Optional[RectValue] dest: The rectangle to stretch the frame
+            into. If not specified, the frame covers the whole window.
+        :raises ValueError: If the frame does not have the size of the window.
+        """
+        # pylint: disable=W0622
+        stream = self.stream(format)
+        stream.upload(array)
+        stream.texture.draw(dstrect=dest)
+        self.__dirty__ = True
+
+    def fill_rects(self, rects, color=(255, 255, 255)):
+        """
+        Fill a batch of rectangles with a single color.
+
+        The draw color is set once for the whole batch, and the rectangles are
+        sent to the renderer in a single tight loop.
+
+        :param Union[Sequence[RectValue], numpy.ndarray] rects: The rectangles
+            to fill, as `pygame.Rect` objects, `(x, y, width, height)`
+            sequences, or a NumPy array of shape (n, 4).
+        :param Union[Tuple[int, int, int], ColorValue] color: The color of the
+            rectangles. Default is (255, 255, 255).
+        """
+        renderer = self.renderer
+        renderer.draw_color = to_color(color)
+        fill_rect = renderer.fill_rect
+        for rect in to_sequence(rects):
+            fill_rect(rect)
+        self.__dirty__ = True
+
+    def draw_rects(self, rects, color=(255, 255, 255)):
+        """
+        Draw the outlines of a batch of rectangles with a single color.
+
+        :param Union[Sequence[RectValue], numpy.ndarray] rects: The rectangles
+            to draw, as `pygame.Rect` objects, `(x, y, width, height)`
+            sequences, or a NumPy array of shape (n, 4).
+        :param Union[Tuple[int, int, int], ColorValue] color: The color of the
+            outlines. Default is (255, 255, 255).
+        """
+        renderer = self.renderer
+        renderer.draw_color = to_color(color)
+        draw_rect = renderer.draw_rect
+        for rect in to_sequence(rects):
+            draw_rect(rect)
+        self.__dirty__ = True
+
+    def draw_lines(self, points, color=(255, 255, 255)):
+        """
+        Draw a series of connected lines with a single color.
+
+        Each point is joined to the next one, so n points draw n - 1 lines.
+
+        :param Union[Sequence[Tuple[int, int]], numpy.ndarray] points: The
+            points to join, as `(x, y)` sequences or a NumPy array of shape
+            (n, 2).
+        :param Union[Tuple[int, int, int], ColorValue] color: The color of the
+            lines. Default is (255, 255, 255).
+        """
+        renderer = self.renderer
+        renderer.draw_color = to_color(color)
+        draw_line = renderer.draw_line
+        points = to_sequence(points)
+        for start, end in zip(points, points[1:]):
+            draw_line(start, end)
+        self.__dirty__ = True
+
+    def draw_points(self, points, color=(255, 255, 255)):
+        """
+        Draw a batch of single pixels with a single color.
+
+        :param Union[Sequence[Tuple[int, int]], numpy.ndarray] points: The
+            points to draw, as `(x, y)` sequences or a NumPy array of shape
+            (n, 2).
+        :param Union[Tuple[int, int, int], ColorValue] color: The color of the
+            points. Default is (255, 255, 255).
+        """
+        renderer = self.renderer
+        renderer.draw_color = to_color(color)
+        draw_point = renderer.draw_point
+        for point in to_sequence(points):
+            draw_point(point)
+        self.__dirty__ = True
+
+    def submit(self, commands):
+        """
+        Queue a command list to be replayed on the window.
+
+        This method may be called from any thread. The commands are replayed
+        on the main thread by the next call to `replay` or `update`, in the
+        order they were submitted. The command list must not be modified once
+        it has been submitted.
+
+        :param CommandList commands: The commands to replay.
+        """
+        self.__commands__.append(commands)
+        self.__dirty__ = True
+
+    def replay(self):
+        """
+        Replay every submitted command list. This method must be called from
+        the main thread, and is called by `update` before presenting.
+
+        :return: The number of commands that were replayed.
+        """
+        count = 0
+        pending = self.__commands__
+        while pending:
+            count += pending.popleft().replay(self)
+        return count
+
+    def __detach__(self):
+        """
+        Drop the command lists submitted to the window and the textures cached
+        by `blit`.
+        """
+        super().__detach__()
+        self.__commands__.clear()
+        if self.__textures__ is not None:
+            self.__textures__.clear()
+
+    # Getters
+    @property
+    def textures(self):
+        """
+        Get the texture cache of the window, creating it on first use.
+
+        :return: The `TextureCache` holding the textures uploaded by `blit`.
+        """
+        if self.__textures__ is None:
+            self.__textures__ = TextureCache(self.renderer, self.__budget__)
+        return self.__textures__
+
+    @property
+    def dirty(self):
+        """
+        Get whether the window has been drawn to since it was last updated.
+
+        :return: True if a draw call such as `fill` has been made since the
+            last call to `update`, False otherwise.
+        """
+        return self.__dirty__
@@ -0,0 +1,56 @@
+from typing import Any, Deque, Hashable, Optional, Sequence, Tuple, Union
+
+from pygame import Color, Rect, Surface
+
+from pygwin.command import CommandList
+from pygwin.texture import StreamingTexture, TextureCache
+
+COLOR_CACHE_SIZE: int
+
+ColorValue = Union[Color, Tuple[int, int, int], Tuple[int, int, int, int], str, int]
+RectValue = Union[Rect, Sequence[int]]
+PointValue = Sequence[int]
+
+def cached_color(color: Hashable) -> Color: ...
+def to_color(color: ColorValue) -> Color: ...
+def to_sequence(items: Any) -> Sequence[Any]: ...
+
+class DrawMixin:
+    __budget__: int
+    __commands__: Deque[CommandList]
+
+    def __init__(self, *, texture_budget: int = ..., **options: Any) -> None: ...
+    @property
+    def textures(self) -> TextureCache: ...
+    @property
+    def dirty(self) -> bool: ...
+    def blit(
+        self,
+        surface: Surface,
+        dest: Union[PointValue, RectValue] = (0, 0),
+        area: Optional[RectValue] = None,
+        version: Hashable = 0,
+    ) -> None: ...
+    def stream(self, format: str = "RGB") -> StreamingTexture: ...
+    def framebuffer(self, format: str = "RGB") -> memoryview: ...
+    def blit_array(
+        self,
+        array: Optional[Any] = None,
+        format: str = "RGB",
+        dest: Optional[RectValue] = None,
+    ) -> None: ...
+    def fill_rects(
+        self, rects: Sequence[RectValue], color: ColorValue = (255, 255, 255)
+    ) -> None: ...
+    def draw_rects(
+        self, rects: Sequence[RectValue], color: ColorValue = (255, 255, 255)
+    ) -> None: ...
+    def draw_lines(
+        self, points: Sequence[PointValue], color: ColorValue = (255, 255, 255)
+    ) -> None: ...
+    def draw_points(
+        self, points: Sequence[PointValue], color: ColorValue = (255, 255, 255)
+    ) -> None: ...
+    def submit(self, commands: CommandList) -> None: ...
+    def replay(self) -> int: ...
+    def __detach__(self) -> None: ...
@@ -0,0 +1,125 @@
+"""
+This module defines an `IdlePolicy` class that throttles a `Window` the user
+is not looking at. Hidden and minimized windows skip their frames entirely,
+unfocused windows render at a lower frame rate, and a window that is exposed,
+shown, restored or focused again renders one catch-up frame right away.
+"""
+
+import time
+
+import pygame
+
+# Define the default frame rate of unfocused windows
+IDLE_FPS = 10
+
+# Define the default rate the frame loops of hidden windows wake up at
+HIDDEN_FPS = 4
+
+# Define the events that trigger a catch-up frame
+REDRAW_EVENTS = frozenset(
+    (
+        pygame.WINDOWEXPOSED,
+        pygame.WINDOWSHOWN,
+        pygame.WINDOWRESTORED,
+        pygame.WINDOWMAXIMIZED,
+        pygame.WINDOWFOCUSGAINED,
+    )
+)
+
+
+class IdlePolicy:
+    """
+    The throttling policy of a window.
+
+    The policy tracks the focus of the window from its events, and decides
+    from the state of the window whether the current frame should be rendered.
+
+    :ivar float unfocused_interval: The time between two frames of an
+        unfocused window, in seconds.
+    :ivar float hidden_interval: The time between two iterations of the frame
+        loop of a hidden or minimized window, in seconds.
+    :ivar bool focused: Whether the window has the input focus.
+    :ivar int skipped: The number of updates that were skipped.
+    :ivar bool __redraw__: Whether a catch-up frame is pending.
+    :ivar float __last__: The time the last frame was rendered, from
+        `time.perf_counter`.
+    """
+
+    def __init__(self, unfocused_fps=IDLE_FPS, hidden_fps=HIDDEN_FPS):
+        """
+        Initializes a new idle policy.
+
+        :param float unfocused_fps: The frame rate of the window while it does
+            not have the input focus. Default is `IDLE_FPS`.
+        :param float hidden_fps: The rate the frame loops of the window wake up
+            at while it is hidden or minimized, to process its events. Default
+            is `HIDDEN_FPS`.
+        :raises ValueError: If a frame rate is not positive.
+        """
+        if unfocused_fps <= 0 or hidden_fps <= 0:
+            raise ValueError("idle frame rates must be positive")
+
+        self.unfocused_interval = 1 / unfocused_fps
+        self.hidden_interval = 1 / hidden_fps
+        self.focused = True
+        self.skipped = 0
+        self.__redraw__ = False
+        self.__last__ = 0.0
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<IdlePolicy(focused skipped)>`.
+        """
+        return f"<IdlePolicy({self.focused} {self.skipped})>"
+
+    def apply_event(self, event):
+        """
+        Update the policy from an SDL window event. Other events are ignored.
+
+        :param pygame.event.Event event: The event to apply.
+        """
+        if event.type == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        if event.type in REDRAW_EVENTS:
+            self.__redraw__ = True
+
+    def active(self, state):
+        """
+        Decide whether the current frame of the window should be rendered.
+
+        :param WindowState state: The state of the window.
+        :return: False if the window is hidden or minimized, or if it is
+            unfocused and its last frame is too recent. True otherwise.
+        """
+        if not state.visible or state.minimized:
+            return False
+        if self.focused or self.__redraw__:
+            return True
+        return time.perf_counter() - self.__last__ >= self.unfocused_interval
+
+    def rendered(self):
+        """
+        Record that a frame of the window was rendered, which clears any
+        pending catch-up frame.
+        """
+        self.__redraw__ = False
+        self.__last__ = time.perf_counter()
+
+    def wait_time(self, state):
+        """
+        Get the time a frame loop should wait before its next iteration.
+
+        :param WindowState state: The state of the window.
+        :return: The time in seconds until the window may render again, or 0.0
+            if it may render now.
+        """
+        if not state.visible or state.minimized:
+            return self.hidden_interval
+        if self.focused or self.__redraw__:
+            return 0.0
+        elapsed = time.perf_counter() - self.__last__
+        return max(self.unfocused_interval - elapsed, 0.0)
@@ -0,0 +1,23 @@
+from typing import FrozenSet
+
+from pygame.event import Event
+
+from pygwin.window import WindowState
+
+IDLE_FPS: float
+HIDDEN_FPS: float
+REDRAW_EVENTS: FrozenSet[int]
+
+class IdlePolicy:
+    unfocused_interval: float
+    hidden_interval: float
+    focused: bool
+    skipped: int
+    __redraw__: bool
+    __last__: float
+
+    def __init__(self, unfocused_fps: float = ..., hidden_fps: float = ...) -> None: ...
+    def apply_event(self, event: Event) -> None: ...
+    def active(self, state: WindowState) -> bool: ...
+    def rendered(self) -> None: ...
+    def wait_time(self, state: WindowState) -> float: ...
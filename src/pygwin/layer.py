@@ -0,0 +1,389 @@
+"""
+This module defines the `Layer` and `LayerStack` classes, which cache static
+parts of the content of a `Window` in render target textures. Each layer is
+drawn by a callback into a texture of the size of the window, and the texture
+is only drawn again when the layer is invalidated. Every other frame, the
+layer costs a single texture copy. The `LayerMixin` class gives `Window` its
+layer methods.
+"""
+
+import pygame
+from pygame import _sdl2 as sdl
+
+
+class Layer:
+    """
+    A named layer of a window, cached in a render target texture.
+
+    The callback of the layer is called as `draw(window)` while the renderer
+    of the window targets the texture of the layer, so it draws with the
+    regular drawing methods of the window. The texture is cleared to
+    transparent before each redraw and is blended over the layers below it.
+
+    :ivar str name: The name of the layer.
+    :ivar Callable draw: The function drawing the content of the layer.
+    :ivar bool visible: Whether the layer is composited.
+    :ivar int renders: The number of times the layer has been drawn.
+    :ivar int __z__: The depth of the layer. Layers are composited from the
+        lowest to the highest depth.
+    :ivar Optional[LayerStack] __stack__: The stack the layer belongs to,
+        which holds the texture caching the layer.
+    :ivar bool __dirty__: Whether the layer must be drawn again.
+    """
+
+    def __init__(self, name, draw, z=0, visible=True):
+        """
+        Initializes a new layer.
+
+        :param str name: The name of the layer.
+        :param Callable draw: The function drawing the content of the layer,
+            called as `draw(window)`.
+        :param int z: The depth of the layer. Layers with a negative depth are
+            composited under the frame by `Window.fill`, and the others over
+            it by `Window.update`. Default is 0.
+        :param bool visible: Whether the layer is composited. Default is True.
+        """
+        self.name = name
+        self.draw = draw
+        self.visible = visible
+        self.renders = 0
+        self.__z__ = z
+        self.__stack__ = None
+        self.__dirty__ = True
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<Layer(name z)>`.
+        """
+        return f"<Layer({self.name} {self.__z__})>"
+
+    @property
+    def z(self):
+        """
+        Get the depth of the layer.
+
+        :return: The depth of the layer as an integer.
+        """
+        return self.__z__
+
+    @z.setter
+    def z(self, value):
+        """
+        Set the depth of the layer, moving it within its stack.
+
+        :param int value: The new depth of the layer.
+        """
+        self.__z__ = value
+        if self.__stack__ is not None:
+            self.__stack__.__sort__()
+
+    @property
+    def dirty(self):
+        """
+        Get whether the layer must be drawn again.
+
+        :return: True if the layer will be drawn again the next time it is
+            composited, False otherwise.
+        """
+        return self.__dirty__
+
+    @property
+    def texture(self):
+        """
+        Get the texture caching the layer.
+
+        :return: The `sdl.Texture` of the layer, or None if it has not been
+            drawn yet or does not belong to a stack.
+        """
+        if self.__stack__ is None:
+            return None
+        return self.__stack__.__textures__.get(self.name)
+
+    def invalidate(self):
+        """
+        Mark the layer to be drawn again the next time it is composited.
+        """
+        self.__dirty__ = True
+
+    def render(self, window):
+        """
+        Draw the layer into its texture if it was invalidated, creating the
+        texture if needed. The texture has the size of the buffers of the
+        window, so it is not created again while a resize is in progress.
+
+        :param Window window: The window the layer belongs to.
+        :return: True if the layer was drawn, False if its texture was reused.
+        :raises RuntimeError: If the layer does not belong to a stack.
+        """
+        if self.__stack__ is None:
+            raise RuntimeError(f"layer '{self.name}' does not belong to a stack")
+        textures = self.__stack__.__textures__
+        texture = textures.get(self.name)
+        size = window.buffer_size
+        if texture is None or (texture.width, texture.height) != size:
+            texture = sdl.Texture(window.renderer, size, target=True)
+            texture.blend_mode = pygame.BLENDMODE_BLEND
+            textures[self.name] = texture
+            self.__dirty__ = True
+        if not self.__dirty__:
+            return False
+
+        renderer = window.renderer
+        target = renderer.target
+        scale = renderer.scale
+        renderer.target = texture
+        try:
+            renderer.draw_color = (0, 0, 0, 0)
+            renderer.clear()
+            self.draw(window)
+        finally:
+            renderer.target = target
+            renderer.scale = scale
+        self.__dirty__ = False
+        self.renders += 1
+        return True
+
+    def release(self):
+        """
+        Release the texture of the layer. It is created and drawn again the
+        next time the layer is composited.
+        """
+        if self.__stack__ is not None:
+            self.__stack__.__textures__.pop(self.name, None)
+        self.__dirty__ = True
+
+
+class LayerStack:
+    """
+    The layers of a window, ordered by depth.
+
+    The textures caching the layers are kept in a dictionary given by the
+    owner of the stack, so that a window can release them along with its
+    renderer without going through its layers.
+
+    :ivar Dict[str, Layer] __layers__: The layers, indexed by name.
+    :ivar List[Layer] __order__: The layers from the lowest to the highest
+        depth. Layers with the same depth keep the order they were added in.
+    :ivar bool __active__: Whether a layer is being drawn, during which
+        compositing is disabled.
+    :ivar Dict[str, sdl.Texture] __textures__: The textures caching the
+        layers, indexed by layer name.
+    """
+
+    def __init__(self, textures=None):
+        """
+        Initializes a new, empty layer stack.
+
+        :param Optional[Dict[str, sdl.Texture]] textures: The dictionary to
+            keep the textures caching the layers in. If not specified, the
+            stack keeps them in a dictionary of its own.
+        """
+        self.__layers__ = {}
+        self.__order__ = []
+        self.__active__ = False
+        self.__textures__ = {} if textures is None else textures
+
+    def __len__(self):
+        """
+        Get the number of layers.
+
+        :return: The number of layers in the stack.
+        """
+        return len(self.__layers__)
+
+    def __iter__(self):
+        """
+        Iterate over the layers from the lowest to the highest depth.
+
+        :return: An iterator over the layers.
+        """
+        return iter(list(self.__order__))
+
+    def __contains__(self, name):
+        """
+        Check whether the stack has a layer.
+
+        :param str name: The name of the layer.
+        :return: True if the stack has a layer with this name, False otherwise.
+        """
+        return name in self.__layers__
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<LayerStack(names)>`.
+        """
+        return f"<LayerStack({' '.join(layer.name for layer in self.__order__)})>"
+
+    def add(self, layer):
+        """
+        Add a layer to the stack.
+
+        :param Layer layer: The layer to add.
+        :raises ValueError: If the stack already has a layer with this name.
+        """
+        if layer.name in self.__layers__:
+            raise ValueError(f"layer '{layer.name}' already exists")
+        self.__layers__[layer.name] = layer
+        self.__order__.append(layer)
+        layer.__stack__ = self
+        self.__sort__()
+
+    def remove(self, name):
+        """
+        Remove a layer from the stack and release its texture.
+
+        :param str name: The name of the layer to remove.
+        :return: The removed `Layer`.
+        :raises KeyError: If the stack has no layer with this name.
+        """
+        layer = self.__layers__.pop(name)
+        self.__order__.remove(layer)
+        layer.release()
+        layer.__stack__ = None
+        return layer
+
+    def get(self, name):
+        """
+        Get a layer by name.
+
+        :param str name: The name of the layer.
+        :return: The `Layer` with this name, or None if there is none.
+        """
+        return self.__layers__.get(name)
+
+    def invalidate(self, name=None):
+        """
+        Mark one or every layer to be drawn again.
+
+        :param Optional[str] name: The name of the layer to invalidate. If
+            not specified, every layer is invalidated.
+        :raises KeyError: If the stack has no layer with this name.
+        """
+        if name is None:
+            for layer in self.__order__:
+                layer.invalidate()
+        else:
+            self.__layers__[name].invalidate()
+
+    def release(self):
+        """
+        Release the textures of every layer.
+        """
+        for layer in self.__order__:
+            layer.release()
+
+    def composite(self, window, below):
+        """
+        Draw the visible layers on one side of the frame onto the window,
+        redrawing the ones that were invalidated.
+
+        :param Window window: The window the layers belong to.
+        :param bool below: Whether the layers with a negative depth are
+            composited, instead of the others.
+        :return: The number of layers that were composited.
+        """
+        if self.__active__:
+            return 0
+
+        count = 0
+        self.__active__ = True
+        try:
+            for layer in self.__order__:
+                if not layer.visible or (layer.__z__ < 0) != below:
+                    continue
+                layer.render(window)
+                self.__textures__[layer.name].draw()
+                count += 1
+        finally:
+            self.__active__ = False
+        return count
+
+    def __sort__(self):
+        """
+        Sort the layers by depth, keeping the order of equal depths.
+        """
+        self.__order__.sort(key=lambda layer: layer.__z__)
+
+
+class LayerMixin:
+    """
+    The layers of a `Window`.
+
+    :ivar Optional[LayerStack] __layers__: The layers of the window, created
+        on first use.
+    """
+
+    def __init__(self, **options):
+        """
+        Initializes the layers of a new window.
+
+        :param options: The options of the other parts of the window.
+        """
+        self.__layers__ = None
+        super().__init__(**options)
+
+    def add_layer(self, name, draw, z=0):
+        """
+        Add a named layer to the window.
+
+        The layer is drawn by calling `draw(window)` with the renderer
+        targeting a texture of the size of the window, and the texture is
+        reused until the layer is invalidated. Layers with a negative depth
+        are composited under the frame right after `fill`, and the others are
+        composited over the frame by `update`, from the lowest to the highest
+        depth. The renderer should be created with `target_texture=True`.
+
+        :param str name: The name of the layer.
+        :param Callable draw: The function drawing the content of the layer.
+        :param int z: The depth of the layer. Default is 0.
+        :return: The new `Layer`.
+        :raises ValueError: If the window already has a layer with this name.
+        """
+        layer = Layer(name, draw, z)
+        self.layers.add(layer)
+        return layer
+
+    def remove_layer(self, name):
+        """
+        Remove a layer from the window and release its texture.
+
+        :param str name: The name of the layer to remove.
+        :return: The removed `Layer`.
+        :raises KeyError: If the window has no layer with this name.
+        """
+        return self.layers.remove(name)
+
+    def __composite__(self, below):
+        """
+        Composite the layers of the window onto the frame, if it has any.
+
+        :param bool below: Whether to composite the layers with a negative
+            depth instead of the others.
+        """
+        if self.__layers__:
+            self.__layers__.composite(self, below)
+
+    def __detach__(self):
+        """
+        Remove the layers of the window and release their textures.
+        """
+        super().__detach__()
+        if self.__layers__ is not None:
+            self.__layers__.release()
+            self.__layers__ = None
+
+    # Getters
+    @property
+    def layers(self):
+        """
+        Get the layers of the window, creating the stack on first use.
+
+        :return: The `LayerStack` of the window.
+        """
+        if self.__layers__ is None:
+            self.__layers__ = LayerStack(self.__resources__.layers)
+        return self.__layers__
@@ -0,0 +1,64 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from pygame import _sdl2 as sdl
+
+from pygwin.window import Window
+
+class Layer:
+    name: str
+    draw: Callable[[Window], object]
+    visible: bool
+    renders: int
+    __z__: int
+    __stack__: Optional[LayerStack]
+    __dirty__: bool
+
+    def __init__(
+        self,
+        name: str,
+        draw: Callable[[Window], object],
+        z: int = 0,
+        visible: bool = True,
+    ) -> None: ...
+    @property
+    def z(self) -> int: ...
+    @z.setter
+    def z(self, value: int) -> None: ...
+    @property
+    def dirty(self) -> bool: ...
+    @property
+    def texture(self) -> Optional[sdl.Texture]: ...
+    def invalidate(self) -> None: ...
+    def render(self, window: Window) -> bool: ...
+    def release(self) -> None: ...
+
+class LayerStack:
+    __layers__: Dict[str, Layer]
+    __order__: List[Layer]
+    __active__: bool
+    __textures__: Dict[str, sdl.Texture]
+
+    def __init__(self, textures: Optional[Dict[str, sdl.Texture]] = None) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[Layer]: ...
+    def __contains__(self, name: object) -> bool: ...
+    def add(self, layer: Layer) -> None: ...
+    def remove(self, name: str) -> Layer: ...
+    def get(self, name: str) -> Optional[Layer]: ...
+    def invalidate(self, name: Optional[str] = None) -> None: ...
+    def release(self) -> None: ...
+    def composite(self, window: Window, below: bool) -> int: ...
+    def __sort__(self) -> None: ...
+
+class LayerMixin:
+    __layers__: Optional[LayerStack]
+
+    def __init__(self, **options: Any) -> None: ...
+    @property
+    def layers(self) -> LayerStack: ...
+    def add_layer(
+        self, name: str, draw: Callable[[Window], object], z: int = 0
+    ) -> Layer: ...
+    def remove_layer(self, name: str) -> Layer: ...
+    def __composite__(self, below: bool) -> None: ...
+    def __detach__(self) -> None: ...
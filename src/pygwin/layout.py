@@ -0,0 +1,329 @@
+"""
+This module defines a `WindowLayout` class that arranges many `Window`
+objects at once. The target rectangle of every window is computed in a single
+pass from cached display bounds, and only the windows whose geometry actually
+changes are touched. Those windows are hidden together, moved and resized
+while hidden, and shown again together, so re-laying out dozens of windows
+never shows a cascade of intermediate moves.
+
+The module also defines the functions computing tile, grid and cascade
+layouts, which return plain rectangles and can be used on their own.
+"""
+
+import math
+
+import pygame
+
+from pygwin.window import WINDOWPOS_CENTERED, WINDOWPOS_UNDEFINED
+
+# Define the default offset between two cascaded windows
+CASCADE_OFFSET = 32
+
+
+def tile_rects(area, count, gap=0):
+    """
+    Split an area into rectangles that cover it entirely.
+
+    The rectangles are laid out in rows of as equal lengths as possible, and
+    the rectangles of each row share its width, so no part of the area is left
+    empty.
+
+    :param Tuple[int, int, int, int] area: The area to split, as
+        (x, y, width, height).
+    :param int count: The number of rectangles.
+    :param int gap: The space between two rectangles, in pixels. Default is 0.
+    :return: A list of `count` rectangles, as (x, y, width, height) tuples,
+        from left to right and top to bottom.
+    """
+    if count <= 0:
+        return []
+
+    x, y, width, height = area
+    rows = max(1, round(math.sqrt(count)))
+    row_height = max(1, (height - gap * (rows - 1)) // rows)
+    rects = []
+    for row in range(rows):
+        columns = count // rows + (row < count % rows)
+        column_width = max(1, (width - gap * (columns - 1)) // columns)
+        top = y + row * (row_height + gap)
+        rects.extend(
+            (x + column * (column_width + gap), top, column_width, row_height)
+            for column in range(columns)
+        )
+    return rects
+
+
+def grid_rects(area, count, columns=None, gap=0):
+    """
+    Split an area into a grid of rectangles of the same size.
+
+    :param Tuple[int, int, int, int] area: The area to split, as
+        (x, y, width, height).
+    :param int count: The number of rectangles.
+    :param Optional[int] columns: The number of columns of the grid. If not
+        specified, the grid is as square as possible.
+    :param int gap: The space between two rectangles, in pixels. Default is 0.
+    :return: A list of `count` rectangles, as (x, y, width, height) tuples,
+        from left to right and top to bottom.
+    :raises ValueError: If the number of columns is not positive.
+    """
+    if count <= 0:
+        return []
+    if columns is None:
+        columns = math.ceil(math.sqrt(count))
+    elif columns <= 0:
+        raise ValueError("columns must be positive")
+
+    x, y, width, height = area
+    rows = math.ceil(count / columns)
+    cell_width = max(1, (width - gap * (columns - 1)) // columns)
+    cell_height = max(1, (height - gap * (rows - 1)) // rows)
+    return [
+        (
+            x + (index % columns) * (cell_width + gap),
+            y + (index // columns) * (cell_height + gap),
+            cell_width,
+            cell_height,
+        )
+        for index in range(count)
+    ]
+
+
+def cascade_rects(area, count, size=None, offset=CASCADE_OFFSET):
+    """
+    Stack rectangles diagonally over an area, each one offset from the
+    previous one.
+
+    The stack starts again from the top-left corner of the area whenever the
+    next rectangle would leave it.
+
+    :param Tuple[int, int, int, int] area: The area to cascade over, as
+        (x, y, width, height).
+    :param int count: The number of rectangles.
+    :param Optional[Tuple[int, int]] size: The size of every rectangle. If not
+        specified, the rectangles are two thirds of the size of the area.
+    :param int offset: The horizontal and vertical offset between two
+        rectangles, in pixels. Default is `CASCADE_OFFSET`.
+    :return: A list of `count` rectangles, as (x, y, width, height) tuples,
+        from the back to the front of the stack.
+    """
+    x, y, width, height = area
+    if size is None:
+        size = (max(1, width * 2 // 3), max(1, height * 2 // 3))
+    steps = 1
+    if offset > 0:
+        steps += max(0, min(width - size[0], height - size[1]) // offset)
+    return [
+        (x + (index % steps) * offset, y + (index % steps) * offset, *size)
+        for index in range(count)
+    ]
+
+
+class WindowLayout:
+    """
+    An arranger of windows over the displays of the system.
+
+    The bounds of the displays are queried once and cached, since pygame only
+    reports their sizes and querying them is not free. Displays are assumed
+    to be laid out from left to right; other arrangements, or usable areas
+    that exclude task bars, can be given explicitly. Call `refresh` when a
+    display is connected or disconnected.
+
+    :ivar int gap: The space left between tiled and gridded windows, in
+        pixels.
+    :ivar int moved: The number of windows whose geometry has been changed.
+    :ivar Optional[List[Tuple[int, int, int, int]]] __displays__: The cached
+        usable areas of the displays, as (x, y, width, height), or None if
+        they have not been queried yet.
+    """
+
+    def __init__(self, displays=None, gap=0):
+        """
+        Initializes a new window layout.
+
+        :param Optional[Sequence[Tuple[int, int, int, int]]] displays: The
+            usable areas of the displays, as (x, y, width, height). If not
+            specified, the bounds of the displays are queried from pygame.
+        :param int gap: The space left between tiled and gridded windows, in
+            pixels. Default is 0.
+        """
+        self.gap = gap
+        self.moved = 0
+        self.__displays__ = None
+        if displays is not None:
+            self.__displays__ = [tuple(area) for area in displays]
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<WindowLayout(displays)>`.
+        """
+        return f"<WindowLayout({self.__displays__})>"
+
+    @property
+    def displays(self):
+        """
+        Get the usable areas of the displays, querying them on first use.
+
+        :return: A list of (x, y, width, height) tuples, one per display.
+        """
+        if self.__displays__ is None:
+            areas = []
+            left = 0
+            for width, height in pygame.display.get_desktop_sizes():
+                areas.append((left, 0, width, height))
+                left += width
+            self.__displays__ = areas
+        return self.__displays__
+
+    def refresh(self, displays=None):
+        """
+        Forget the cached display areas, after a display was connected or
+        disconnected.
+
+        :param Optional[Sequence[Tuple[int, int, int, int]]] displays: The new
+            usable areas of the displays. If not specified, they are queried
+            again from pygame the next time they are needed.
+        """
+        self.__displays__ = None
+        if displays is not None:
+            self.__displays__ = [tuple(area) for area in displays]
+
+    def tile(self, windows, display=0):
+        """
+        Tile windows over a display, leaving no part of it empty.
+
+        :param Sequence[Window] windows: The windows to arrange.
+        :param int display: The index of the display. Default is 0.
+        :return: The number of windows whose geometry changed.
+        """
+        area = self.displays[display]
+        return self.apply(windows, tile_rects(area, len(windows), self.gap))
+
+    def grid(self, windows, columns=None, display=0):
+        """
+        Arrange windows in a grid of cells of the same size over a display.
+
+        :param Sequence[Window] windows: The windows to arrange.
+        :param Optional[int] columns: The number of columns of the grid. If not
+            specified, the grid is as square as possible.
+        :param int display: The index of the display. Default is 0.
+        :return: The number of windows whose geometry changed.
+        """
+        area = self.displays[display]
+        rects = grid_rects(area, len(windows), columns, self.gap)
+        return self.apply(windows, rects)
+
+    def cascade(self, windows, size=None, offset=CASCADE_OFFSET, display=0):
+        """
+        Cascade windows over a display.
+
+        :param Sequence[Window] windows: The windows to arrange, from the back
+            to the front of the stack.
+        :param Optional[Tuple[int, int]] size: The size of every window. If not
+            specified, the windows are two thirds of the size of the display.
+        :param int offset: The offset between two windows, in pixels. Default
+            is `CASCADE_OFFSET`.
+        :param int display: The index of the display. Default is 0.
+        :return: The number of windows whose geometry changed.
+        """
+        area = self.displays[display]
+        return self.apply(windows, cascade_rects(area, len(windows), size, offset))
+
+    def place(self, windows, rects, display=0):
+        """
+        Place windows at explicit rectangles relative to a display.
+
+        A coordinate may be `WINDOWPOS_CENTERED` or `WINDOWPOS_UNDEFINED`, in
+        which case SDL chooses it on the given display.
+
+        :param Sequence[Window] windows: The windows to arrange.
+        :param Sequence[Optional[Tuple[int, int, int, int]]] rects: The
+            rectangle of each window, as (x, y, width, height), or None to
+            leave a window as it is.
+        :param int display: The index of the display. Default is 0.
+        :return: The number of windows whose geometry changed.
+        """
+        left, top = self.displays[display][:2]
+        placed = []
+        for rect in rects:
+            if rect is not None:
+                x, y, width, height = rect
+                rect = (
+                    self.__resolve__(x, left, display),
+                    self.__resolve__(y, top, display),
+                    width,
+                    height,
+                )
+            placed.append(rect)
+        return self.apply(windows, placed)
+
+    def apply(self, windows, rects):
+        """
+        Move and resize windows to absolute rectangles in one batch.
+
+        Windows already at their rectangle are not touched, and fullscreen
+        windows are skipped. The other windows are hidden together, restored
+        if they were minimized or maximized, moved and resized with
+        `Window.configure`, and the ones that were visible are shown again
+        together.
+
+        :param Sequence[Window] windows: The windows to arrange.
+        :param Sequence[Optional[Tuple[int, int, int, int]]] rects: The
+            rectangle of each window in screen coordinates, as
+            (x, y, width, height), or None to leave a window as it is.
+        :return: The number of windows whose geometry changed.
+        """
+        changes = []
+        for window, rect in zip(windows, rects):
+            if rect is None or window.fullscreen:
+                continue
+            position, size = self.__geometry__(rect)
+            if window.position != position or window.size != size:
+                changes.append((window, position, size))
+
+        shown = [window for window, _, _ in changes if window.visible]
+        for window in shown:
+            window.hide()
+        for window, position, size in changes:
+            # Restore first, since restoring brings back the previous geometry
+            window.configure(minimized=False, maximized=False)
+            window.configure(size=size, position=position)
+        for window in shown:
+            window.show()
+
+        self.moved += len(changes)
+        return len(changes)
+
+    @staticmethod
+    def __geometry__(rect):
+        """
+        Split a rectangle into the position and size of a window.
+
+        :param Tuple[int, int, int, int] rect: The rectangle, as
+            (x, y, width, height).
+        :return: The position, which is a single special coordinate if both
+            coordinates are the same `WINDOWPOS_CENTERED` or
+            `WINDOWPOS_UNDEFINED`, and the size.
+        """
+        x, y, width, height = rect
+        if x == y and x in (WINDOWPOS_CENTERED, WINDOWPOS_UNDEFINED):
+            return x, (width, height)
+        return (x, y), (width, height)
+
+    @staticmethod
+    def __resolve__(value, origin, display):
+        """
+        Turn a coordinate relative to a display into a screen coordinate.
+
+        :param int value: The coordinate, which may be `WINDOWPOS_CENTERED` or
+            `WINDOWPOS_UNDEFINED`.
+        :param int origin: The coordinate of the display on the same axis.
+        :param int display: The index of the display.
+        :return: The screen coordinate, or the special coordinate of the
+            display.
+        """
+        if value in (WINDOWPOS_CENTERED, WINDOWPOS_UNDEFINED):
+            return value | display
+        return origin + value
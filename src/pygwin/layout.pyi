@@ -0,0 +1,59 @@
+from typing import List, Optional, Sequence, Tuple, Union
+
+from pygwin.window import Window
+
+Rect = Tuple[int, int, int, int]
+
+CASCADE_OFFSET: int
+
+def tile_rects(area: Rect, count: int, gap: int = 0) -> List[Rect]: ...
+def grid_rects(
+    area: Rect, count: int, columns: Optional[int] = None, gap: int = 0
+) -> List[Rect]: ...
+def cascade_rects(
+    area: Rect,
+    count: int,
+    size: Optional[Tuple[int, int]] = None,
+    offset: int = ...,
+) -> List[Rect]: ...
+
+class WindowLayout:
+    gap: int
+    moved: int
+    __displays__: Optional[List[Rect]]
+
+    def __init__(
+        self, displays: Optional[Sequence[Rect]] = None, gap: int = 0
+    ) -> None: ...
+    @property
+    def displays(self) -> List[Rect]: ...
+    def refresh(self, displays: Optional[Sequence[Rect]] = None) -> None: ...
+    def tile(self, windows: Sequence[Window], display: int = 0) -> int: ...
+    def grid(
+        self,
+        windows: Sequence[Window],
+        columns: Optional[int] = None,
+        display: int = 0,
+    ) -> int: ...
+    def cascade(
+        self,
+        windows: Sequence[Window],
+        size: Optional[Tuple[int, int]] = None,
+        offset: int = ...,
+        display: int = 0,
+    ) -> int: ...
+    def place(
+        self,
+        windows: Sequence[Window],
+        rects: Sequence[Optional[Rect]],
+        display: int = 0,
+    ) -> int: ...
+    def apply(
+        self, windows: Sequence[Window], rects: Sequence[Optional[Rect]]
+    ) -> int: ...
+    @staticmethod
+    def __geometry__(
+        rect: Rect,
+    ) -> Tuple[Union[int, Tuple[int, int]], Tuple[int, int]]: ...
+    @staticmethod
+    def __resolve__(value: int, origin: int, display: int) -> int: ...
@@ -0,0 +1,544 @@
+"""
+This module keeps track of the native resources held by every open `Window`.
+Windows register themselves when they are created and unregister when they
+are destroyed, so the accounting only ever sees open windows. The native
+resources of a window live in a `WindowResources` holder, which a finalizer
+releases in order if the window is garbage collected without having been
+destroyed. The module also destroys the windows left open when pygame is quit
+or the interpreter exits, before SDL is shut down, since SDL textures must not
+outlive the renderer and the video subsystem that own them. The lifecycle
+methods of `Window`, from the creation of its renderer to the accounting of
+what it holds, are defined by `LifecycleMixin`.
+"""
+
+import atexit
+import time
+import weakref
+from operator import attrgetter
+
+import pygame
+from pygame import _sdl2 as sdl
+
+from pygwin.stats import WindowStats
+from pygwin.texture import TEXTURE_DEPTH
+
+
+class ResourceUsage:
+    """
+    An estimate of the native resources held by one or more windows.
+
+    Native bytes are estimated from the size of each texture and back buffer,
+    assuming four bytes per pixel. Memory allocated by the driver for its own
+    bookkeeping is not included.
+
+    :ivar int windows: The number of open native windows.
+    :ivar int renderers: The number of renderers.
+    :ivar int textures: The number of textures.
+    :ivar int bytes: The estimated number of bytes used by the back buffers
+        and the textures.
+    :ivar int collected: The number of windows that were released by the
+        garbage collector instead of being destroyed. Only reported by
+        `usage`, where a growing value points at leaked windows.
+    """
+
+    __slots__ = ("windows", "renderers", "textures", "bytes", "collected")
+
+    def __init__(self, windows=0, renderers=0, textures=0, bytes=0, collected=0):
+        """
+        Initializes a new resource usage record.
+
+        :param int windows: The number of open native windows. Default is 0.
+        :param int renderers: The number of renderers. Default is 0.
+        :param int textures: The number of textures. Default is 0.
+        :param int bytes: The estimated number of native bytes. Default is 0.
+        :param int collected: The number of windows released by the garbage
+            collector. Default is 0.
+        """
+        # pylint: disable=W0622
+        self.windows = windows
+        self.renderers = renderers
+        self.textures = textures
+        self.bytes = bytes
+        self.collected = collected
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format
+            `<ResourceUsage(windows renderers textures bytes)>`.
+        """
+        return (
+            f"<ResourceUsage({self.windows} {self.renderers} "
+            f"{self.textures} {self.bytes})>"
+        )
+
+    def add_texture(self, width, height):
+        """
+        Account for a texture.
+
+        :param int width: The width of the texture.
+        :param int height: The height of the texture.
+        """
+        self.textures += 1
+        self.bytes += width * height * TEXTURE_DEPTH
+
+    def merge(self, other):
+        """
+        Add the resources of another record to this one.
+
+        :param ResourceUsage other: The record to add.
+        """
+        self.windows += other.windows
+        self.renderers += other.renderers
+        self.textures += other.textures
+        self.bytes += other.bytes
+        self.collected += other.collected
+
+
+class WindowResources:
+    """
+    The native resources of a window.
+
+    The holder is the only owner of the renderer of a window and of the
+    textures created on it, so they can be released in order without a
+    reference to the window itself. The layers and the mirror of the window
+    keep their textures here rather than holding them.
+
+    :ivar sdl.Window window: The native window.
+    :ivar Optional[sdl.Renderer] renderer: The renderer of the window.
+    :ivar Optional[TextureCache] textures: The texture cache of the window.
+    :ivar Dict[str, StreamingTexture] streams: The streaming textures of the
+        window: the one frames are streamed into, under "frames", and the one
+        holding the frames of the window mirrored in the window, under
+        "mirror".
+    :ivar Optional[sdl.Texture] target: The target texture of a headless
+        window.
+    :ivar Optional[sdl.Texture] scaled: The target texture of a window
+        rendered at a reduced resolution.
+    :ivar Dict[str, sdl.Texture] layers: The textures caching the layers of
+        the window, indexed by layer name.
+    """
+
+    __slots__ = (
+        "window",
+        "renderer",
+        "textures",
+        "streams",
+        "target",
+        "scaled",
+        "layers",
+    )
+
+    def __init__(self, window):
+        """
+        Initializes a new resource holder.
+
+        :param sdl.Window window: The native window.
+        """
+        self.window = window
+        self.renderer = None
+        self.textures = None
+        self.streams = {}
+        self.target = None
+        self.scaled = None
+        self.layers = {}
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<WindowResources(id)>`.
+        """
+        return f"<WindowResources({self.window.id})>"
+
+    def usage(self, back_buffer):
+        """
+        Estimate the native resources held.
+
+        :param Optional[Tuple[int, int]] back_buffer: The size of the back
+            buffer of the window, or None if it has none.
+        :return: A `ResourceUsage` describing the window.
+        """
+        held = ResourceUsage(windows=1)
+        if self.renderer is None:
+            return held
+        held.renderers = 1
+        if back_buffer is not None:
+            held.add_texture(*back_buffer)
+
+        textures = [self.target, self.scaled, *self.layers.values()]
+        textures.extend(stream.texture for stream in self.streams.values())
+        for texture in textures:
+            if texture is not None:
+                held.add_texture(texture.width, texture.height)
+
+        if self.textures is not None:
+            held.textures += len(self.textures)
+            held.bytes += self.textures.bytes
+        return held
+
+    def release(self):
+        """
+        Release the textures, then the renderer, then destroy the native
+        window. The native window is kept, destroyed, so its ID reads as 0.
+
+        The renderer stops drawing into the target texture of a headless or
+        scaled window first, so that the renderer does not keep the texture
+        alive.
+        """
+        try:
+            if self.textures is not None:
+                self.textures.clear()
+                self.textures = None
+            if self.target is not None or self.scaled is not None:
+                self.renderer.target = None
+            self.layers.clear()
+            self.streams.clear()
+            self.target = None
+            self.scaled = None
+            self.renderer = None
+        finally:
+            self.window.destroy()
+
+
+class WindowRegistry:
+    """
+    The open windows of the process.
+
+    :ivar WeakValueDictionary windows: The open windows, indexed by object
+        identity.
+    :ivar int collected: The number of windows released by the garbage
+        collector.
+    :ivar bool hooked: Whether the open windows are destroyed when pygame is
+        quit. pygame forgets its quit functions every time it is quit, so the
+        hook is registered again by the next window created.
+    """
+
+    __slots__ = ("windows", "collected", "hooked")
+
+    def __init__(self):
+        """
+        Initializes a new, empty window registry.
+        """
+        self.windows = weakref.WeakValueDictionary()
+        self.collected = 0
+        self.hooked = False
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<WindowRegistry(windows collected)>`.
+        """
+        return f"<WindowRegistry({len(self.windows)} {self.collected})>"
+
+    def add(self, window):
+        """
+        Register an open window.
+
+        :param Window window: The window to register.
+        """
+        self.windows[id(window)] = window
+
+    def remove(self, window):
+        """
+        Unregister a window, if it is registered.
+
+        :param Window window: The window to unregister.
+        """
+        self.windows.pop(id(window), None)
+
+
+def resource(name, doc, key=None):
+    """
+    Create a property reading and writing a native resource of a window.
+
+    The native resources of a window are held by its `WindowResources`, so
+    the finalizer of the window can release them without the window itself.
+
+    :param str name: The name of the attribute of `WindowResources`.
+    :param str doc: The docstring of the property.
+    :param Optional[str] key: The key of the resource, if the attribute is a
+        dictionary of resources. Setting the property to None removes the
+        key. Default is None.
+    :return: The property.
+    """
+    if key is None:
+
+        def setter(window, value):
+            setattr(window.__resources__, name, value)
+
+        return property(attrgetter(f"__resources__.{name}"), setter, doc=doc)
+
+    def getter(window):
+        return getattr(window.__resources__, name).get(key)
+
+    def keyed_setter(window, value):
+        resources = getattr(window.__resources__, name)
+        if value is None:
+            resources.pop(key, None)
+        else:
+            resources[key] = value
+
+    return property(getter, keyed_setter, doc=doc)
+
+
+class LifecycleMixin:
+    """
+    The lifecycle of a `Window`: its native resources, from the renderer
+    created on first use to their release, and the accounting of what it
+    holds and what it costs.
+
+    The mixins of `Window` take the options of `Window.__init__` as keyword
+    arguments, each initializing its own state from the options it knows and
+    passing the others on.
+
+    :ivar Optional[WindowStats] __stats__: The performance statistics of the
+        window, if enabled.
+    """
+
+    # Native resources, held by `__resources__`
+    __window__ = resource("window", "The native window.")
+    __renderer__ = resource("renderer", "The renderer, if created.")
+    __textures__ = resource("textures", "The texture cache, if created.")
+    __stream__ = resource("streams", "The streaming texture, if created.", "frames")
+    __target__ = resource("target", "The target texture of a headless window.")
+    __scaled__ = resource("scaled", "The target texture at reduced resolution.")
+    __mirrored__ = resource("streams", "The texture of the mirrored frames.", "mirror")
+
+    def __init__(self, **options):
+        """
+        Initializes the accounting of a new window.
+
+        :param options: The options of the other parts of the window.
+        """
+        self.__stats__ = None
+        super().__init__(**options)
+
+    def __enter__(self):
+        """
+        Enter a `with` block owning the window.
+
+        :return: The window itself.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Leave a `with` block owning the window, destroying the window.
+        """
+        self.destroy()
+
+    def create_renderer(self):
+        """
+        Create the renderer of the window, if it has not been created yet.
+
+        The renderer is created with the options given to `__init__`. The
+        renderer of a headless window draws into a target texture of the size
+        of the window. Creating the renderer ahead of time moves its cost out
+        of the first frame.
+
+        :return: The `sdl.Renderer` that draws into the window.
+        :raises RuntimeError: If the window has been destroyed.
+        """
+        if self.__closed__:
+            raise RuntimeError("the window has been destroyed")
+        if self.__renderer__ is None:
+            start = time.perf_counter()
+            self.__renderer__ = sdl.Renderer(self.__window__, **self.__options__)
+            if self.__headless__ or self.__resolution__ < 1:
+                self.__retarget__()
+            if self.__stats__ is not None:
+                self.__stats__.renderer_time = time.perf_counter() - start
+        return self.__renderer__
+
+    def snapshot(self):
+        """
+        Get the current configuration of the window.
+
+        The configuration includes the changes made by the user, such as a
+        move or a resize, once their events have been applied.
+
+        :return: A dictionary with the same names and meanings as the
+            arguments of `Window.__init__`, which can be given back to
+            `configure` or to the constructor of a new window.
+        """
+        return self.__state__.snapshot()
+
+    def usage(self):
+        """
+        Estimate the native resources held by the window.
+
+        The back buffer of a window that has a renderer and is not headless
+        counts as one texture of the size of the window.
+
+        :return: A `ResourceUsage` describing the window.
+        """
+        if self.__closed__:
+            return ResourceUsage()
+        return self.__resources__.usage(None if self.__headless__ else self.size)
+
+    def enable_stats(self, hook=None, interval=1.0):
+        """
+        Start recording performance statistics for the window.
+
+        Statistics are disabled by default, and cost a single attribute check
+        per instrumented call while disabled. Calling this method again
+        replaces the hook and interval but keeps the recorded statistics.
+
+        :param Optional[Callable] hook: The function the statistics are
+            exported to, called as `hook(window, stats)` from `update`.
+            Default is None.
+        :param float interval: The minimum time between two exports, in
+            seconds. Default is 1.0.
+        :return: The `WindowStats` of the window.
+        """
+        if self.__stats__ is None:
+            self.__stats__ = WindowStats(hook, interval)
+        else:
+            self.__stats__.hook = hook
+            self.__stats__.interval = interval
+        return self.__stats__
+
+    def disable_stats(self):
+        """
+        Stop recording performance statistics for the window and drop the
+        statistics recorded so far.
+        """
+        self.__stats__ = None
+
+    def __detach__(self):
+        """
+        Detach everything attached to a window that is being destroyed or
+        reset. Each part of the window extends this method to detach its own
+        state.
+        """
+
+    # Getters
+    @property
+    def renderer(self):
+        """
+        Get the renderer of the window, creating it on first use.
+
+        Windows that are never drawn to never create a renderer, which makes
+        opening many auxiliary windows much cheaper. See `create_renderer`.
+
+        :return: The `sdl.Renderer` that draws into the window.
+        :raises RuntimeError: If the window has been destroyed.
+        """
+        renderer = self.__renderer__
+        if renderer is None:
+            renderer = self.create_renderer()
+        return renderer
+
+    @property
+    def stats(self):
+        """
+        Get the performance statistics of the window.
+
+        :return: The `WindowStats` of the window, or None if statistics are
+            disabled.
+        """
+        return self.__stats__
+
+    @property
+    def closed(self):
+        """
+        Get whether the window has been destroyed.
+
+        :return: True if `destroy` has been called, False otherwise.
+        """
+        return self.__closed__
+
+    @property
+    def id(self):
+        """
+        Get the unique identifier of the window.
+
+        :return: The SDL window ID as an integer. This is the value that SDL
+            attaches to every window event sent to this window.
+        """
+        return self.__window__.id
+
+
+# Define the registry of the open windows of the process
+REGISTRY = WindowRegistry()
+
+
+def collect(resources):
+    """
+    Release the resources of a window that was garbage collected without
+    having been destroyed. Resources collected after pygame has been quit are
+    left to pygame.
+
+    :param WindowResources resources: The resources of the window.
+    """
+    REGISTRY.collected += 1
+    if pygame.get_init():
+        resources.release()
+
+
+def track(window):
+    """
+    Register an open window, and the finalizer releasing its resources if it
+    is garbage collected without having been destroyed.
+
+    :param Window window: The window to register.
+    :return: The `weakref.finalize` of the window, to detach when the window
+        is destroyed.
+    """
+    if not REGISTRY.hooked:
+        pygame.register_quit(quit_hook)
+        REGISTRY.hooked = True
+    REGISTRY.add(window)
+    finalizer = weakref.finalize(window, collect, window.__resources__)
+    finalizer.atexit = False
+    return finalizer
+
+
+def untrack(window):
+    """
+    Unregister a window that is being destroyed.
+
+    :param Window window: The window to unregister.
+    """
+    REGISTRY.remove(window)
+
+
+def usage():
+    """
+    Get the native resources held by every open window of the process.
+
+    :return: A `ResourceUsage` summing the usage of every open window, with
+        the number of windows released by the garbage collector so far.
+    """
+    total = ResourceUsage(collected=REGISTRY.collected)
+    for window in list(REGISTRY.windows.values()):
+        total.merge(window.usage())
+    return total
+
+
+def release_all():
+    """
+    Destroy every open window, releasing the textures and the renderer of
+    each before its native window. This function runs when pygame is quit and
+    when the interpreter exits.
+
+    :return: The number of windows that were destroyed.
+    """
+    windows = list(REGISTRY.windows.values())
+    for window in windows:
+        window.destroy()
+    return len(windows)
+
+
+def quit_hook():
+    """
+    Destroy every open window when pygame is quit, before SDL shuts down.
+    """
+    REGISTRY.hooked = False
+    release_all()
+
+
+atexit.register(release_all)
@@ -0,0 +1,97 @@
+import weakref
+from types import TracebackType
+from typing import Any, Callable, Dict, MutableMapping, Optional, Tuple, Type
+
+from pygame import _sdl2 as sdl
+
+from pygwin.stats import WindowStats
+from pygwin.texture import StreamingTexture, TextureCache
+from pygwin.window import Window
+
+class ResourceUsage:
+    windows: int
+    renderers: int
+    textures: int
+    bytes: int
+    collected: int
+
+    def __init__(
+        self,
+        windows: int = 0,
+        renderers: int = 0,
+        textures: int = 0,
+        bytes: int = 0,
+        collected: int = 0,
+    ) -> None: ...
+    def add_texture(self, width: int, height: int) -> None: ...
+    def merge(self, other: ResourceUsage) -> None: ...
+
+class WindowResources:
+    window: sdl.Window
+    renderer: Optional[sdl.Renderer]
+    textures: Optional[TextureCache]
+    streams: Dict[str, StreamingTexture]
+    target: Optional[sdl.Texture]
+    scaled: Optional[sdl.Texture]
+    layers: Dict[str, sdl.Texture]
+
+    def __init__(self, window: sdl.Window) -> None: ...
+    def usage(self, back_buffer: Optional[Tuple[int, int]]) -> ResourceUsage: ...
+    def release(self) -> None: ...
+
+class WindowRegistry:
+    windows: MutableMapping[int, Window]
+    collected: int
+    hooked: bool
+
+    def __init__(self) -> None: ...
+    def add(self, window: Window) -> None: ...
+    def remove(self, window: Window) -> None: ...
+
+def resource(name: str, doc: str, key: Optional[str] = None) -> property: ...
+
+class LifecycleMixin:
+    __window__: sdl.Window
+    __renderer__: Optional[sdl.Renderer]
+    __textures__: Optional[TextureCache]
+    __stream__: Optional[StreamingTexture]
+    __target__: Optional[sdl.Texture]
+    __scaled__: Optional[sdl.Texture]
+    __mirrored__: Optional[StreamingTexture]
+    __stats__: Optional[WindowStats]
+
+    def __init__(self, **options: Any) -> None: ...
+    def __enter__(self) -> Window: ...
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None: ...
+    @property
+    def renderer(self) -> sdl.Renderer: ...
+    @property
+    def stats(self) -> Optional[WindowStats]: ...
+    @property
+    def closed(self) -> bool: ...
+    @property
+    def id(self) -> int: ...
+    def create_renderer(self) -> sdl.Renderer: ...
+    def snapshot(self) -> Dict[str, Any]: ...
+    def usage(self) -> ResourceUsage: ...
+    def enable_stats(
+        self,
+        hook: Optional[Callable[[Window, WindowStats], object]] = None,
+        interval: float = 1.0,
+    ) -> WindowStats: ...
+    def disable_stats(self) -> None: ...
+    def __detach__(self) -> None: ...
+
+REGISTRY: WindowRegistry
+
+def collect(resources: WindowResources) -> None: ...
+def track(window: Window) -> weakref.finalize[[WindowResources], None]: ...
+def untrack(window: Window) -> None: ...
+def usage() -> ResourceUsage: ...
+def release_all() -> int: ...
+def quit_hook() -> None: ...
@@ -0,0 +1,283 @@
+"""
+This module defines a `WindowManager` class that keeps track of every open
+`Window` and routes SDL events to them. The manager indexes its windows by
+their SDL window ID, so finding the owner of an event is a single dictionary
+lookup no matter how many windows are open.
+"""
+
+import pygame
+
+from pygwin.clock import PACE_SKIP, FramePacer
+from pygwin.resize import coalesce
+
+
+class WindowManager:
+    """
+    A registry of `Window` objects with per-window event dispatching.
+
+    The manager pumps the SDL event queue once per frame and forwards each
+    event that belongs to one of its windows straight to the handlers bound to
+    that window. Events that are not handled are returned to the caller, so
+    the manager can be dropped into an existing event loop.
+
+    :ivar Dict[int, Window] __windows__: The managed windows, indexed by their
+        SDL window ID.
+    :ivar Dict[int, int] __ids__: The SDL window ID each managed window had
+        when it was added, indexed by object identity. SDL resets the ID of a
+        window to 0 when it is destroyed, so destroyed windows are still found
+        through the ID they were added with.
+    :ivar Dict[int, Dict[int, List[Callable]]] __handlers__: The event
+        handlers of each managed window, indexed by SDL window ID and then by
+        event type.
+    """
+
+    def __init__(self, *windows):
+        """
+        Initializes a new window manager.
+
+        :param Window windows: The windows to manage from the start.
+        """
+        self.__windows__ = {}
+        self.__ids__ = {}
+        self.__handlers__ = {}
+
+        for window in windows:
+            self.add(window)
+
+    def __len__(self):
+        """
+        Get the number of managed windows.
+
+        :return: The number of windows registered with this manager.
+        """
+        return len(self.__windows__)
+
+    def __iter__(self):
+        """
+        Iterate over the managed windows.
+
+        :return: An iterator over the windows registered with this manager, in
+            the order they were added.
+        """
+        return iter(list(self.__windows__.values()))
+
+    def __contains__(self, window):
+        """
+        Check whether a window is managed by this manager.
+
+        :param Window window: The window to look for.
+        :return: True if the window is registered with this manager, False
+            otherwise.
+        """
+        window_id = self.__ids__.get(id(window))
+        return window_id is not None and self.__windows__.get(window_id) is window
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<WindowManager(count)>`, where `count`
+            is the number of managed windows.
+        """
+        return f"<WindowManager({len(self.__windows__)})>"
+
+    def add(self, window):
+        """
+        Register a window with the manager.
+
+        :param Window window: The window to register.
+        :raises ValueError: If the window was destroyed, or if another window
+            with the same ID is already registered.
+        """
+        if window in self:
+            return
+        if window.closed:
+            raise ValueError("a destroyed window cannot be managed")
+
+        current = self.__windows__.get(window.id)
+        if current is not None:
+            raise ValueError(f"a window with id {window.id} is already managed")
+
+        self.__windows__[window.id] = window
+        self.__ids__[id(window)] = window.id
+        self.__handlers__[window.id] = {}
+
+    def remove(self, window):
+        """
+        Unregister a window and drop all of its event handlers.
+
+        A destroyed window can still be removed, until the manager drops it on
+        its own during the next `pump` or `present_all`.
+
+        :param Window window: The window to unregister.
+        :raises KeyError: If the window is not registered with this manager.
+        """
+        if window not in self:
+            raise KeyError(window.id)
+
+        window_id = self.__ids__.pop(id(window))
+        del self.__windows__[window_id]
+        del self.__handlers__[window_id]
+
+    def __prune__(self):
+        """
+        Drop the managed windows that were destroyed, with their handlers.
+        """
+        for window in [window for window in self.__windows__.values() if window.closed]:
+            self.remove(window)
+
+    def get(self, window_id):
+        """
+        Get a managed window by its SDL window ID.
+
+        :param int window_id: The SDL window ID to look up.
+        :return: The window with the given ID, or None if no such window is
+            registered with this manager.
+        """
+        return self.__windows__.get(window_id)
+
+    def bind(self, window, event_type, handler):
+        """
+        Bind an event handler to a managed window.
+
+        The handler is called as `handler(window, event)` every time an event
+        of the given type is sent to the window. Several handlers can be bound
+        to the same event type; they are called in the order they were bound.
+
+        :param Window window: The managed window to bind the handler to.
+        :param int event_type: The pygame event type to handle, such as
+            `pygame.WINDOWCLOSE` or `pygame.WINDOWRESIZED`.
+        :param Callable handler: The function to call.
+        :raises KeyError: If the window is not registered with this manager.
+        """
+        if window not in self:
+            raise KeyError(window.id)
+
+        handlers = self.__handlers__[self.__ids__[id(window)]]
+        handlers.setdefault(event_type, []).append(handler)
+
+    def unbind(self, window, event_type, handler=None):
+        """
+        Unbind event handlers from a managed window.
+
+        :param Window window: The managed window to unbind the handlers from.
+        :param int event_type: The pygame event type of the handlers.
+        :param Optional[Callable] handler: The handler to unbind. If not
+            specified, every handler bound to the event type is unbound.
+        :raises KeyError: If the window is not registered with this manager.
+        """
+        if window not in self:
+            raise KeyError(window.id)
+
+        handlers = self.__handlers__[self.__ids__[id(window)]]
+        if handler is None:
+            handlers.pop(event_type, None)
+        elif handler in handlers.get(event_type, ()):
+            handlers[event_type].remove(handler)
+            if not handlers[event_type]:
+                del handlers[event_type]
+
+    def dispatch(self, event):
+        """
+        Dispatch a single event to the handlers of the window it belongs to.
+
+        The owner of the event is found through the SDL window ID of the
+        `window` attribute that pygame attaches to window, keyboard and mouse
+        events, so the cost of this method does not depend on the number of
+        managed windows. Window events also keep the cached state and the idle
+        policy of the window in sync with changes made outside of its setters.
+
+        :param pygame.event.Event event: The event to dispatch.
+        :return: True if at least one handler was called, False otherwise.
+        """
+        source = getattr(event, "window", None)
+        if source is None:
+            return False
+
+        window = self.__windows__.get(source.id)
+        if window is None:
+            return False
+
+        window.apply_event(event)
+        callbacks = self.__handlers__[source.id].get(event.type)
+        if not callbacks:
+            return False
+
+        for callback in tuple(callbacks):
+            callback(window, event)
+        return True
+
+    def pump(self):
+        """
+        Pump the SDL event queue once and dispatch every pending event.
+
+        This method should be called once per frame. It fetches every pending
+        event with a single call to `pygame.event.get`, keeps only the latest
+        move and resize events of each window, and dispatches each of them to
+        the handlers of the window it belongs to. The debounced resizes of the
+        managed windows are then settled if their size has held long enough,
+        and the windows destroyed since the last pump are dropped.
+
+        :return: The list of events that were not handled by any handler, in
+            the order they were received.
+        """
+        self.__prune__()
+        dispatch = self.dispatch
+        events = [
+            event for event in coalesce(pygame.event.get()) if not dispatch(event)
+        ]
+        for window in self.__windows__.values():
+            if window.debouncer is not None:
+                window.settle()
+        return events
+
+    def present_all(self):
+        """
+        Present every managed window that has been drawn to since the last
+        frame.
+
+        Windows that had no `fill` or other draw calls since they were last
+        updated are skipped, so static windows cost neither a present call nor
+        compositor bandwidth, and destroyed windows are dropped. Skipped
+        windows still publish the frame their mirrors are waiting for once
+        their rate allows it. Windows mirroring another window are presented
+        last, so they show the frame their source published in the same pass.
+
+        :return: The number of windows that were presented.
+        """
+        self.__prune__()
+        windows = list(self.__windows__.values())
+        windows.sort(key=lambda window: window.mirroring is not None)
+        presented = 0
+        for window in windows:
+            if window.dirty:
+                window.update()
+                presented += 1
+            elif window.mirrors is not None and window.mirrors.pending:
+                window.mirrors.publish(window)
+        return presented
+
+    def run(self, frame_callback, fps=60, policy=PACE_SKIP):
+        """
+        Run a paced frame loop on every managed window.
+
+        Each frame, the event queue is pumped once and the callback is called
+        as `frame_callback(events, delta)`, where `events` are the events that
+        no handler consumed and `delta` is the duration of the previous frame
+        in seconds. The windows drawn to during the frame are then presented
+        with `present_all`. The loop stops when the callback returns False.
+
+        :param Callable frame_callback: The function to call every frame.
+        :param Optional[float] fps: The target frame rate, or None for an
+            unlimited frame rate. Default is 60.
+        :param str policy: The policy applied to late frames, either
+            `PACE_SKIP` or `PACE_CATCHUP`. Default is `PACE_SKIP`.
+        :return: The `FramePacer` that paced the loop, with its frame time
+            statistics.
+        """
+        pacer = FramePacer(fps, policy)
+        delta = pacer.tick()
+        while frame_callback(self.pump(), delta) is not False:
+            self.present_all()
+            delta = pacer.tick()
+        return pacer
@@ -0,0 +1,35 @@
+from typing import Callable, Dict, Iterator, List, Optional
+
+from pygame.event import Event
+
+from pygwin.clock import FramePacer
+from pygwin.window import Window
+
+Handler = Callable[[Window, Event], object]
+
+class WindowManager:
+    __windows__: Dict[int, Window]
+    __ids__: Dict[int, int]
+    __handlers__: Dict[int, Dict[int, List[Handler]]]
+
+    def __init__(self, *windows: Window) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[Window]: ...
+    def __contains__(self, window: Window) -> bool: ...
+    def add(self, window: Window) -> None: ...
+    def remove(self, window: Window) -> None: ...
+    def __prune__(self) -> None: ...
+    def get(self, window_id: int) -> Optional[Window]: ...
+    def bind(self, window: Window, event_type: int, handler: Handler) -> None: ...
+    def unbind(
+        self, window: Window, event_type: int, handler: Optional[Handler] = None
+    ) -> None: ...
+    def dispatch(self, event: Event) -> bool: ...
+    def pump(self) -> List[Event]: ...
+    def present_all(self) -> int: ...
+    def run(
+        self,
+        frame_callback: Callable[[List[Event], float], object],
+        fps: Optional[float] = 60,
+        policy: str = ...,
+    ) -> FramePacer: ...
@@ -0,0 +1,389 @@
+"""
+This module defines the `Mirror` and `MirrorSet` classes, which present the
+content of a `Window` in other windows. SDL textures cannot be shared between
+renderers, so the frames of the source window are read back once, uploaded
+once to a streaming texture of each mirroring renderer, and drawn there
+without running the drawing code of the source again. The `MirrorMixin` class
+gives `Window` its mirroring methods.
+"""
+
+import time
+
+import pygame
+
+from pygwin.texture import TEXTURE_DEPTH, TEXTURE_FORMAT, StreamingTexture
+
+# Define the default number of times per second the frames of a window are
+# read back for its mirrors
+MIRROR_RATE = 30
+
+
+class Mirror:
+    """
+    A window presenting the frames of another window.
+
+    The last frame read back from the source window is uploaded to the target
+    window and drawn there when the target window is updated, so the target
+    is presented in its own present pass and never from within the update of
+    the source window. The texture holding the uploaded frame belongs to the
+    resources of the target window, which release it along with its renderer.
+
+    :ivar int uploads: The number of frames uploaded to the target window.
+    :ivar Optional[float] rate: The number of times per second the frames of
+        the source window are read back for this mirror, or None to read back
+        every frame drawn.
+    :ivar Window __source__: The window whose frames are mirrored.
+    :ivar Window __target__: The window the frames are presented in.
+    :ivar Optional[float] __scale__: The scale the frames are drawn at, or
+        None to stretch them over the whole target window.
+    :ivar int __version__: The version of the last uploaded frame.
+    """
+
+    def __init__(self, source, target, scale=None, rate=MIRROR_RATE):
+        """
+        Initializes a new mirror.
+
+        :param Window source: The window whose frames are mirrored.
+        :param Window target: The window the frames are presented in.
+        :param Optional[float] scale: The scale the frames are drawn at, from
+            the top-left corner of the target window. If not specified, the
+            frames are stretched over the whole target window.
+        :param Optional[float] rate: The number of times per second the frames
+            of the source window are read back. If None, every frame drawn is
+            read back. Default is `MIRROR_RATE`.
+        """
+        self.uploads = 0
+        self.rate = rate
+        self.__source__ = source
+        self.__target__ = target
+        self.__scale__ = scale
+        self.__version__ = -1
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<Mirror(source target)>`.
+        """
+        return f"<Mirror({self.__source__.id} {self.__target__.id})>"
+
+    @property
+    def source(self):
+        """
+        Get the window whose frames are mirrored.
+
+        :return: The source `Window`.
+        """
+        return self.__source__
+
+    @property
+    def target(self):
+        """
+        Get the window the frames are presented in.
+
+        :return: The target `Window`.
+        """
+        return self.__target__
+
+    @property
+    def scale(self):
+        """
+        Get the scale the frames are drawn at.
+
+        :return: The scale as a float, or None if the frames are stretched
+            over the whole target window.
+        """
+        return self.__scale__
+
+    def present(self):
+        """
+        Draw the last frame read back from the source window over the whole
+        target window, uploading it first if it changed since the last upload.
+        This method is called by `Window.update` on the target window.
+
+        :return: True if the frame was uploaded, False otherwise.
+        """
+        mirrors = self.__source__.__mirrors__
+        frame = None if mirrors is None else mirrors.frame
+        if frame is None:
+            return False
+
+        pixels, size, version = frame
+        uploaded = version != self.__version__
+        target = self.__target__
+        stream = target.__mirrored__
+        if uploaded:
+            if stream is None or stream.size != size:
+                stream = StreamingTexture(target.renderer, size, TEXTURE_FORMAT)
+                target.__mirrored__ = stream
+            stream.upload(pixels)
+            self.__version__ = version
+            self.uploads += 1
+
+        if self.__scale__ is None:
+            dest = None
+        else:
+            dest = (0, 0, int(size[0] * self.__scale__), int(size[1] * self.__scale__))
+        target.fill()
+        stream.texture.draw(dstrect=dest)
+        return uploaded
+
+    def release(self):
+        """
+        Release the texture of the mirror on the renderer of the target window.
+        """
+        self.__target__.__mirrored__ = None
+        self.__version__ = -1
+
+
+class MirrorSet:
+    """
+    The mirrors of a source window and the buffer its frames are read into.
+
+    A new version of the frame is read back only when the source window was
+    drawn to since its last update, and it is read back once no matter how
+    many windows mirror it. Reading a frame back stalls the CPU until the GPU
+    has finished drawing it and copies the whole frame to system memory, so
+    frames are read back at most at the highest `Mirror.rate` of the mirrors,
+    and the frames drawn in between are not mirrored. The newest of them is
+    kept pending and read back by the first call to `publish` once the rate
+    allows it, even if the source was not drawn to since, so a source that
+    stops being drawn to does not leave its mirrors behind. A pending frame is
+    read from what the renderer of the source holds at that time, which is
+    the frame itself for headless windows.
+
+    :ivar int version: The version of the last frame read back.
+    :ivar int skipped: The number of frames drawn but not read back because of
+        the rate of the mirrors.
+    :ivar bool pending: Whether a frame skipped because of the rate of the
+        mirrors is waiting to be read back.
+    :ivar List[Mirror] __mirrors__: The mirrors of the source window.
+    :ivar Optional[bytearray] __pixels__: The last frame read back.
+    :ivar Optional[pygame.Surface] __surface__: A surface sharing
+        `__pixels__`.
+    :ivar float __last__: The time of the last read back, from
+        `time.perf_counter`.
+    """
+
+    def __init__(self):
+        """
+        Initializes a new, empty mirror set.
+        """
+        self.version = 0
+        self.skipped = 0
+        self.pending = False
+        self.__mirrors__ = []
+        self.__pixels__ = None
+        self.__surface__ = None
+        self.__last__ = 0.0
+
+    def __len__(self):
+        """
+        Get the number of mirrors.
+
+        :return: The number of windows mirroring the source window.
+        """
+        return len(self.__mirrors__)
+
+    def __iter__(self):
+        """
+        Iterate over the mirrors.
+
+        :return: An iterator over the `Mirror` objects.
+        """
+        return iter(list(self.__mirrors__))
+
+    def add(self, mirror):
+        """
+        Add a mirror to the set.
+
+        :param Mirror mirror: The mirror to add.
+        """
+        self.__mirrors__.append(mirror)
+
+    def remove(self, mirror):
+        """
+        Remove a mirror from the set, and drop the frame buffer once the set
+        is empty.
+
+        :param Mirror mirror: The mirror to remove.
+        """
+        if mirror in self.__mirrors__:
+            self.__mirrors__.remove(mirror)
+        if not self.__mirrors__:
+            self.__pixels__ = None
+            self.__surface__ = None
+
+    @property
+    def frame(self):
+        """
+        Get the last frame read back.
+
+        :return: A tuple of the pixels of the frame in `TEXTURE_FORMAT`, its
+            size and its version, or None if no frame was read back yet.
+        """
+        if self.__pixels__ is None:
+            return None
+        return (self.__pixels__, self.__surface__.get_size(), self.version)
+
+    @property
+    def interval(self):
+        """
+        Get the shortest time between two read backs allowed by the mirrors.
+
+        :return: The time in seconds, which is 0 if a mirror has no rate.
+        """
+        rates = [mirror.rate for mirror in self.__mirrors__]
+        if not rates or None in rates:
+            return 0.0
+        return 1 / max(rates)
+
+    def publish(self, window, now=None):
+        """
+        Read the current frame of the source window back if it changed and the
+        rate of the mirrors allows it, and mark the mirroring windows as drawn
+        to so they present it. A changed frame the rate does not allow is kept
+        pending and read back by a later call. This method must be called
+        before the source window is presented, or after it when only a pending
+        frame is published.
+
+        :param Window window: The source window.
+        :param Optional[float] now: The current time, from `time.perf_counter`.
+            If not specified, the current time is used.
+        :return: The number of mirrors the new frame was published to.
+        """
+        if not window.dirty and not self.pending and self.__pixels__ is not None:
+            return 0
+        if now is None:
+            now = time.perf_counter()
+        if self.__pixels__ is not None and now - self.__last__ < self.interval:
+            if window.dirty:
+                self.skipped += 1
+                self.pending = True
+            return 0
+
+        size = window.size
+        surface = self.__surface__
+        if surface is None or surface.get_size() != size:
+            self.__pixels__ = bytearray(size[0] * size[1] * TEXTURE_DEPTH)
+            surface = self.__surface__ = pygame.image.frombuffer(
+                self.__pixels__, size, TEXTURE_FORMAT
+            )
+        window.renderer.to_surface(surface)
+        self.version += 1
+        self.pending = False
+        self.__last__ = now
+
+        for mirror in self.__mirrors__:
+            mirror.target.__dirty__ = True
+        return len(self.__mirrors__)
+
+
+class MirrorMixin:
+    """
+    The mirroring methods of a `Window`.
+
+    :ivar Optional[MirrorSet] __mirrors__: The mirrors presenting the frames
+        of the window, created when another window first mirrors it.
+    :ivar Optional[Mirror] __mirror__: The mirror presenting the frames of
+        another window in the window, if any.
+    """
+
+    def __init__(self, **options):
+        """
+        Initializes the mirrors of a new window.
+
+        :param options: The options of the other parts of the window.
+        """
+        self.__mirrors__ = None
+        self.__mirror__ = None
+        super().__init__(**options)
+
+    def mirror(self, source, scale=None, rate=MIRROR_RATE):
+        """
+        Make the window present the frames of another window.
+
+        The frames of the source window are read back once when it is
+        updated after being drawn to, at most `rate` times per second, and
+        this window is marked as drawn to. The frame is uploaded once to this
+        window and drawn when it is updated, without running the drawing code
+        again. A window mirrors at most one other window at a time.
+
+        :param Window source: The window to mirror.
+        :param Optional[float] scale: The scale the frames are drawn at, from
+            the top-left corner of this window. If not specified, the frames
+            are stretched over the whole window.
+        :param Optional[float] rate: The number of times per second the frames
+            of the source window are read back. If None, every frame drawn is
+            read back. Default is `MIRROR_RATE`.
+        :return: The new `Mirror`.
+        :raises ValueError: If the window would mirror itself.
+        """
+        if source is self:
+            raise ValueError("a window cannot mirror itself")
+        self.unmirror()
+        if source.__mirrors__ is None:
+            source.__mirrors__ = MirrorSet()
+        self.__mirror__ = Mirror(source, self, scale, rate)
+        source.__mirrors__.add(self.__mirror__)
+        return self.__mirror__
+
+    def unmirror(self):
+        """
+        Stop presenting the frames of the mirrored window, if any.
+
+        :return: The removed `Mirror`, or None if the window was not mirroring
+            another window.
+        """
+        mirror = self.__mirror__
+        if mirror is not None:
+            self.__mirror__ = None
+            mirror.source.__mirrors__.remove(mirror)
+            mirror.release()
+        return mirror
+
+    def __receive__(self):
+        """
+        Draw the last frame of the mirrored window, if any.
+        """
+        if self.__mirror__ is not None:
+            self.__mirror__.present()
+
+    def __publish__(self):
+        """
+        Hand the frame of the window to the windows mirroring it, if any.
+        """
+        if self.__mirrors__:
+            self.__mirrors__.publish(self)
+
+    def __detach__(self):
+        """
+        Stop mirroring another window and stop every window mirroring the
+        window from presenting its frames.
+        """
+        super().__detach__()
+        self.unmirror()
+        if self.__mirrors__ is not None:
+            for mirror in self.__mirrors__:
+                mirror.target.unmirror()
+
+    # Getters
+    @property
+    def mirrors(self):
+        """
+        Get the mirrors presenting the frames of the window.
+
+        :return: The `MirrorSet` of the window, or None if no window has
+            mirrored it yet.
+        """
+        return self.__mirrors__
+
+    @property
+    def mirroring(self):
+        """
+        Get the mirror presenting the frames of another window in the window.
+
+        :return: The `Mirror` of the window, or None if the window does not
+            mirror another window.
+        """
+        return self.__mirror__
@@ -0,0 +1,71 @@
+from typing import Any, Iterator, List, Optional, Tuple
+
+from pygame import Surface
+
+from pygwin.window import Window
+
+MIRROR_RATE: float
+
+class Mirror:
+    uploads: int
+    rate: Optional[float]
+    __source__: Window
+    __target__: Window
+    __scale__: Optional[float]
+    __version__: int
+
+    def __init__(
+        self,
+        source: Window,
+        target: Window,
+        scale: Optional[float] = None,
+        rate: Optional[float] = ...,
+    ) -> None: ...
+    @property
+    def source(self) -> Window: ...
+    @property
+    def target(self) -> Window: ...
+    @property
+    def scale(self) -> Optional[float]: ...
+    def present(self) -> bool: ...
+    def release(self) -> None: ...
+
+class MirrorSet:
+    version: int
+    skipped: int
+    pending: bool
+    __mirrors__: List[Mirror]
+    __pixels__: Optional[bytearray]
+    __surface__: Optional[Surface]
+    __last__: float
+
+    def __init__(self) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[Mirror]: ...
+    def add(self, mirror: Mirror) -> None: ...
+    def remove(self, mirror: Mirror) -> None: ...
+    @property
+    def frame(self) -> Optional[Tuple[bytearray, Tuple[int, int], int]]: ...
+    @property
+    def interval(self) -> float: ...
+    def publish(self, window: Window, now: Optional[float] = None) -> int: ...
+
+class MirrorMixin:
+    __mirrors__: Optional[MirrorSet]
+    __mirror__: Optional[Mirror]
+
+    def __init__(self, **options: Any) -> None: ...
+    @property
+    def mirrors(self) -> Optional[MirrorSet]: ...
+    @property
+    def mirroring(self) -> Optional[Mirror]: ...
+    def mirror(
+        self,
+        source: Window,
+        scale: Optional[float] = None,
+        rate: Optional[float] = ...,
+    ) -> Mirror: ...
+    def unmirror(self) -> Optional[Mirror]: ...
+    def __receive__(self) -> None: ...
+    def __publish__(self) -> None: ...
+    def __detach__(self) -> None: ...
@@ -0,0 +1,195 @@
+"""
+This module defines a `WindowPool` class that keeps hidden `Window` objects
+alive between uses. Creating a native window and its renderer is by far the
+slowest part of opening a window, so a pool creates them ahead of time and
+opening a pooled window only costs a configuration change and a show.
+"""
+
+import time
+from collections import deque
+
+from pygwin.window import WINDOWPOS_CENTERED, Window, WindowState
+
+# Define the default maximum number of idle windows kept by a pool
+POOL_LIMIT = 4
+
+# Define the default time an idle window is kept before it is destroyed
+POOL_IDLE_TIME = 30.0
+
+# Define the configuration windows are reset to when they are released
+POOL_DEFAULTS = {
+    "title": "pygame",
+    "resizable": False,
+    "borderless": False,
+    "fullscreen": False,
+    "maximized": False,
+    "minimized": False,
+    "size": (640, 480),
+    "position": WINDOWPOS_CENTERED,
+}
+
+
+class WindowPool:
+    """
+    A pool of hidden windows ready to be shown.
+
+    Windows are handed out by `acquire` and given back by `release`, which
+    resets and hides them instead of destroying them. Released windows are
+    kept idle, most recently released first, up to `limit` windows, and idle
+    windows are destroyed once they have been idle for longer than
+    `idle_time`.
+
+    :ivar int limit: The maximum number of idle windows.
+    :ivar float idle_time: The time an idle window is kept, in seconds.
+    :ivar int hits: The number of acquisitions served by an idle window.
+    :ivar int misses: The number of acquisitions that created a window.
+    :ivar Dict[str, Any] __options__: The options new windows are created
+        with.
+    :ivar deque __idle__: The idle windows and the times they were released,
+        from the least to the most recently released.
+    :ivar Dict[int, Window] __active__: The acquired windows, indexed by
+        object identity, since a destroyed window has no SDL window ID.
+    """
+
+    def __init__(self, size=0, limit=POOL_LIMIT, idle_time=POOL_IDLE_TIME, **options):
+        """
+        Initializes a new window pool.
+
+        :param int size: The number of windows to create right away. Default
+            is 0.
+        :param int limit: The maximum number of idle windows. Default is
+            `POOL_LIMIT`.
+        :param float idle_time: The time an idle window is kept, in seconds.
+            Default is `POOL_IDLE_TIME`.
+        :param options: The options windows are created with, such as `vsync`
+            or `headless`. The configuration of each window is given to
+            `acquire` instead.
+        """
+        self.limit = limit
+        self.idle_time = idle_time
+        self.hits = 0
+        self.misses = 0
+        self.__options__ = options
+        self.__idle__ = deque()
+        self.__active__ = {}
+        self.prewarm(size)
+
+    def __len__(self):
+        """
+        Get the number of idle windows.
+
+        :return: The number of windows ready to be acquired.
+        """
+        return len(self.__idle__)
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<WindowPool(idle active)>`.
+        """
+        return f"<WindowPool({len(self.__idle__)} {len(self.__active__)})>"
+
+    @property
+    def active(self):
+        """
+        Get the number of acquired windows.
+
+        :return: The number of windows acquired and not released yet.
+        """
+        return len(self.__active__)
+
+    def prewarm(self, count):
+        """
+        Create idle windows, with their renderers, until the pool holds a
+        number of them.
+
+        :param int count: The number of idle windows to reach. It is capped
+            by `limit`.
+        :return: The number of windows created.
+        """
+        created = 0
+        now = time.monotonic()
+        while len(self.__idle__) < min(count, self.limit):
+            window = Window(**self.__options__)
+            window.create_renderer()
+            self.__idle__.append((window, now))
+            created += 1
+        return created
+
+    def acquire(self, **config):
+        """
+        Get a window from the pool, creating one if no window is idle.
+
+        The window is configured with `Window.configure` and shown, unless
+        `visible` is set to False.
+
+        :param config: The configuration of the window, with the same names
+            and meanings as the arguments of `Window.__init__`.
+        :return: The acquired `Window`.
+        :raises AttributeError: If an invalid parameter is specified.
+        """
+        self.evict()
+        config.setdefault("visible", True)
+        for key in config:
+            if key not in WindowState.__slots__:
+                raise AttributeError(f"'Window' type has no attribute '{key}'")
+
+        if self.__idle__:
+            window = self.__idle__.pop()[0]
+            self.hits += 1
+        else:
+            window = Window(**self.__options__)
+            self.misses += 1
+        self.__active__[id(window)] = window
+        window.configure(**config)
+        return window
+
+    def release(self, window):
+        """
+        Give a window back to the pool.
+
+        The window is reset with `Window.reset`, which hides it, detaches
+        everything attached to it, drops its cached textures and resets its
+        configuration. It is destroyed instead if the pool already holds
+        `limit` idle windows. A window that was destroyed while acquired is
+        only forgotten.
+
+        :param Window window: The window to release.
+        :raises KeyError: If the window was not acquired from this pool.
+        """
+        if self.__active__.pop(id(window), None) is not window:
+            raise KeyError(window.id)
+
+        if window.closed:
+            return
+        if len(self.__idle__) >= self.limit:
+            window.destroy()
+            return
+
+        window.reset(**POOL_DEFAULTS)
+        self.__idle__.append((window, time.monotonic()))
+        self.evict()
+
+    def evict(self, now=None):
+        """
+        Destroy the windows that have been idle for longer than `idle_time`.
+
+        :param Optional[float] now: The current time, from `time.monotonic`.
+            If not specified, the current time is used.
+        :return: The number of windows destroyed.
+        """
+        if now is None:
+            now = time.monotonic()
+        count = 0
+        while self.__idle__ and now - self.__idle__[0][1] > self.idle_time:
+            self.__idle__.popleft()[0].destroy()
+            count += 1
+        return count
+
+    def clear(self):
+        """
+        Destroy every idle window. Acquired windows are left untouched.
+        """
+        while self.__idle__:
+            self.__idle__.popleft()[0].destroy()
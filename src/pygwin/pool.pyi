@@ -0,0 +1,32 @@
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from pygwin.window import Window
+
+POOL_LIMIT: int
+POOL_IDLE_TIME: float
+POOL_DEFAULTS: Dict[str, Any]
+
+class WindowPool:
+    limit: int
+    idle_time: float
+    hits: int
+    misses: int
+    __options__: Dict[str, Any]
+    __idle__: Deque[Tuple[Window, float]]
+    __active__: Dict[int, Window]
+
+    def __init__(
+        self,
+        size: int = 0,
+        limit: int = ...,
+        idle_time: float = ...,
+        **options: Any,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def active(self) -> int: ...
+    def prewarm(self, count: int) -> int: ...
+    def acquire(self, **config: Any) -> Window: ...
+    def release(self, window: Window) -> None: ...
+    def evict(self, now: Optional[float] = None) -> int: ...
+    def clear(self) -> None: ...
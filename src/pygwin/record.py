@@ -0,0 +1,317 @@
+"""
+This module defines a `FrameRecorder` class that records the frames presented
+by a `Window` to disk. Frames are read back into a preallocated ring of
+buffers on the main thread and written by a background thread, so the frame
+loop never waits for the disk: when the writer falls behind and the ring is
+full, new frames are dropped instead. The `RecordingMixin` class gives
+`Window` its recording methods.
+"""
+
+import mmap
+import os
+import queue
+import threading
+
+import pygame
+
+from pygwin.texture import TEXTURE_DEPTH, TEXTURE_FORMAT
+
+# Define the recording formats
+RECORD_RAW = "raw"
+RECORD_PNG = "png"
+
+# Define the default number of frame buffers in the ring of a recorder
+RECORD_CAPACITY = 8
+
+# Define the number of frames a raw recording file grows by at once
+RECORD_CHUNK = 64
+
+
+class FrameRecorder:
+    """
+    A recorder writing frames to disk from a background thread.
+
+    With the `RECORD_RAW` format, frames are appended to a single memory-mapped
+    file as tightly packed `TEXTURE_FORMAT` pixels, so the recording can be
+    read back with `numpy.memmap(path, numpy.uint8).reshape(-1, height, width,
+    4)`. The file grows by `RECORD_CHUNK` frames at a time and is truncated to
+    the written frames when the recording stops. With the `RECORD_PNG` format,
+    `path` is a directory and each frame is saved as `frame_NNNNNN.png`, where
+    `NNNNNN` is the number of the captured frame, so dropped frames show up as
+    gaps in the sequence.
+
+    :ivar int frames: The number of frames captured, including dropped ones.
+    :ivar int written: The number of frames written to disk.
+    :ivar int dropped: The number of frames dropped because the ring was full
+        or the frame did not have the size of the recording.
+    :ivar Tuple[int, int] __size__: The width and height of the frames.
+    :ivar str __path__: The file or directory the frames are written to.
+    :ivar str __mode__: The recording format.
+    :ivar List[bytearray] __buffers__: The ring of frame buffers.
+    :ivar List[pygame.Surface] __surfaces__: Surfaces sharing `__buffers__`.
+    :ivar queue.Queue __free__: The indices of the buffers that can be
+        captured into.
+    :ivar queue.Queue __ready__: The indices and numbers of the frames
+        waiting to be written.
+    :ivar Optional[BinaryIO] __file__: The raw recording file.
+    :ivar Optional[mmap.mmap] __map__: The memory map of the raw recording
+        file.
+    :ivar Optional[Exception] __error__: The error that stopped the writer.
+    :ivar threading.Thread __thread__: The writer thread.
+    """
+
+    def __init__(self, size, path, fmt=RECORD_RAW, capacity=RECORD_CAPACITY):
+        """
+        Initializes a new recorder and starts its writer thread.
+
+        :param Tuple[int, int] size: The width and height of the frames.
+        :param str path: The file to write raw frames to, or the directory to
+            write PNG frames to. Directories are created if needed.
+        :param str fmt: The recording format, either `RECORD_RAW` or
+            `RECORD_PNG`. Default is `RECORD_RAW`.
+        :param int capacity: The number of frame buffers in the ring. Default
+            is `RECORD_CAPACITY`.
+        :raises ValueError: If any parameter has an invalid value.
+        """
+        if fmt not in (RECORD_RAW, RECORD_PNG):
+            raise ValueError(f"invalid recording format '{fmt}'")
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+
+        width, height = size
+        self.__size__ = (width, height)
+        self.__path__ = path
+        self.__mode__ = fmt
+        self.__buffers__ = [
+            bytearray(width * height * TEXTURE_DEPTH) for _ in range(capacity)
+        ]
+        self.__surfaces__ = [
+            pygame.image.frombuffer(buffer, self.__size__, TEXTURE_FORMAT)
+            for buffer in self.__buffers__
+        ]
+        self.__free__ = queue.Queue()
+        for index in range(capacity):
+            self.__free__.put(index)
+        self.__ready__ = queue.Queue()
+        self.__file__ = None
+        self.__map__ = None
+        self.__error__ = None
+        self.frames = 0
+        self.written = 0
+        self.dropped = 0
+
+        if fmt == RECORD_RAW:
+            self.__file__ = open(path, "w+b")  # pylint: disable=R1732
+        else:
+            os.makedirs(path, exist_ok=True)
+
+        self.__thread__ = threading.Thread(
+            target=self.__write__, name="pygwin-recorder", daemon=True
+        )
+        self.__thread__.start()
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<FrameRecorder(path written/frames)>`.
+        """
+        return f"<FrameRecorder({self.__path__} {self.written}/{self.frames})>"
+
+    @property
+    def size(self):
+        """
+        Get the size of the recorded frames.
+
+        :return: The width and height of the frames in pixels.
+        """
+        return self.__size__
+
+    @property
+    def path(self):
+        """
+        Get the destination of the recording.
+
+        :return: The file or directory the frames are written to.
+        """
+        return self.__path__
+
+    @property
+    def format(self):
+        """
+        Get the recording format.
+
+        :return: Either `RECORD_RAW` or `RECORD_PNG`.
+        """
+        return self.__mode__
+
+    @property
+    def recording(self):
+        """
+        Get whether the recorder still accepts frames.
+
+        :return: True if the writer thread is running, False otherwise.
+        """
+        return self.__thread__.is_alive()
+
+    def capture(self, renderer, size=None):
+        """
+        Read the current frame of a renderer back into the ring. This method
+        must be called from the main thread, before the frame is presented.
+
+        :param sdl.Renderer renderer: The renderer to read the frame from.
+        :param Optional[Tuple[int, int]] size: The size of the frame. If it is
+            not the size of the recording, the frame is dropped. If not
+            specified, the frame is assumed to have the right size.
+        :return: True if the frame was captured, False if it was dropped.
+        """
+        self.frames += 1
+        if size is not None and tuple(size) != self.__size__:
+            self.dropped += 1
+            return False
+        try:
+            index = self.__free__.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return False
+
+        renderer.to_surface(self.__surfaces__[index])
+        self.__ready__.put((index, self.frames - 1))
+        return True
+
+    def stop(self):
+        """
+        Write the frames left in the ring, stop the writer thread and close
+        the recording.
+
+        :return: The number of frames written to disk.
+        :raises OSError: If the writer thread failed to write a frame.
+        """
+        if self.__thread__.is_alive():
+            self.__ready__.put(None)
+            self.__thread__.join()
+
+        if self.__file__ is not None:
+            if self.__map__ is not None:
+                self.__map__.close()
+                self.__map__ = None
+            self.__file__.truncate(self.written * len(self.__buffers__[0]))
+            self.__file__.close()
+            self.__file__ = None
+
+        if self.__error__ is not None:
+            error, self.__error__ = self.__error__, None
+            raise error
+        return self.written
+
+    def __write__(self):
+        """
+        Write the captured frames until the recorder is stopped. This is the
+        target of the writer thread.
+        """
+        while True:
+            item = self.__ready__.get()
+            if item is None:
+                return
+
+            index, number = item
+            try:
+                if self.__mode__ == RECORD_RAW:
+                    self.__append__(self.__buffers__[index])
+                else:
+                    name = os.path.join(self.__path__, f"frame_{number:06d}.png")
+                    pygame.image.save(self.__surfaces__[index], name)
+                self.written += 1
+            except (OSError, ValueError, pygame.error) as error:
+                self.__error__ = error
+                return
+            finally:
+                self.__free__.put(index)
+
+    def __append__(self, buffer):
+        """
+        Append a frame to the raw recording file, growing it if needed.
+
+        :param bytearray buffer: The frame to append.
+        """
+        frame = len(buffer)
+        offset = self.written * frame
+        if self.__map__ is None or offset + frame > len(self.__map__):
+            if self.__map__ is not None:
+                self.__map__.close()
+            length = offset + frame * RECORD_CHUNK
+            self.__file__.truncate(length)
+            self.__map__ = mmap.mmap(self.__file__.fileno(), length)
+        self.__map__[offset : offset + frame] = buffer
+
+
+class RecordingMixin:
+    """
+    The recording methods of a `Window`.
+
+    :ivar Optional[FrameRecorder] __recorder__: The recorder of the window,
+        while it is recording.
+    """
+
+    def __init__(self, **options):
+        """
+        Initializes the recording state of a new window.
+
+        :param options: The options of the other parts of the window.
+        """
+        self.__recorder__ = None
+        super().__init__(**options)
+
+    def start_recording(self, path, fmt=RECORD_RAW, capacity=RECORD_CAPACITY):
+        """
+        Start recording the frames presented by the window to disk.
+
+        Each call to `update` reads the frame back into a preallocated ring of
+        buffers, and a background thread writes the buffers to disk. When the
+        disk falls behind and the ring is full, frames are dropped instead of
+        stalling the frame loop. Frames are recorded at the size the window
+        had when the recording started.
+
+        :param str path: The file to write raw frames to, or the directory to
+            write PNG frames to.
+        :param str fmt: The recording format, either `RECORD_RAW` or
+            `RECORD_PNG`. Default is `RECORD_RAW`.
+        :param int capacity: The number of frame buffers in the ring. Default
+            is `RECORD_CAPACITY`.
+        :return: The `FrameRecorder` of the window.
+        :raises RuntimeError: If the window is already recording.
+        :raises ValueError: If any parameter has an invalid value.
+        """
+        if self.__recorder__ is not None:
+            raise RuntimeError("window is already recording")
+        self.__recorder__ = FrameRecorder(self.size, path, fmt, capacity)
+        return self.__recorder__
+
+    def stop_recording(self):
+        """
+        Stop recording the frames of the window, waiting for the frames left
+        in the ring to be written.
+
+        :return: The `FrameRecorder` that recorded the frames, or None if the
+            window was not recording.
+        :raises OSError: If a frame could not be written.
+        """
+        recorder = self.__recorder__
+        if recorder is not None:
+            self.__recorder__ = None
+            recorder.stop()
+        return recorder
+
+    def __capture__(self):
+        """
+        Capture the frame about to be presented, while recording.
+        """
+        if self.__recorder__ is not None:
+            self.__recorder__.capture(self.renderer, self.size)
+
+    def __detach__(self):
+        """
+        Stop the recording of the window, if any.
+        """
+        super().__detach__()
+        self.stop_recording()
@@ -0,0 +1,61 @@
+import mmap
+import queue
+import threading
+from typing import Any, BinaryIO, List, Optional, Tuple
+
+from pygame import Surface
+from pygame import _sdl2 as sdl
+
+RECORD_RAW: str
+RECORD_PNG: str
+RECORD_CAPACITY: int
+RECORD_CHUNK: int
+
+class FrameRecorder:
+    frames: int
+    written: int
+    dropped: int
+    __size__: Tuple[int, int]
+    __path__: str
+    __mode__: str
+    __buffers__: List[bytearray]
+    __surfaces__: List[Surface]
+    __free__: queue.Queue[int]
+    __ready__: queue.Queue[Optional[Tuple[int, int]]]
+    __file__: Optional[BinaryIO]
+    __map__: Optional[mmap.mmap]
+    __error__: Optional[Exception]
+    __thread__: threading.Thread
+
+    def __init__(
+        self,
+        size: Tuple[int, int],
+        path: str,
+        fmt: str = ...,
+        capacity: int = ...,
+    ) -> None: ...
+    @property
+    def size(self) -> Tuple[int, int]: ...
+    @property
+    def path(self) -> str: ...
+    @property
+    def format(self) -> str: ...
+    @property
+    def recording(self) -> bool: ...
+    def capture(
+        self, renderer: sdl.Renderer, size: Optional[Tuple[int, int]] = None
+    ) -> bool: ...
+    def stop(self) -> int: ...
+    def __write__(self) -> None: ...
+    def __append__(self, buffer: bytearray) -> None: ...
+
+class RecordingMixin:
+    __recorder__: Optional[FrameRecorder]
+
+    def __init__(self, **options: Any) -> None: ...
+    def start_recording(
+        self, path: str, fmt: str = ..., capacity: int = ...
+    ) -> FrameRecorder: ...
+    def stop_recording(self) -> Optional[FrameRecorder]: ...
+    def __capture__(self) -> None: ...
+    def __detach__(self) -> None: ...
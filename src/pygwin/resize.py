@@ -0,0 +1,146 @@
+"""
+This module defines a `ResizeDebouncer` class that defers the work a `Window`
+does when it is resized until the user stops dragging it. While a resize is
+in progress, the buffers of the window keep their size and are scaled to fit
+the window; they are allocated again once, when the size has not changed for
+a short delay.
+
+It also defines a `coalesce` function that keeps only the latest geometry
+event of each window in a batch of events, so a drag costs one event per
+frame instead of one per mouse motion.
+"""
+
+import time
+
+import pygame
+
+# Define the events describing the geometry of a window
+GEOMETRY_EVENTS = frozenset(
+    (pygame.WINDOWMOVED, pygame.WINDOWRESIZED, pygame.WINDOWSIZECHANGED)
+)
+
+# Define the events starting or extending a resize
+RESIZE_EVENTS = frozenset((pygame.WINDOWRESIZED, pygame.WINDOWSIZECHANGED))
+
+# Define the default time the size of a window must hold before it is settled
+RESIZE_SETTLE_TIME = 0.2
+
+
+def coalesce(events):
+    """
+    Drop the geometry events superseded by a later event of the same type and
+    window.
+
+    Move and resize events only carry the new geometry of their window, so
+    the last one of each type is enough to bring the window up to date. The
+    events that are kept stay in their original order.
+
+    :param List[pygame.event.Event] events: The events to coalesce.
+    :return: The list of events without the superseded geometry events. It is
+        `events` itself when nothing was dropped.
+    """
+    latest = {}
+    count = 0
+    for index, event in enumerate(events):
+        if event.type in GEOMETRY_EVENTS:
+            source = getattr(event, "window", None)
+            latest[(event.type, None if source is None else source.id)] = index
+            count += 1
+    if count == len(latest):
+        return events
+
+    kept = set(latest.values())
+    return [
+        event
+        for index, event in enumerate(events)
+        if index in kept or event.type not in GEOMETRY_EVENTS
+    ]
+
+
+class ResizeDebouncer:
+    """
+    The resize debouncing state of a window.
+
+    :ivar float delay: The time the size of the window must hold before the
+        resize is settled, in seconds.
+    :ivar Optional[Callable] callback: The function called when a resize is
+        settled.
+    :ivar Tuple[int, int] size: The size the buffers of the window are
+        allocated at, which is the size of the last settled resize.
+    :ivar int settles: The number of resizes that were settled.
+    :ivar bool __pending__: Whether a resize is in progress.
+    :ivar float __last__: The time of the last resize event, from
+        `time.perf_counter`.
+    """
+
+    def __init__(self, size, delay=RESIZE_SETTLE_TIME, callback=None):
+        """
+        Initializes a new resize debouncer.
+
+        :param Tuple[int, int] size: The current size of the window.
+        :param float delay: The time the size of the window must hold before
+            the resize is settled, in seconds. Default is
+            `RESIZE_SETTLE_TIME`.
+        :param Optional[Callable] callback: The function called as
+            `callback(window, size)` when a resize is settled. Default is
+            None.
+        """
+        self.delay = delay
+        self.callback = callback
+        self.size = size
+        self.settles = 0
+        self.__pending__ = False
+        self.__last__ = 0.0
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<ResizeDebouncer(size pending)>`.
+        """
+        return f"<ResizeDebouncer({self.size} {self.__pending__})>"
+
+    @property
+    def pending(self):
+        """
+        Get whether a resize is in progress.
+
+        :return: True if the window was resized and the resize is not settled
+            yet, False otherwise.
+        """
+        return self.__pending__
+
+    def apply_event(self, event):
+        """
+        Update the debouncer from an SDL window event. Other events are
+        ignored.
+
+        :param pygame.event.Event event: The event to apply.
+        :return: True if the event started a resize, False otherwise.
+        """
+        if event.type not in RESIZE_EVENTS:
+            return False
+        started = not self.__pending__
+        self.__pending__ = True
+        self.__last__ = time.perf_counter()
+        return started
+
+    def poll(self, size, now=None):
+        """
+        Settle the resize in progress if the size has held long enough.
+
+        :param Tuple[int, int] size: The current size of the window.
+        :param Optional[float] now: The current time, from
+            `time.perf_counter`. If not specified, the current time is used.
+        :return: True if the resize was settled, False otherwise.
+        """
+        if not self.__pending__:
+            return False
+        if now is None:
+            now = time.perf_counter()
+        if now - self.__last__ < self.delay:
+            return False
+        self.__pending__ = False
+        self.size = size
+        self.settles += 1
+        return True
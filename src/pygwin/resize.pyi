@@ -0,0 +1,28 @@
+from typing import Any, Callable, FrozenSet, List, Optional, Tuple
+
+from pygame.event import Event
+
+GEOMETRY_EVENTS: FrozenSet[int]
+RESIZE_EVENTS: FrozenSet[int]
+RESIZE_SETTLE_TIME: float
+
+def coalesce(events: List[Event]) -> List[Event]: ...
+
+class ResizeDebouncer:
+    delay: float
+    callback: Optional[Callable[[Any, Tuple[int, int]], object]]
+    size: Tuple[int, int]
+    settles: int
+    __pending__: bool
+    __last__: float
+
+    def __init__(
+        self,
+        size: Tuple[int, int],
+        delay: float = ...,
+        callback: Optional[Callable[[Any, Tuple[int, int]], object]] = None,
+    ) -> None: ...
+    @property
+    def pending(self) -> bool: ...
+    def apply_event(self, event: Event) -> bool: ...
+    def poll(self, size: Tuple[int, int], now: Optional[float] = None) -> bool: ...
@@ -0,0 +1,134 @@
+"""
+This module defines a `ResolutionController` class that drives the dynamic
+resolution scaling of a `Window`. Given the time spent working on each frame,
+it lowers the internal resolution of the window when frames run over budget
+and raises it back when there is headroom, trading sharpness for a steady
+frame rate.
+"""
+
+# Define the default smallest resolution scale a controller may choose
+SCALE_MINIMUM = 0.5
+
+# Define the default amount a controller changes the resolution scale by
+SCALE_STEP = 0.1
+
+
+class ResolutionController:
+    """
+    A frame time controller choosing the resolution scale of a window.
+
+    The controller keeps an exponential moving average of the frame times it
+    is given. When the average exceeds the frame budget, the scale is lowered
+    by one step; when it falls below `headroom` times the budget, the scale is
+    raised by one step. After each change, the average is reset and the
+    controller waits `cooldown` frames, so the new resolution is measured
+    before it is changed again.
+
+    :ivar float frame_time: The frame time budget, in seconds.
+    :ivar float minimum: The smallest resolution scale.
+    :ivar float maximum: The largest resolution scale.
+    :ivar float step: The amount the scale changes by at once.
+    :ivar float headroom: The fraction of the budget the average must fall
+        below before the scale is raised.
+    :ivar int cooldown: The number of frames to wait after each change.
+    :ivar float smoothing: The weight of the newest frame time in the
+        average, between 0 and 1.
+    :ivar float scale: The current resolution scale.
+    :ivar Optional[float] average: The average frame time since the last
+        change, or None if no frame has been measured yet.
+    :ivar int changes: The number of times the scale has changed.
+    :ivar int __wait__: The number of frames left before the next change.
+    """
+
+    def __init__(
+        self,
+        frame_time=1 / 60,
+        minimum=SCALE_MINIMUM,
+        maximum=1.0,
+        step=SCALE_STEP,
+        headroom=0.75,
+        cooldown=10,
+        smoothing=0.2,
+    ):
+        """
+        Initializes a new resolution controller.
+
+        :param float frame_time: The frame time budget, in seconds. Default is
+            1/60.
+        :param float minimum: The smallest resolution scale. Default is
+            `SCALE_MINIMUM`.
+        :param float maximum: The largest resolution scale. Default is 1.0.
+        :param float step: The amount the scale changes by at once. Default is
+            `SCALE_STEP`.
+        :param float headroom: The fraction of the budget the average must
+            fall below before the scale is raised. Default is 0.75.
+        :param int cooldown: The number of frames to wait after each change.
+            Default is 10.
+        :param float smoothing: The weight of the newest frame time in the
+            average. Default is 0.2.
+        :raises ValueError: If any parameter has an invalid value.
+        """
+        if not 0 < minimum <= maximum <= 1:
+            raise ValueError("scales must satisfy 0 < minimum <= maximum <= 1")
+        if frame_time <= 0:
+            raise ValueError("frame_time must be positive")
+
+        self.frame_time = frame_time
+        self.minimum = minimum
+        self.maximum = maximum
+        self.step = step
+        self.headroom = headroom
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self.scale = maximum
+        self.average = None
+        self.changes = 0
+        self.__wait__ = 0
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<ResolutionController(scale budget)>`.
+        """
+        return f"<ResolutionController({self.scale:.2f} {self.frame_time:.6f})>"
+
+    def record(self, frame_time):
+        """
+        Record the time spent working on a frame and choose the next scale.
+
+        :param float frame_time: The time spent working on the frame, in
+            seconds, excluding the time spent waiting for the next frame.
+        :return: The resolution scale to render the next frame at.
+        """
+        average = self.average
+        if average is None:
+            average = frame_time
+        else:
+            average += self.smoothing * (frame_time - average)
+        self.average = average
+
+        if self.__wait__ > 0:
+            self.__wait__ -= 1
+            return self.scale
+
+        scale = self.scale
+        if average > self.frame_time:
+            scale = max(self.minimum, round(scale - self.step, 6))
+        elif average < self.frame_time * self.headroom:
+            scale = min(self.maximum, round(scale + self.step, 6))
+
+        if scale != self.scale:
+            self.scale = scale
+            self.average = None
+            self.changes += 1
+            self.__wait__ = self.cooldown
+        return scale
+
+    def reset(self):
+        """
+        Go back to the largest scale and forget the measured frame times.
+        """
+        self.scale = self.maximum
+        self.average = None
+        self.__wait__ = 0
@@ -0,0 +1,30 @@
+from typing import Optional
+
+SCALE_MINIMUM: float
+SCALE_STEP: float
+
+class ResolutionController:
+    frame_time: float
+    minimum: float
+    maximum: float
+    step: float
+    headroom: float
+    cooldown: int
+    smoothing: float
+    scale: float
+    average: Optional[float]
+    changes: int
+    __wait__: int
+
+    def __init__(
+        self,
+        frame_time: float = ...,
+        minimum: float = ...,
+        maximum: float = 1.0,
+        step: float = ...,
+        headroom: float = 0.75,
+        cooldown: int = 10,
+        smoothing: float = 0.2,
+    ) -> None: ...
+    def record(self, frame_time: float) -> float: ...
+    def reset(self) -> None: ...
@@ -0,0 +1,376 @@
+"""
+This module defines a `WindowSession` class that describes many windows up
+front without creating them. Each window of a session is a `LazyWindow`
+proxy, which holds the configuration of the window and only creates the
+native window the first time it is shown or used. A session is loaded from
+and saved to a JSON file, and the geometry of its windows is saved as it was
+last seen, so windows reopen where the user left them.
+"""
+
+import json
+
+from pygwin.window import WINDOWPOS_CENTERED, Window, WindowState
+
+# Define the options of a window that are only given to its constructor
+WINDOW_OPTIONS = (
+    "vsync",
+    "accelerated",
+    "target_texture",
+    "texture_budget",
+    "headless",
+)
+
+# Define the configuration of a window that has not been configured, which
+# `Window` centers on the screen
+WINDOW_DEFAULTS = WindowState(position=WINDOWPOS_CENTERED).snapshot()
+
+# Define the version of the session file format
+SESSION_VERSION = 1
+
+
+class LazyWindow:
+    """
+    A proxy of a window that is created on first use.
+
+    Until the window is created, the configuration properties of the proxy,
+    such as `title`, `size` or `position`, read and write its configuration.
+    Showing the proxy, or using anything else of `Window` on it, such as
+    `fill` or `renderer`, creates the window with that configuration and
+    forwards the call to it.
+
+    :ivar str name: The name of the window in its session.
+    :ivar Dict[str, Any] __config__: The configuration of the window, with the
+        same names and meanings as the arguments of `Window.__init__`.
+    :ivar Optional[Window] __window__: The window, or None if it has not been
+        created yet.
+    """
+
+    def __init__(self, name, **config):
+        """
+        Initializes a new window proxy.
+
+        :param str name: The name of the window in its session.
+        :param config: The configuration of the window, with the same names and
+            meanings as the arguments of `Window.__init__`.
+        :raises AttributeError: If an invalid parameter is specified.
+        """
+        for key in config:
+            if key not in WindowState.__slots__ and key not in WINDOW_OPTIONS:
+                raise AttributeError(f"'Window' type has no attribute '{key}'")
+
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "__config__", config)
+        object.__setattr__(self, "__window__", None)
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<LazyWindow(name materialized)>`.
+        """
+        return f"<LazyWindow({self.name} {self.__window__ is not None})>"
+
+    def __getattr__(self, name):
+        """
+        Get an attribute of the window.
+
+        The configuration properties are read from the configuration of the
+        proxy until the window is created. Any other attribute creates the
+        window.
+
+        :param str name: The name of the attribute.
+        :return: The value of the attribute.
+        :raises AttributeError: If the window has no such attribute.
+        """
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if self.__window__ is None and name in WindowState.__slots__:
+            return self.__config__.get(name, WINDOW_DEFAULTS[name])
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name, value):
+        """
+        Set an attribute of the window.
+
+        The configuration properties are written to the configuration of the
+        proxy until the window is created, except for showing the window,
+        which creates it. Any other attribute creates the window.
+
+        :param str name: The name of the attribute.
+        :param Any value: The new value of the attribute.
+        """
+        if self.__window__ is None and name in WindowState.__slots__:
+            self.__config__[name] = value
+            if name == "visible" and value:
+                self.materialize()
+            return
+        setattr(self.materialize(), name, value)
+
+    @property
+    def materialized(self):
+        """
+        Get whether the window has been created.
+
+        :return: True if the native window exists, False otherwise.
+        """
+        return self.__window__ is not None
+
+    @property
+    def window(self):
+        """
+        Get the window, creating it if needed.
+
+        :return: The `Window` of the proxy.
+        """
+        return self.materialize()
+
+    def materialize(self):
+        """
+        Create the window with the configuration of the proxy, if it has not
+        been created yet.
+
+        :return: The `Window` of the proxy.
+        """
+        window = self.__window__
+        if window is None:
+            window = Window(**self.__config__)
+            object.__setattr__(self, "__window__", window)
+        return window
+
+    def configure(self, **changes):
+        """
+        Apply many changes to the configuration of the window at once.
+
+        Until the window is created, the changes are only recorded, unless
+        they show the window.
+
+        :param changes: The new values of the properties to change, with the
+            same names and meanings as the arguments of `Window.__init__`.
+        :raises AttributeError: If an invalid parameter is specified.
+        """
+        if self.__window__ is not None or changes.get("visible"):
+            self.materialize().configure(**changes)
+            return
+
+        for key in changes:
+            if key not in WindowState.__slots__:
+                raise AttributeError(f"'Window' type has no attribute '{key}'")
+        self.__config__.update(changes)
+
+    def show(self):
+        """
+        Make the window visible, creating it if needed.
+        """
+        self.configure(visible=True)
+
+    def hide(self):
+        """
+        Hide the window. A window that has not been created stays uncreated.
+        """
+        self.configure(visible=False)
+
+    def spec(self):
+        """
+        Get the configuration of the window as it was last seen.
+
+        Once the window has been created, its current configuration, including
+        geometry changed by the user, replaces the recorded one.
+
+        :return: A dictionary with the same names and meanings as the
+            arguments of `Window.__init__`.
+        """
+        config = dict(self.__config__)
+        window = self.__window__
+        if window is not None:
+            config.update(window.snapshot())
+        return config
+
+    def destroy(self):
+        """
+        Destroy the window, keeping its last configuration. The window is
+        created again the next time it is shown or used.
+        """
+        window = self.__window__
+        if window is None:
+            return
+        object.__setattr__(self, "__config__", self.spec())
+        object.__setattr__(self, "__window__", None)
+        window.destroy()
+
+
+class WindowSession:
+    """
+    A set of named windows described up front and created on demand.
+
+    :ivar Dict[str, LazyWindow] __windows__: The windows of the session,
+        indexed by name, in the order they were added.
+    """
+
+    def __init__(self, specs=None):
+        """
+        Initializes a new window session.
+
+        :param Optional[Dict[str, Dict[str, Any]]] specs: The configuration of
+            each window of the session, indexed by name. No window is created.
+        :raises AttributeError: If a configuration has an invalid parameter.
+        """
+        self.__windows__ = {}
+        for name, config in (specs or {}).items():
+            self.add(name, **config)
+
+    def __len__(self):
+        """
+        Get the number of windows of the session.
+
+        :return: The number of windows, created or not.
+        """
+        return len(self.__windows__)
+
+    def __iter__(self):
+        """
+        Iterate over the windows of the session.
+
+        :return: An iterator over the `LazyWindow` proxies, in the order they
+            were added.
+        """
+        return iter(list(self.__windows__.values()))
+
+    def __contains__(self, name):
+        """
+        Check whether the session has a window.
+
+        :param str name: The name of the window.
+        :return: True if the session has a window with this name, False
+            otherwise.
+        """
+        return name in self.__windows__
+
+    def __getitem__(self, name):
+        """
+        Get a window of the session by name.
+
+        :param str name: The name of the window.
+        :return: The `LazyWindow` with this name.
+        :raises KeyError: If the session has no window with this name.
+        """
+        return self.__windows__[name]
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<WindowSession(materialized/count)>`.
+        """
+        return f"<WindowSession({self.materialized}/{len(self.__windows__)})>"
+
+    @property
+    def materialized(self):
+        """
+        Get the number of windows that have been created.
+
+        :return: The number of windows of the session with a native window.
+        """
+        return sum(window.materialized for window in self.__windows__.values())
+
+    def add(self, name, **config):
+        """
+        Describe a new window. The window is not created.
+
+        :param str name: The name of the window.
+        :param config: The configuration of the window, with the same names and
+            meanings as the arguments of `Window.__init__`.
+        :return: The `LazyWindow` of the window.
+        :raises ValueError: If the session already has a window with this name.
+        :raises AttributeError: If an invalid parameter is specified.
+        """
+        if name in self.__windows__:
+            raise ValueError(f"window '{name}' already exists")
+        window = self.__windows__[name] = LazyWindow(name, **config)
+        return window
+
+    def remove(self, name):
+        """
+        Remove a window from the session, destroying it if it was created.
+
+        :param str name: The name of the window.
+        :raises KeyError: If the session has no window with this name.
+        """
+        self.__windows__.pop(name).destroy()
+
+    def open(self):
+        """
+        Create the windows of the session that are configured as visible.
+
+        :return: The number of windows that were created.
+        """
+        count = 0
+        for window in self.__windows__.values():
+            if not window.materialized and window.visible:
+                window.materialize()
+                count += 1
+        return count
+
+    def close(self):
+        """
+        Destroy every window of the session that was created, keeping their
+        last configuration.
+        """
+        for window in self.__windows__.values():
+            window.destroy()
+
+    def to_dict(self):
+        """
+        Get the description of the session.
+
+        :return: A JSON serializable dictionary holding the format version and
+            the configuration of each window as it was last seen.
+        """
+        return {
+            "version": SESSION_VERSION,
+            "windows": {
+                name: window.spec() for name, window in self.__windows__.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create a session from its description.
+
+        :param Dict[str, Any] data: A description returned by `to_dict`.
+        :return: A new `WindowSession`, with no window created.
+        :raises ValueError: If the description has an unsupported version.
+        :raises AttributeError: If a configuration has an invalid parameter.
+        """
+        if data.get("version") != SESSION_VERSION:
+            raise ValueError(f"unsupported session version {data.get('version')}")
+
+        specs = {}
+        for name, config in data["windows"].items():
+            config = dict(config)
+            for key in ("size", "position"):
+                if isinstance(config.get(key), list):
+                    config[key] = tuple(config[key])
+            specs[name] = config
+        return cls(specs)
+
+    def save(self, path):
+        """
+        Save the description of the session to a JSON file.
+
+        :param Union[str, os.PathLike] path: The path of the file.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a session from a JSON file written by `save`.
+
+        :param Union[str, os.PathLike] path: The path of the file.
+        :return: A new `WindowSession`, with no window created.
+        :raises ValueError: If the file has an unsupported version.
+        """
+        with open(path, encoding="utf-8") as file:
+            return cls.from_dict(json.load(file))
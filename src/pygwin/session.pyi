@@ -0,0 +1,48 @@
+import os
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from pygwin.window import Window
+
+WINDOW_OPTIONS: Tuple[str, ...]
+WINDOW_DEFAULTS: Dict[str, Any]
+SESSION_VERSION: int
+
+class LazyWindow:
+    name: str
+    __config__: Dict[str, Any]
+    __window__: Optional[Window]
+
+    def __init__(self, name: str, **config: Any) -> None: ...
+    def __getattr__(self, name: str) -> Any: ...
+    def __setattr__(self, name: str, value: Any) -> None: ...
+    @property
+    def materialized(self) -> bool: ...
+    @property
+    def window(self) -> Window: ...
+    def materialize(self) -> Window: ...
+    def configure(self, **changes: Any) -> None: ...
+    def show(self) -> None: ...
+    def hide(self) -> None: ...
+    def spec(self) -> Dict[str, Any]: ...
+    def destroy(self) -> None: ...
+
+class WindowSession:
+    __windows__: Dict[str, LazyWindow]
+
+    def __init__(self, specs: Optional[Dict[str, Dict[str, Any]]] = None) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[LazyWindow]: ...
+    def __contains__(self, name: str) -> bool: ...
+    def __getitem__(self, name: str) -> LazyWindow: ...
+    @property
+    def materialized(self) -> int: ...
+    def add(self, name: str, **config: Any) -> LazyWindow: ...
+    def remove(self, name: str) -> None: ...
+    def open(self) -> int: ...
+    def close(self) -> None: ...
+    def to_dict(self) -> Dict[str, Any]: ...
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> WindowSession: ...
+    def save(self, path: Union[str, os.PathLike[str]]) -> None: ...
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike[str]]) -> WindowSession: ...
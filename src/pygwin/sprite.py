@@ -0,0 +1,220 @@
+"""
+This module defines a `SpriteBatch` class that collects sprite draws for a
+`Window` and submits them in bulk. Draws are grouped by texture and blend
+mode before they are sent to the renderer, so the blend mode of each texture
+is changed once per group instead of once per sprite, and the draws of a group
+are submitted without running Python code for each of them.
+"""
+
+from collections import deque
+from itertools import repeat, starmap
+
+import pygame
+
+
+class SpriteBatch:
+    """
+    A batch of sprite draws targeting a single window.
+
+    Draws are recorded by `draw` and sent to the renderer of the window by
+    `flush`. When sorting is enabled, the draws are bucketed by texture and
+    blend mode as they are recorded, and the buckets are flushed one after the
+    other in the order they were first used. The order of the draws is kept
+    within each bucket, but not across buckets, so sorting should only be used
+    for sprites that do not overlap or whose overlap order does not matter.
+    The batch can be used as a context manager, which flushes it on exit.
+
+    Recording a draw costs more than drawing it right away, so a batch only
+    pays off where state changes are expensive, such as on GPU renderers,
+    where SDL submits its queued commands whenever the blend mode or texture
+    changes. With the software renderer, filling it with `draw_many` is
+    about as fast as drawing directly, and `draw` is slower.
+
+    :ivar Window __window__: The window the sprites are drawn onto.
+    :ivar bool __sort__: Whether the draws are grouped before being flushed.
+    :ivar Dict[Any, Tuple] __groups__: The recorded draws, bucketed by
+        texture and blend mode, as (texture, blend_mode, draws) tuples where
+        each draw holds the arguments of `sdl.Texture.draw`. Without sorting,
+        consecutive draws of the same texture and blend mode share a bucket,
+        and the buckets are kept in submission order.
+    :ivar Optional[Tuple] __last__: The bucket of the last recorded draw.
+    :ivar int __count__: The number of recorded draws.
+    """
+
+    def __init__(self, window, sort=True):
+        """
+        Initializes a new sprite batch.
+
+        :param Window window: The window the sprites are drawn onto.
+        :param bool sort: Whether the draws should be grouped by texture and
+            blend mode before being flushed. Default is True.
+        """
+        self.__window__ = window
+        self.__sort__ = sort
+        self.__groups__ = {}
+        self.__last__ = None
+        self.__count__ = 0
+
+    def __len__(self):
+        """
+        Get the number of recorded draws.
+
+        :return: The number of draws waiting to be flushed.
+        """
+        return self.__count__
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<SpriteBatch(count)>`, where `count`
+            is the number of draws waiting to be flushed.
+        """
+        return f"<SpriteBatch({self.__count__})>"
+
+    def __enter__(self):
+        """
+        Enter the runtime context of the batch.
+
+        :return: The batch itself.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exit the runtime context of the batch, flushing it if no exception was
+        raised and discarding the recorded draws otherwise.
+        """
+        if exc_type is None:
+            self.flush()
+        else:
+            self.clear()
+
+    def draw(
+        self,
+        texture,
+        srcrect=None,
+        dstrect=None,
+        angle=0,
+        flip_x=False,
+        flip_y=False,
+        blend_mode=None,
+    ):
+        """
+        Record a sprite draw.
+
+        :param Union[sdl.Texture, pygame.Surface] texture: The texture to draw.
+            Surfaces are uploaded through the texture cache of the window.
+        :param Optional[RectValue] srcrect: The portion of the texture to draw.
+            If not specified, the whole texture is drawn.
+        :param Optional[RectValue] dstrect: The rectangle or position to draw
+            the sprite at. If not specified, the sprite covers the whole
+            window.
+        :param float angle: The angle in degrees to rotate the sprite by,
+            clockwise. Default is 0.
+        :param bool flip_x: Whether the sprite is flipped horizontally.
+            Default is False.
+        :param bool flip_y: Whether the sprite is flipped vertically. Default
+            is False.
+        :param Optional[int] blend_mode: The blend mode to draw the sprite
+            with, such as `pygame.BLENDMODE_ADD`. If not specified, the current
+            blend mode of the texture is used.
+        """
+        draws = self.__bucket__(texture, blend_mode)
+        if angle or flip_x or flip_y:
+            draws.append((srcrect, dstrect, angle, None, flip_x, flip_y))
+        else:
+            draws.append((srcrect, dstrect))
+        self.__count__ += 1
+
+    def draw_many(self, texture, dstrects, srcrect=None, blend_mode=None):
+        """
+        Record many unrotated draws of the same texture at once.
+
+        This records particles, tiles and other sprites that share a texture
+        into the same group with a single call, without calling `draw` for
+        each of them.
+
+        :param Union[sdl.Texture, pygame.Surface] texture: The texture to draw.
+        :param Union[Sequence[RectValue], numpy.ndarray] dstrects: The
+            rectangles or positions to draw the texture at, as sequences or a
+            NumPy array of shape (n, 2) or (n, 4).
+        :param Optional[RectValue] srcrect: The portion of the texture to draw
+            at every destination. If not specified, the whole texture is drawn.
+        :param Optional[int] blend_mode: The blend mode to draw the sprites
+            with. If not specified, the current blend mode of the texture is
+            used.
+        """
+        draws = self.__bucket__(texture, blend_mode)
+        if hasattr(dstrects, "tolist"):
+            dstrects = dstrects.tolist()
+        draws.extend(zip(repeat(srcrect), dstrects))
+        self.__count__ += len(dstrects)
+
+    def clear(self):
+        """
+        Discard every recorded draw.
+        """
+        self.__groups__.clear()
+        self.__last__ = None
+        self.__count__ = 0
+
+    def flush(self):
+        """
+        Send every recorded draw to the renderer of the window.
+
+        The blend mode of a texture is only changed when a group needs another
+        mode than the one the texture currently has, and the original modes
+        are restored once at the end, since textures are shared through the
+        texture cache of the window. The draws of each group are then
+        submitted in bulk, back to back.
+
+        :return: The number of texture and blend mode groups that were
+            submitted.
+        """
+        groups = self.__groups__
+        if not groups:
+            return 0
+
+        saved = {}
+        applied = {}
+        try:
+            for texture, blend_mode, draws in groups.values():
+                if texture not in saved:
+                    saved[texture] = applied[texture] = texture.blend_mode
+                mode = saved[texture] if blend_mode is None else blend_mode
+                if applied[texture] != mode:
+                    texture.blend_mode = applied[texture] = mode
+                # Consume the draws without a Python loop per sprite
+                deque(starmap(texture.draw, draws), maxlen=0)
+        finally:
+            for texture, mode in saved.items():
+                texture.blend_mode = mode
+
+        count = len(groups)
+        self.clear()
+        self.__window__.__dirty__ = True
+        return count
+
+    def __bucket__(self, texture, blend_mode):
+        """
+        Get the list the draws of a texture with a blend mode are recorded in,
+        starting a new bucket if needed.
+
+        :param Union[sdl.Texture, pygame.Surface] texture: The texture to draw.
+            Surfaces are uploaded through the texture cache of the window.
+        :param Optional[int] blend_mode: The blend mode to draw with.
+        :return: The list of draws of the bucket.
+        """
+        if isinstance(texture, pygame.Surface):
+            texture = self.__window__.textures.get(texture)
+        last = self.__last__
+        if last is not None and last[0] is texture and last[1] == blend_mode:
+            return last[2]
+
+        key = (texture, blend_mode) if self.__sort__ else len(self.__groups__)
+        group = self.__groups__.get(key)
+        if group is None:
+            group = self.__groups__[key] = (texture, blend_mode, [])
+        self.__last__ = group
+        return group[2]
@@ -0,0 +1,47 @@
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from pygame import Surface
+from pygame import _sdl2 as sdl
+
+from pygwin.draw import PointValue, RectValue
+from pygwin.window import Window
+
+class SpriteBatch:
+    __window__: Window
+    __sort__: bool
+    __groups__: Dict[Any, Tuple[sdl.Texture, Optional[int], List[Tuple[Any, ...]]]]
+    __last__: Optional[Tuple[sdl.Texture, Optional[int], List[Tuple[Any, ...]]]]
+    __count__: int
+
+    def __init__(self, window: Window, sort: bool = True) -> None: ...
+    def __len__(self) -> int: ...
+    def __enter__(self) -> SpriteBatch: ...
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None: ...
+    def draw(
+        self,
+        texture: Union[sdl.Texture, Surface],
+        srcrect: Optional[RectValue] = None,
+        dstrect: Optional[Union[PointValue, RectValue]] = None,
+        angle: float = 0,
+        flip_x: bool = False,
+        flip_y: bool = False,
+        blend_mode: Optional[int] = None,
+    ) -> None: ...
+    def draw_many(
+        self,
+        texture: Union[sdl.Texture, Surface],
+        dstrects: Sequence[Union[PointValue, RectValue]],
+        srcrect: Optional[RectValue] = None,
+        blend_mode: Optional[int] = None,
+    ) -> None: ...
+    def clear(self) -> None: ...
+    def flush(self) -> int: ...
+    def __bucket__(
+        self, texture: Union[sdl.Texture, Surface], blend_mode: Optional[int]
+    ) -> List[Tuple[Any, ...]]: ...
@@ -0,0 +1,226 @@
+"""
+This module defines the classes used to instrument a `Window`. Instrumentation
+is opt-in: a window only records statistics once `Window.enable_stats` has
+been called, and costs a single attribute check per instrumented call
+otherwise.
+"""
+
+from bisect import bisect_left
+
+# Define the upper bounds of the buckets of a histogram, in seconds
+HISTOGRAM_BOUNDS = (
+    0.0005,
+    0.001,
+    0.002,
+    0.004,
+    0.008,
+    0.016,
+    0.033,
+    0.066,
+    0.133,
+    0.266,
+    float("inf"),
+)
+
+
+class Histogram:
+    """
+    A histogram of durations with fixed, roughly exponential buckets.
+
+    :ivar Tuple[float, ...] bounds: The upper bound of each bucket, in
+        seconds. The last bucket is unbounded.
+    :ivar List[int] buckets: The number of durations recorded in each bucket.
+    :ivar int count: The number of recorded durations.
+    :ivar float total: The sum of the recorded durations, in seconds.
+    :ivar float max: The longest recorded duration, in seconds.
+    """
+
+    def __init__(self, bounds=HISTOGRAM_BOUNDS):
+        """
+        Initializes a new, empty histogram.
+
+        :param Tuple[float, ...] bounds: The upper bound of each bucket, in
+            increasing order. Default is `HISTOGRAM_BOUNDS`.
+        """
+        self.bounds = tuple(bounds)
+        self.buckets = [0] * len(self.bounds)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<Histogram(count mean max)>`.
+        """
+        return f"<Histogram({self.count} {self.mean:.6f} {self.max:.6f})>"
+
+    @property
+    def mean(self):
+        """
+        Get the mean of the recorded durations.
+
+        :return: The mean duration in seconds, or 0.0 if nothing was recorded.
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def record(self, value):
+        """
+        Record a duration.
+
+        :param float value: The duration to record, in seconds.
+        """
+        self.buckets[min(bisect_left(self.bounds, value), len(self.bounds) - 1)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, percent):
+        """
+        Estimate a percentile of the recorded durations.
+
+        :param float percent: The percentile to estimate, between 0 and 100.
+        :return: The upper bound of the bucket holding the percentile, or 0.0
+            if nothing was recorded. The last bucket reports `max` instead of
+            its infinite bound.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = self.count * percent / 100
+        seen = 0
+        for bound, count in zip(self.bounds, self.buckets):
+            seen += count
+            if seen >= rank and count:
+                return min(bound, self.max)
+        return self.max
+
+    def reset(self):
+        """
+        Forget every recorded duration.
+        """
+        self.buckets = [0] * len(self.bounds)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def as_dict(self):
+        """
+        Get a snapshot of the histogram as plain Python objects.
+
+        :return: A dictionary with the `count`, `mean`, `max`, `p50`, `p95`,
+            `p99`, `bounds` and `buckets` of the histogram.
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "bounds": list(self.bounds),
+            "buckets": list(self.buckets),
+        }
+
+
+class WindowStats:
+    """
+    The performance statistics of a single window.
+
+    The statistics can be exported periodically through a hook, which is
+    called as `hook(window, stats)` from `Window.update` at most once every
+    `interval` seconds.
+
+    :ivar int fill_calls: The number of calls to `Window.fill`.
+    :ivar int update_calls: The number of calls to `Window.update`.
+    :ivar int property_calls: The number of calls made into SDL by the
+        property setters of the window.
+    :ivar float renderer_time: The time spent creating the renderer of the
+        window, in seconds.
+    :ivar Histogram frame_times: The time between consecutive updates.
+    :ivar Histogram present_times: The time spent presenting the window.
+    :ivar Optional[Callable] hook: The function the statistics are exported
+        to.
+    :ivar float interval: The minimum time between two exports, in seconds.
+    """
+
+    def __init__(self, hook=None, interval=1.0):
+        """
+        Initializes a new set of statistics.
+
+        :param Optional[Callable] hook: The function the statistics are
+            exported to, called as `hook(window, stats)`. Default is None.
+        :param float interval: The minimum time between two exports, in
+            seconds. Default is 1.0.
+        """
+        self.fill_calls = 0
+        self.update_calls = 0
+        self.property_calls = 0
+        self.renderer_time = 0.0
+        self.frame_times = Histogram()
+        self.present_times = Histogram()
+        self.hook = hook
+        self.interval = interval
+        self.__last_update__ = None
+        self.__last_export__ = None
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<WindowStats(updates fills)>`.
+        """
+        return f"<WindowStats({self.update_calls} {self.fill_calls})>"
+
+    def record_update(self, window, start, end):
+        """
+        Record a call to `Window.update` and export the statistics if due.
+
+        :param Window window: The window that was updated.
+        :param float start: The time the present started, from
+            `time.perf_counter`.
+        :param float end: The time the present ended, from
+            `time.perf_counter`.
+        """
+        self.update_calls += 1
+        self.present_times.record(end - start)
+        if self.__last_update__ is not None:
+            self.frame_times.record(end - self.__last_update__)
+        self.__last_update__ = end
+
+        if self.hook is not None:
+            if self.__last_export__ is None:
+                self.__last_export__ = end
+            elif end - self.__last_export__ >= self.interval:
+                self.__last_export__ = end
+                self.hook(window, self)
+
+    def reset(self):
+        """
+        Reset every counter and histogram.
+        """
+        self.fill_calls = 0
+        self.update_calls = 0
+        self.property_calls = 0
+        self.renderer_time = 0.0
+        self.frame_times.reset()
+        self.present_times.reset()
+        self.__last_update__ = None
+        self.__last_export__ = None
+
+    def as_dict(self):
+        """
+        Get a snapshot of the statistics as plain Python objects.
+
+        :return: A dictionary suitable for JSON encoding or for a metrics
+            system.
+        """
+        return {
+            "fill_calls": self.fill_calls,
+            "update_calls": self.update_calls,
+            "property_calls": self.property_calls,
+            "renderer_time": self.renderer_time,
+            "frame_times": self.frame_times.as_dict(),
+            "present_times": self.present_times.as_dict(),
+        }
@@ -0,0 +1,41 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pygwin.window import Window
+
+HISTOGRAM_BOUNDS: Tuple[float, ...]
+
+class Histogram:
+    bounds: Tuple[float, ...]
+    buckets: List[int]
+    count: int
+    total: float
+    max: float
+
+    def __init__(self, bounds: Sequence[float] = ...) -> None: ...
+    @property
+    def mean(self) -> float: ...
+    def record(self, value: float) -> None: ...
+    def percentile(self, percent: float) -> float: ...
+    def reset(self) -> None: ...
+    def as_dict(self) -> Dict[str, Any]: ...
+
+class WindowStats:
+    fill_calls: int
+    update_calls: int
+    property_calls: int
+    renderer_time: float
+    frame_times: Histogram
+    present_times: Histogram
+    hook: Optional[Callable[[Window, WindowStats], object]]
+    interval: float
+    __last_update__: Optional[float]
+    __last_export__: Optional[float]
+
+    def __init__(
+        self,
+        hook: Optional[Callable[[Window, WindowStats], object]] = None,
+        interval: float = 1.0,
+    ) -> None: ...
+    def record_update(self, window: Window, start: float, end: float) -> None: ...
+    def reset(self) -> None: ...
+    def as_dict(self) -> Dict[str, Any]: ...
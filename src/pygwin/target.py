@@ -0,0 +1,259 @@
+"""
+This module defines the render targets of a `Window` that does not draw
+straight into its native window. A headless window draws into a target
+texture of its size and is never shown, and a window rendered at a reduced
+resolution draws into a smaller target texture that is upscaled when the
+window is updated, optionally at a scale chosen by a `ResolutionController`.
+Frames drawn into either target can be read back into a buffer without
+allocating memory.
+"""
+
+import time
+
+import pygame
+from pygame import _sdl2 as sdl
+
+from pygwin.scaling import ResolutionController
+from pygwin.texture import TEXTURE_FORMAT
+
+
+class TargetMixin:
+    """
+    The render targets of a `Window`.
+
+    :ivar bool __headless__: Whether the window renders offscreen.
+    :ivar Optional[Tuple[Buffer, str, Tuple[int, int], pygame.Surface]]
+        __readback__: The buffer frames were last read into, its format, the
+        size of the window at the time and a surface sharing the buffer.
+    :ivar float __resolution__: The scale of the resolution the window is
+        rendered at.
+    :ivar Optional[ResolutionController] __scaler__: The dynamic resolution
+        controller of the window, if enabled.
+    """
+
+    def __init__(self, *, headless=False, **options):
+        """
+        Initializes the render targets of a new window.
+
+        :param bool headless: Whether the window renders offscreen. Default is
+            False.
+        :param options: The options of the other parts of the window.
+        """
+        self.__headless__ = bool(headless)
+        self.__readback__ = None
+        self.__resolution__ = 1.0
+        self.__scaler__ = None
+        super().__init__(**options)
+
+    def read_pixels_into(self, array, format=TEXTURE_FORMAT):
+        """
+        Read the current frame of the window back into a buffer.
+
+        The frame is read from the target texture of a headless window, or from
+        the back buffer of a regular one, so it should be called after drawing
+        and before `update`. A frame rendered at a reduced resolution is
+        upscaled first. The surface wrapping the buffer is kept between calls,
+        so reading into the same buffer every frame allocates nothing.
+
+        :param Buffer array: The buffer to read the frame into, as a writable
+            C-contiguous NumPy array or any other buffer object holding exactly
+            one frame, such as an array of shape (height, width, channels).
+        :param str format: The pixel format of the buffer, as accepted by
+            `pygame.image.frombuffer`. "BGRA" is the native format of textures
+            and needs no conversion. Default is `TEXTURE_FORMAT`.
+        :return: The buffer itself.
+        :raises ValueError: If the buffer does not hold exactly one frame.
+        """
+        # pylint: disable=W0622
+        size = self.size
+        readback = self.__readback__
+        if (
+            readback is None
+            or readback[0] is not array
+            or readback[1:3] != (format, size)
+        ):
+            width, height = size
+            expected = width * height * len(format)
+            if memoryview(array).nbytes != expected:
+                raise ValueError(
+                    f"expected a buffer of {expected} bytes, "
+                    f"got {memoryview(array).nbytes} bytes"
+                )
+            surface = pygame.image.frombuffer(array, (width, height), format)
+            readback = self.__readback__ = (array, format, size, surface)
+        renderer = self.renderer
+        if self.__scaled__ is None:
+            renderer.to_surface(readback[3])
+        else:
+            self.__resolve__()
+            renderer.to_surface(readback[3])
+            self.__retarget__()
+        return array
+
+    def enable_dynamic_resolution(self, frame_time=1 / 60, **options):
+        """
+        Let a controller choose the resolution scale of the window to hold a
+        frame time budget.
+
+        The paced loops of the window feed the controller automatically. Other
+        loops should call `adapt_resolution` once per frame with the time
+        spent working on it.
+
+        :param float frame_time: The frame time budget, in seconds. Default is
+            1/60.
+        :param options: The other parameters of the `ResolutionController`,
+            such as `minimum`, `step` or `cooldown`.
+        :return: The `ResolutionController` of the window.
+        :raises ValueError: If any parameter has an invalid value.
+        """
+        self.__scaler__ = ResolutionController(frame_time, **options)
+        self.resolution_scale = self.__scaler__.scale
+        return self.__scaler__
+
+    def disable_dynamic_resolution(self):
+        """
+        Remove the resolution controller of the window and go back to the full
+        resolution.
+        """
+        self.__scaler__ = None
+        self.resolution_scale = 1.0
+
+    def adapt_resolution(self, frame_time):
+        """
+        Give the time spent working on a frame to the resolution controller
+        and apply the scale it chooses. This should be called between frames.
+
+        :param float frame_time: The time spent working on the frame, in
+            seconds, excluding the time spent waiting for the next frame.
+        :return: The resolution scale of the next frame.
+        """
+        if self.__scaler__ is not None:
+            self.resolution_scale = self.__scaler__.record(frame_time)
+        return self.__resolution__
+
+    def __present__(self):
+        """
+        Present the frame of the window, unless it is headless, and point the
+        renderer back at the target texture of a reduced resolution. The time
+        spent presenting is recorded in the statistics of the window.
+        """
+        stats = self.__stats__
+        start = 0.0 if stats is None else time.perf_counter()
+        if not self.__headless__:
+            self.renderer.present()
+        if stats is not None:
+            stats.record_update(self, start, time.perf_counter())
+        if self.__scaled__ is not None:
+            self.__retarget__()
+
+    def __retarget__(self):
+        """
+        Point the renderer at the texture the next frame is drawn into.
+
+        Headless windows get a target texture of the size of the window.
+        Windows rendered at a reduced resolution get a smaller target texture,
+        drawn into with a scale so that coordinates stay those of the window.
+        Both textures are created again when the size of the window or the
+        resolution scale changes.
+        """
+        renderer = self.__renderer__
+        size = self.size
+        target = self.__target__
+        if self.__headless__:
+            if target is None or (target.width, target.height) != size:
+                target = self.__target__ = sdl.Texture(renderer, size, target=True)
+                self.__readback__ = None
+
+        if self.__resolution__ >= 1:
+            self.__scaled__ = None
+            renderer.target = target
+            return
+
+        width, height = self.buffer_size
+        scaled = (
+            max(1, round(width * self.__resolution__)),
+            max(1, round(height * self.__resolution__)),
+        )
+        texture = self.__scaled__
+        if texture is None or (texture.width, texture.height) != scaled:
+            texture = self.__scaled__ = sdl.Texture(renderer, scaled, target=True)
+            texture.blend_mode = pygame.BLENDMODE_NONE
+        renderer.target = texture
+        renderer.scale = (scaled[0] / width, scaled[1] / height)
+
+    def __direct__(self):
+        """
+        Check whether the renderer draws straight into the window.
+
+        :return: False if the window is headless or rendered at a reduced
+            resolution, True otherwise.
+        """
+        return not self.__headless__ and self.__resolution__ >= 1
+
+    def __resolve__(self):
+        """
+        Upscale the frame drawn at a reduced resolution onto the window, or
+        onto the target texture of a headless window.
+        """
+        self.__renderer__.target = self.__target__
+        self.__scaled__.draw()
+
+    def __detach__(self):
+        """
+        Drop the readback buffer of the window.
+        """
+        super().__detach__()
+        self.__readback__ = None
+
+    # Getters
+    @property
+    def headless(self):
+        """
+        Get whether the window renders offscreen.
+
+        :return: True if the window draws into a target texture and is never
+            shown, False otherwise.
+        """
+        return self.__headless__
+
+    @property
+    def resolution_scale(self):
+        """
+        Get the scale of the resolution the window is rendered at.
+
+        :return: The ratio between the internal resolution and the size of the
+            window, between 0 and 1.
+        """
+        return self.__resolution__
+
+    @property
+    def scaler(self):
+        """
+        Get the dynamic resolution controller of the window.
+
+        :return: The `ResolutionController` of the window, or None if dynamic
+            resolution is disabled.
+        """
+        return self.__scaler__
+
+    # Setters
+    @resolution_scale.setter
+    def resolution_scale(self, value):
+        """
+        Set the scale of the resolution the window is rendered at.
+
+        Below 1, frames are drawn into a smaller target texture with the
+        coordinates of the window, and upscaled to the size of the window by
+        `update`. This cuts the fill cost of each frame by the square of the
+        scale. The renderer should be created with `target_texture=True`.
+
+        :param float value: The new resolution scale, between 0 and 1.
+        :raises ValueError: If the scale is not between 0 and 1.
+        """
+        if not 0 < value <= 1:
+            raise ValueError("resolution scale must be between 0 and 1")
+        if value == self.__resolution__:
+            return
+        self.__resolution__ = value
+        if self.__renderer__ is not None:
+            self.__retarget__()
@@ -0,0 +1,38 @@
+from typing import Any, Optional, Tuple
+
+from pygame import Surface
+
+from pygwin.scaling import ResolutionController
+
+class TargetMixin:
+    __headless__: bool
+    __readback__: Optional[Tuple[Any, str, Tuple[int, int], Surface]]
+    __resolution__: float
+    __scaler__: Optional[ResolutionController]
+
+    resolution_scale: float
+
+    def __init__(self, *, headless: bool = False, **options: Any) -> None: ...
+    @property
+    def headless(self) -> bool: ...
+    @property
+    def scaler(self) -> Optional[ResolutionController]: ...
+    def read_pixels_into(self, array: Any, format: str = ...) -> Any: ...
+    def enable_dynamic_resolution(
+        self,
+        frame_time: float = ...,
+        *,
+        minimum: float = ...,
+        maximum: float = ...,
+        step: float = ...,
+        headroom: float = ...,
+        cooldown: int = ...,
+        smoothing: float = ...,
+    ) -> ResolutionController: ...
+    def disable_dynamic_resolution(self) -> None: ...
+    def adapt_resolution(self, frame_time: float) -> float: ...
+    def __present__(self) -> None: ...
+    def __retarget__(self) -> None: ...
+    def __direct__(self) -> bool: ...
+    def __resolve__(self) -> None: ...
+    def __detach__(self) -> None: ...
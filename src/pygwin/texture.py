@@ -0,0 +1,326 @@
+"""
+This module defines a `TextureCache` class that keeps the textures uploaded
+from `pygame.Surface` objects alive between frames. Each renderer owns its
+textures, so every `Window` has its own cache. Surfaces are only uploaded
+again when their content version changes, and the least recently used
+textures are evicted once the cache grows past its byte budget.
+
+It also defines a `StreamingTexture` class that uploads raw frames from
+NumPy arrays or other buffer objects into a persistent texture, without
+going through a new `pygame.Surface` on every frame.
+"""
+
+import weakref
+from collections import OrderedDict
+
+import pygame
+from pygame import _sdl2 as sdl
+
+# Define the default byte budget of a texture cache
+TEXTURE_BUDGET = 64 * 1024 * 1024
+
+# Define the number of bytes used by each pixel of a cached texture
+TEXTURE_DEPTH = 4
+
+# Define the pixel format that textures store natively
+TEXTURE_FORMAT = "BGRA"
+
+
+class TextureCache:
+    """
+    A least recently used cache of textures uploaded from surfaces.
+
+    Textures are keyed on the identity of their source surface and on a
+    content version chosen by the caller. Looking up a surface with the version
+    it was last uploaded with returns the cached texture without touching the
+    GPU; looking it up with a new version uploads the surface again, reusing
+    the texture when its size has not changed. Entries of surfaces that have
+    been garbage collected are dropped automatically.
+
+    :ivar sdl.Renderer __renderer__: The renderer that owns the textures.
+    :ivar int __budget__: The number of bytes the textures may use before the
+        least recently used ones are evicted.
+    :ivar OrderedDict __entries__: The cached entries, indexed by the identity
+        of their surface, from least to most recently used.
+    :ivar List[int] __dead__: The identities of the surfaces that have been
+        garbage collected since the last lookup.
+    :ivar int __bytes__: The estimated number of bytes used by the textures.
+    """
+
+    def __init__(self, renderer, budget=TEXTURE_BUDGET):
+        """
+        Initializes a new texture cache.
+
+        :param sdl.Renderer renderer: The renderer that owns the textures.
+        :param int budget: The number of bytes the textures may use before
+            the least recently used ones are evicted. Default is
+            `TEXTURE_BUDGET`.
+        """
+        self.__renderer__ = renderer
+        self.__budget__ = budget
+        self.__entries__ = OrderedDict()
+        self.__dead__ = []
+        self.__bytes__ = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        """
+        Get the number of cached textures.
+
+        :return: The number of textures held by this cache.
+        """
+        return len(self.__entries__)
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<TextureCache(count bytes/budget)>`.
+        """
+        count = len(self.__entries__)
+        return f"<TextureCache({count} {self.__bytes__}/{self.__budget__})>"
+
+    @property
+    def budget(self):
+        """
+        Get the byte budget of the cache.
+
+        :return: The number of bytes the textures may use.
+        """
+        return self.__budget__
+
+    @budget.setter
+    def budget(self, value):
+        """
+        Set the byte budget of the cache, evicting textures if needed.
+
+        :param int value: The new number of bytes the textures may use.
+        """
+        self.__budget__ = value
+        self.__evict__()
+
+    @property
+    def bytes(self):
+        """
+        Get the estimated number of bytes used by the cached textures.
+
+        :return: The sum of the sizes of the cached textures, assuming four
+            bytes per pixel.
+        """
+        return self.__bytes__
+
+    def get(self, surface, version=0):
+        """
+        Get the texture of a surface, uploading it if needed.
+
+        :param pygame.Surface surface: The surface to get the texture of.
+        :param Hashable version: The version of the content of the surface.
+            The surface is uploaded again whenever this value changes, so the
+            caller should change it every time it draws into the surface.
+            Default is 0.
+        :return: An `sdl.Texture` holding the content of the surface.
+        """
+        self.__purge__()
+        key = id(surface)
+        entry = self.__entries__.get(key)
+
+        if entry is not None and entry[0]() is surface:
+            self.__entries__.move_to_end(key)
+            if entry[1] == version:
+                self.hits += 1
+                return entry[2]
+
+            self.misses += 1
+            texture = entry[2]
+            if (texture.width, texture.height) == surface.get_size():
+                texture.update(surface)
+                entry[1] = version
+                return texture
+            self.__discard__(key)
+        else:
+            self.misses += 1
+            if entry is not None:
+                self.__discard__(key)
+
+        texture = sdl.Texture.from_surface(self.__renderer__, surface)
+        size = texture.width * texture.height * TEXTURE_DEPTH
+        reference = weakref.ref(surface, lambda _: self.__dead__.append(key))
+        self.__entries__[key] = [reference, version, texture, size]
+        self.__bytes__ += size
+        self.__evict__()
+        return texture
+
+    def invalidate(self, surface):
+        """
+        Drop the texture of a surface from the cache.
+
+        :param pygame.Surface surface: The surface to drop the texture of. It
+            is ignored if it is not cached.
+        """
+        entry = self.__entries__.get(id(surface))
+        if entry is not None and entry[0]() is surface:
+            self.__discard__(id(surface))
+
+    def clear(self):
+        """
+        Drop every texture from the cache.
+        """
+        self.__entries__.clear()
+        self.__dead__.clear()
+        self.__bytes__ = 0
+
+    def __discard__(self, key):
+        """
+        Remove an entry from the cache and release its bytes.
+
+        :param int key: The identity of the surface of the entry.
+        """
+        entry = self.__entries__.pop(key, None)
+        if entry is not None:
+            self.__bytes__ -= entry[3]
+
+    def __purge__(self):
+        """
+        Remove the entries of the surfaces that have been garbage collected.
+        """
+        while self.__dead__:
+            key = self.__dead__.pop()
+            entry = self.__entries__.get(key)
+            if entry is not None and entry[0]() is None:
+                self.__discard__(key)
+
+    def __evict__(self):
+        """
+        Evict the least recently used textures until the cache fits in its
+        budget. The most recently used texture is always kept.
+        """
+        while self.__bytes__ > self.__budget__ and len(self.__entries__) > 1:
+            _, entry = self.__entries__.popitem(last=False)
+            self.__bytes__ -= entry[3]
+            self.evictions += 1
+
+
+class StreamingTexture:
+    """
+    A persistent streaming texture fed from raw pixel buffers.
+
+    The texture owns a preallocated pixel buffer in the native format of SDL
+    textures, `TEXTURE_FORMAT`. Frames in that format are copied straight from
+    the buffer to the texture. Frames in another format, such as "RGB", go
+    through a second preallocated buffer and are converted into the native one
+    in place, so no memory is allocated per frame in either case.
+
+    :ivar Tuple[int, int] __size__: The width and height of the texture.
+    :ivar str __mode__: The pixel format of the frames written by the
+        caller.
+    :ivar sdl.Texture __texture__: The streaming texture.
+    :ivar bytearray __pixels__: The pixels of the texture in native format.
+    :ivar pygame.Surface __surface__: A surface sharing `__pixels__`.
+    :ivar bytearray __buffer__: The buffer the caller writes frames into.
+        It is `__pixels__` itself when the frames are in native format.
+    :ivar pygame.Surface __source__: A surface sharing `__buffer__`.
+    """
+
+    def __init__(self, renderer, size, format="RGB"):
+        """
+        Initializes a new streaming texture.
+
+        :param sdl.Renderer renderer: The renderer that owns the texture.
+        :param Tuple[int, int] size: The width and height of the texture.
+        :param str format: The pixel format of the frames, as accepted by
+            `pygame.image.frombuffer`. Default is "RGB".
+        :raises ValueError: If the format is not supported.
+        """
+        # pylint: disable=W0622
+        width, height = size
+        self.__size__ = (width, height)
+        self.__mode__ = format
+        self.__texture__ = sdl.Texture(renderer, self.__size__, streaming=True)
+        self.__texture__.blend_mode = pygame.BLENDMODE_NONE
+        self.__pixels__ = bytearray(width * height * TEXTURE_DEPTH)
+        self.__surface__ = pygame.image.frombuffer(
+            self.__pixels__, self.__size__, TEXTURE_FORMAT
+        )
+
+        if format == TEXTURE_FORMAT:
+            self.__buffer__ = self.__pixels__
+            self.__source__ = self.__surface__
+        else:
+            self.__buffer__ = bytearray(width * height * len(format))
+            self.__source__ = pygame.image.frombuffer(
+                self.__buffer__, self.__size__, format
+            )
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<StreamingTexture(size format)>`.
+        """
+        return f"<StreamingTexture({self.__size__} {self.__mode__})>"
+
+    @property
+    def size(self):
+        """
+        Get the size of the texture.
+
+        :return: The width and height of the texture in pixels.
+        """
+        return self.__size__
+
+    @property
+    def format(self):
+        """
+        Get the pixel format of the frames.
+
+        :return: The pixel format of the buffer returned by `buffer`.
+        """
+        return self.__mode__
+
+    @property
+    def texture(self):
+        """
+        Get the underlying texture.
+
+        :return: The `sdl.Texture` holding the last uploaded frame.
+        """
+        return self.__texture__
+
+    def buffer(self):
+        """
+        Get the buffer the frames are written into.
+
+        The buffer is writable and shaped as (height, width, channels), so
+        `numpy.asarray` turns it into an array that shares its memory. Frames
+        written into it are uploaded by calling `upload` without arguments.
+
+        :return: A `memoryview` of the frame buffer.
+        """
+        width, height = self.__size__
+        channels = len(self.__mode__)
+        return memoryview(self.__buffer__).cast("B", (height, width, channels))
+
+    def upload(self, data=None):
+        """
+        Upload a frame to the texture.
+
+        :param Optional[Buffer] data: The frame to upload, as a C-contiguous
+            NumPy array or any other buffer object holding exactly one frame in
+            the format of the texture. If not specified, the content of
+            `buffer` is uploaded.
+        :raises ValueError: If the frame does not have the expected size.
+        """
+        if data is not None:
+            view = memoryview(data).cast("B")
+            if view.nbytes != len(self.__buffer__):
+                raise ValueError(
+                    f"expected a frame of {len(self.__buffer__)} bytes, "
+                    f"got {view.nbytes} bytes"
+                )
+            memoryview(self.__buffer__)[:] = view
+
+        if self.__source__ is not self.__surface__:
+            self.__surface__.blit(self.__source__, (0, 0))
+        self.__texture__.update(self.__surface__)
@@ -0,0 +1,49 @@
+from typing import Any, Hashable, List, Optional, Tuple
+
+from pygame import Surface
+from pygame import _sdl2 as sdl
+
+TEXTURE_BUDGET: int
+TEXTURE_DEPTH: int
+TEXTURE_FORMAT: str
+
+class TextureCache:
+    __renderer__: sdl.Renderer
+    __budget__: int
+    __entries__: Any
+    __dead__: List[int]
+    __bytes__: int
+
+    hits: int
+    misses: int
+    evictions: int
+    budget: int
+
+    def __init__(self, renderer: sdl.Renderer, budget: int = ...) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def bytes(self) -> int: ...
+    def get(self, surface: Surface, version: Hashable = 0) -> sdl.Texture: ...
+    def invalidate(self, surface: Surface) -> None: ...
+    def clear(self) -> None: ...
+
+class StreamingTexture:
+    __size__: Tuple[int, int]
+    __mode__: str
+    __texture__: sdl.Texture
+    __pixels__: bytearray
+    __surface__: Surface
+    __buffer__: bytearray
+    __source__: Surface
+
+    def __init__(
+        self, renderer: sdl.Renderer, size: Tuple[int, int], format: str = "RGB"
+    ) -> None: ...
+    @property
+    def size(self) -> Tuple[int, int]: ...
+    @property
+    def format(self) -> str: ...
+    @property
+    def texture(self) -> sdl.Texture: ...
+    def buffer(self) -> memoryview: ...
+    def upload(self, data: Optional[Any] = None) -> None: ...
@@ -8,19 +8,38 @@ to make the development process smoother and more efficient.
 import pygame
 from pygame import _sdl2 as sdl
 
+from pygwin.clock import LoopMixin
+from pygwin.draw import DrawMixin, to_color
+from pygwin.layer import LayerMixin
+from pygwin.lifecycle import LifecycleMixin, WindowResources, track, untrack
+from pygwin.mirror import MirrorMixin
+from pygwin.record import RecordingMixin
+from pygwin.target import TargetMixin
+from pygwin.texture import TEXTURE_BUDGET
+
 # Define window constants
 WINDOWPOS_CENTERED = 805240832
 WINDOWPOS_UNDEFINED = 536805376
 
+# Define the changes window events make to the state of a window, besides
+# the geometry events carrying the new geometry
+STATE_EVENTS = {
+    pygame.WINDOWSHOWN: {"visible": True},
+    pygame.WINDOWHIDDEN: {"visible": False},
+    pygame.WINDOWMINIMIZED: {"minimized": True},
+    pygame.WINDOWMAXIMIZED: {"minimized": False, "maximized": True},
+    pygame.WINDOWRESTORED: {"minimized": False, "maximized": False},
+}
+
 
-class Window:
+class WindowState:
     """
-    A custom `Window` class for Pygame.
+    A compact record of the last configuration applied to a `Window`.
 
-    This class is a custom class for Pygame that streamlines the creation and
-    management of windows in Pygame applications. It offers a variety of
-    customizable features and convenient window management functions to make
-    the development process smoother and more efficient.
+    Each `Window` owns one instance of this class. The window serves its
+    getters from the record and compares every new value against it, so that
+    setting a property to its current value never calls into SDL. The record
+    uses `__slots__`, which keeps it small and its attribute access fast.
 
     :ivar str title: The title of the window.
     :ivar Tuple[int, int] size: The width and height of the window.
@@ -34,11 +53,23 @@ class Window:
     :ivar bool maximized: Whether the window is currently maximized.
     """
 
-    # Window configurations
-    __dict__ = {
+    __slots__ = (
+        "title",
+        "size",
+        "position",
+        "fullscreen",
+        "visible",
+        "borderless",
+        "resizable",
+        "minimized",
+        "maximized",
+    )
+
+    # Configuration of a freshly created hidden `sdl.Window`
+    __defaults__ = {
         "title": "pygame",
         "size": (640, 480),
-        "position": WINDOWPOS_CENTERED,
+        "position": WINDOWPOS_UNDEFINED,
         "fullscreen": False,
         "visible": False,
         "borderless": False,
@@ -47,10 +78,286 @@ class Window:
         "maximized": False,
     }
 
-    def __init__(self, **args):
+    def __init__(self, **values):
+        """
+        Initializes a new window state record.
+
+        The default values match the configuration of a freshly created hidden
+        `sdl.Window`, which SDL places at `WINDOWPOS_UNDEFINED`, so a new
+        record describes a new window accurately.
+
+        :param values: The recorded values that differ from the defaults, with
+            the same names and meanings as the arguments of `Window.__init__`.
+        :raises AttributeError: If an invalid value is specified.
+        """
+        self.apply(**{**self.__defaults__, **values})
+
+    def __repr__(self):
+        """
+        Return a string representation of this instance.
+
+        :return: A string of the format `<WindowState(key=value ...)>` listing
+            every recorded value.
+        """
+        values = " ".join(f"{key}={getattr(self, key)!r}" for key in self.__slots__)
+        return f"<WindowState({values})>"
+
+    def snapshot(self):
+        """
+        Get a copy of every recorded value.
+
+        :return: A dictionary with the same names and meanings as the
+            arguments of `Window.__init__`.
+        """
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def apply(self, **values):
+        """
+        Record new values, without checking them.
+
+        :param values: The new values, with the same names and meanings as the
+            arguments of `Window.__init__`.
+        :raises AttributeError: If an invalid value is specified.
+        """
+        for key, value in values.items():
+            setattr(self, key, value)
+
+    def apply_event(self, event):
+        """
+        Update the record from an SDL window event.
+
+        Changes made by the user or the window manager, such as dragging or
+        minimizing the window, do not go through the setters of `Window`. This
+        method brings the record back in sync with the native window when the
+        corresponding event is received. Other events are ignored.
+
+        :param pygame.event.Event event: The event to apply.
+        """
+        if event.type == pygame.WINDOWMOVED:
+            self.apply(position=(event.x, event.y))
+        elif event.type == pygame.WINDOWSIZECHANGED:
+            self.apply(size=(event.x, event.y))
+        else:
+            self.apply(**STATE_EVENTS.get(event.type, {}))
+
+
+class WindowTransaction:
+    """
+    A set of pending changes to the configuration of a `Window`.
+
+    Properties assigned on a transaction are recorded instead of being applied
+    right away. When the transaction is committed, all of them are applied at
+    once through `Window.configure`, so conflicting and repeated changes are
+    collapsed and the window is shown at most once. A transaction is usually
+    used as a context manager, which commits it on exit unless an exception
+    was raised.
+
+    :ivar Window __window__: The window the changes are applied to.
+    :ivar Dict[str, Any] __changes__: The pending changes, in the order they
+        were last assigned.
+    """
+
+    __slots__ = ("__window__", "__changes__")
+
+    def __init__(self, window):
+        """
+        Initializes a new transaction on a window.
+
+        :param Window window: The window the changes are applied to.
+        """
+        super().__setattr__("__window__", window)
+        super().__setattr__("__changes__", {})
+
+    def __getattr__(self, name):
+        """
+        Get the pending value of a property, or its current value on the window
+        if no change is pending.
+
+        :param str name: The name of the property to retrieve.
+        :return: The value the property will have once the transaction is
+            committed.
+        :raises AttributeError: If the window has no such property.
+        """
+        if name not in WindowState.__slots__:
+            raise AttributeError(f"'WindowTransaction' type has no attribute '{name}'")
+        if name in self.__changes__:
+            return self.__changes__[name]
+        return getattr(self.__window__, name)
+
+    def __setattr__(self, name, value):
+        """
+        Record a pending change to a property of the window.
+
+        The change is moved to the end of the pending changes, so that the last
+        one of two conflicting changes wins.
+
+        :param str name: The name of the property to change.
+        :param Any value: The new value of the property.
+        :raises AttributeError: If the window has no such property.
+        """
+        if name not in WindowState.__slots__:
+            raise AttributeError(f"'WindowTransaction' type has no attribute '{name}'")
+        self.__changes__.pop(name, None)
+        self.__changes__[name] = value
+
+    def __enter__(self):
+        """
+        Enter the runtime context of the transaction.
+
+        :return: The transaction itself.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exit the runtime context of the transaction, committing it if no
+        exception was raised and discarding it otherwise.
+        """
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def commit(self):
+        """
+        Apply every pending change to the window and clear them.
+        """
+        changes = self.__changes__
+        super().__setattr__("__changes__", {})
+        self.__window__.configure(**changes)
+
+    def rollback(self):
+        """
+        Discard every pending change without applying it.
+        """
+        self.__changes__.clear()
+
+
+def collapse(changes):
+    """
+    Check a set of changes to the configuration of a window and drop the
+    conflicting ones: when both `minimized` and `maximized` are set to True,
+    only the last one is kept.
+
+    :param Dict[str, Any] changes: The changes, in the order they were made.
+    :return: The changes without the conflicting ones.
+    :raises AttributeError: If a change is not a property of the window.
+    """
+    for key in changes:
+        if key not in WindowState.__slots__:
+            raise AttributeError(f"'Window' type has no attribute '{key}'")
+
+    if changes.get("minimized") and changes.get("maximized"):
+        keys = list(changes)
+        if keys.index("minimized") < keys.index("maximized"):
+            del changes["minimized"]
+        else:
+            del changes["maximized"]
+    return changes
+
+
+class Window(
+    DrawMixin,
+    TargetMixin,
+    LayerMixin,
+    MirrorMixin,
+    RecordingMixin,
+    LoopMixin,
+    LifecycleMixin,
+):
+    """
+    A custom `Window` class for Pygame.
+
+    This class is a custom class for Pygame that streamlines the creation and
+    management of windows in Pygame applications. It offers a variety of
+    customizable features and convenient window management functions to make
+    the development process smoother and more efficient.
+
+    The configuration of each window is cached in its own `WindowState`
+    record. Reading a property never calls into SDL, and setting a property to
+    the value it already has is a no-op. The renderer of the window is only
+    created the first time something is drawn or presented.
+
+    The features built on top of the window live in their own modules, each
+    adding its methods to the window through a mixin: drawing in `draw`,
+    render targets in `target`, layers in `layer`, mirrors in `mirror`,
+    recording in `record`, frame loops in `clock` and the lifecycle of the
+    native resources in `lifecycle`.
+
+    :ivar str title: The title of the window.
+    :ivar Tuple[int, int] size: The width and height of the window.
+    :ivar Union[int, Tuple[int, int]] position: The position of the window on
+        the screen.
+    :ivar bool fullscreen: Whether the window is displayed in fullscreen mode.
+    :ivar bool visible: Whether the window is visible.
+    :ivar bool borderless: Whether the window has a border.
+    :ivar bool resizable: Whether the window can be resized by the user.
+    :ivar bool minimized: Whether the window is currently minimized.
+    :ivar bool maximized: Whether the window is currently maximized.
+    """
+
+    __slots__ = (
+        "__resources__",
+        "__finalizer__",
+        "__options__",
+        "__budget__",
+        "__stats__",
+        "__state__",
+        "__dirty__",
+        "__pacer__",
+        "__commands__",
+        "__recorder__",
+        "__headless__",
+        "__readback__",
+        "__layers__",
+        "__mirrors__",
+        "__mirror__",
+        "__resolution__",
+        "__scaler__",
+        "__idle__",
+        "__resize__",
+        "__closed__",
+    )
+
+    # Order in which `configure` applies changes to the native window
+    __order__ = (
+        "title",
+        "resizable",
+        "borderless",
+        "size",
+        "position",
+        "fullscreen",
+        "maximized",
+        "minimized",
+    )
+
+    def __init__(
+        self,
+        *,
+        vsync=False,
+        accelerated=None,
+        target_texture=False,
+        texture_budget=TEXTURE_BUDGET,
+        headless=False,
+        **args,
+    ):
         """
         Initializes a new window object.
 
+        :param bool vsync: Whether presenting the window should be synchronized
+            with the refresh rate of the display. Default is False.
+        :param Optional[bool] accelerated: Whether the renderer should use
+            hardware acceleration. True requires it, False forces the software
+            renderer, and None prefers hardware acceleration when available.
+            Default is None.
+        :param bool target_texture: Whether the renderer should support
+            rendering to textures. Default is False.
+        :param int texture_budget: The number of bytes the textures cached by
+            `blit` may use. Default is `TEXTURE_BUDGET`.
+        :param bool headless: Whether the window renders offscreen. A headless
+            window is never shown: it draws into a target texture of its size,
+            `update` does not present anything, and the frames are read back
+            with `read_pixels_into`. Default is False.
         :param str title: The title of the window. Default is "pygame".
         :param Tuple[int, int] size: The width and height of the window.
             Default is (640, 480).
@@ -72,50 +379,20 @@ class Window:
         :raises ValueError: If any parameter has an invalid value.
         :raises AttributeError: If an invalid parameter is specified.
         """
-        self.__window__ = sdl.Window(hidden=True)
-        self.__renderer__ = sdl.Renderer(self.__window__)
-
-        for key, value in self.__dict__.items():
-            setattr(self, key, value)
-
-        for key, value in args.items():
-            if key in self.__dict__:
-                setattr(self, key, value)
-            else:
-                raise AttributeError(f"'Window' type has no attribute '{key}'")
-
-    def __getattr__(self, name):
-        """
-        Called when an attribute lookup has not found the attribute in the usual
-        places (i.e., it is not an instance attribute nor is it found in the
-        class tree for `self`). This method looks for the attribute in the
-        `__dict__` dictionary and returns it if found.
-
-        :param str name: The name of the attribute to retrieve.
-        :return: The value of the attribute if found.
-        :raises AttributeError: If the attribute is not found in the `__dict__`
-            dictionary.
-        """
-        if name in self.__dict__:
-            return self.__dict__[name]
-        return self.__getattribute__(name)
-
-    def __setattr__(self, name, value):
-        """
-        Called when an attribute is set on an instance of the class.
-
-        This method first checks if the attribute already exists in the
-        instance's `__dict__` dictionary. If it does, the method updates the
-        existing attribute value in the dictionary. Otherwise, the method calls
-        the `super()` function to invoke the base class's `__setattr__` method,
-        which sets the attribute on the instance using the default behavior.
-
-        :param str name: The name of the attribute to set.
-        :param Any value: The value to set the attribute to.
-        """
-        if name in self.__dict__:
-            self.__dict__[name] = value
-        super().__setattr__(name, value)
+        self.__resources__ = WindowResources(sdl.Window(hidden=True))
+        self.__options__ = {
+            "accelerated": -1 if accelerated is None else int(bool(accelerated)),
+            "vsync": bool(vsync),
+            "target_texture": bool(target_texture or headless),
+        }
+        self.__state__ = WindowState()
+        self.__dirty__ = False
+        self.__closed__ = False
+        super().__init__(texture_budget=texture_budget, headless=headless)
+        self.__finalizer__ = track(self)
+
+        args.setdefault("position", WINDOWPOS_CENTERED)
+        self.configure(**args)
 
     def __eq__(self, other):
         """
@@ -171,15 +448,21 @@ class Window:
         module. If `color` is not specified, the default color is set to
         (0, 0, 0). Then, this method calls the `clear` method of the
         `__renderer__` attribute to replace the contents of the window with the
-        specified color.
+        specified color. The layers of the window with a negative depth are
+        then composited over the color.
 
         :param Union[Tuple[int, int, int], ColorValue] color: The RGB values
             (0-255) of the color to fill the window with, specified as a tuple
             of integers, or a `ColorValue` object from `pygame`. If not
             specified, the default color is (0, 0, 0).
         """
-        self.__renderer__.draw_color = pygame.Color(color)
-        self.__renderer__.clear()
+        renderer = self.renderer
+        renderer.draw_color = to_color(color)
+        renderer.clear()
+        self.__composite__(True)
+        self.__dirty__ = True
+        if self.__stats__ is not None:
+            self.__stats__.fill_calls += 1
 
     def update(self):
         """
@@ -188,9 +471,74 @@ class Window:
         This method calls the `present` method of the `__renderer__` attribute
         of the instance, which updates the window to reflect any changes made
         to its contents, such as drawing new shapes or changing the color of
-        existing ones.
+        existing ones. The frame of the mirrored window is drawn first, then
+        submitted command lists are replayed and the layers of the window with
+        a non-negative depth are composited, and the frame is captured just
+        before it is presented while recording, and published to the windows
+        mirroring this one. A frame rendered at a reduced resolution is
+        upscaled to the size of the window before any of this. A headless
+        window has nothing to present, so its frame is only captured and
+        marked as clean. A throttled window that is not `active`
+        skips all of this and drops the submitted command lists.
+
+        :raises RuntimeError: If the window has been destroyed.
+        """
+        if self.__closed__:
+            raise RuntimeError("the window has been destroyed")
+        if not self.__throttle__():
+            return
+        self.__receive__()
+        if self.__commands__:
+            self.replay()
+        self.__composite__(False)
+        if self.__scaled__ is not None:
+            self.__resolve__()
+        self.__capture__()
+        self.__publish__()
+        self.__present__()
+        self.__dirty__ = False
+
+    def configure(self, **changes):
+        """
+        Apply many changes to the configuration of the window at once.
+
+        The changes are collapsed before anything is sent to SDL: values equal
+        to the current ones are skipped, and when both `minimized` and
+        `maximized` are set to True only the last one is kept. The remaining
+        changes are then applied in a fixed order, with geometry before
+        fullscreen and window state. A window that is being hidden is hidden
+        first and a window that is being shown is shown last, so the user
+        never sees the intermediate steps.
+
+        :param changes: The new values of the properties to change, with the
+            same names and meanings as the arguments of `__init__`.
+        :raises ValueError: If any parameter has an invalid value.
+        :raises AttributeError: If an invalid parameter is specified.
+        """
+        changes = collapse(changes)
+        visible = changes.pop("visible", self.__state__.visible)
+        if not visible:
+            self.visible = False
+
+        for key in self.__order__:
+            if key in changes:
+                setattr(self, key, changes[key])
+
+        if visible:
+            self.visible = True
+
+    def transaction(self):
         """
-        self.__renderer__.present()
+        Start a transaction on the configuration of the window.
+
+        The returned object accepts the same properties as the window. Changes
+        assigned to it are applied together through `configure` when the
+        transaction is committed, which happens automatically at the end of a
+        `with` block.
+
+        :return: A new `WindowTransaction` for this window.
+        """
+        return WindowTransaction(self)
 
     def hide(self):
         """
@@ -218,6 +566,9 @@ class Window:
         representation.
         """
         self.__window__.minimize()
+        if self.__stats__ is not None:
+            self.__stats__.property_calls += 1
+        self.__state__.apply(minimized=True)
 
     def maximize(self):
         """
@@ -226,6 +577,9 @@ class Window:
         This method expands the window to fill the entire screen.
         """
         self.__window__.maximize()
+        if self.__stats__ is not None:
+            self.__stats__.property_calls += 1
+        self.__state__.apply(minimized=False, maximized=True)
 
     def restore(self):
         """
@@ -235,6 +589,9 @@ class Window:
         it has been minimized or maximized.
         """
         self.__window__.restore()
+        if self.__stats__ is not None:
+            self.__stats__.property_calls += 1
+        self.__state__.apply(minimized=False, maximized=False)
 
     def destroy(self):
         """
@@ -243,8 +600,51 @@ class Window:
         This method calls the `destroy` method of the `__window__` attribute of
         the instance, which presumably is an instance of a GUI toolkit's window
         class. This method frees up any system resources used by the window.
+
+        The streaming texture, the cached textures and the renderer are
+        released first, since SDL textures must not outlive their renderer.
+        A recording in progress is stopped before anything is released, and
+        the native resources are released even if stopping it fails.
+        Destroying a window more than once has no effect.
+        """
+        if self.__closed__:
+            return
+        self.__closed__ = True
+        self.__dirty__ = False
+        self.__finalizer__.detach()
+        untrack(self)
+        try:
+            self.__detach__()
+        finally:
+            self.__resources__.release()
+
+    def reset(self, **config):
+        """
+        Bring the window back to the state of a new window, keeping the native
+        window and its renderer.
+
+        Everything `destroy` detaches is detached the same way: a recording is
+        stopped, mirrors are removed, layers are removed, and submitted command
+        lists and cached textures are dropped. Statistics, throttling, dynamic
+        resolution and resize debouncing are disabled, and the window is
+        configured as a new window, which hides it.
+
+        :param config: The configuration to apply instead of the one of a new
+            window, with the same names and meanings as the arguments of
+            `__init__`.
+        :raises RuntimeError: If the window has been destroyed.
+        :raises AttributeError: If an invalid parameter is specified.
         """
-        self.__window__.destroy()
+        if self.__closed__:
+            raise RuntimeError("the window has been destroyed")
+        self.__detach__()
+        self.__dirty__ = False
+        self.disable_stats()
+        self.disable_throttling()
+        self.disable_dynamic_resolution()
+        self.disable_resize_debounce()
+        defaults = {**WindowState.__defaults__, "position": WINDOWPOS_CENTERED}
+        self.configure(**{**defaults, **config})
 
     # Getters
     @property
@@ -254,7 +654,7 @@ class Window:
 
         :return: The title of the window as a string.
         """
-        return self.__window__.__dict__["title"]
+        return self.__state__.title
 
     @property
     def size(self):
@@ -264,7 +664,7 @@ class Window:
         :return: The size of the window as a tuple of two integers representing
             the width and height of the window in pixels.
         """
-        return self.__window__.__dict__["size"]
+        return self.__state__.size
 
     @property
     def position(self):
@@ -274,7 +674,7 @@ class Window:
         :return: The position of the window as a tuple of two integers representing
             the x and y coordinates of the top-left corner of the window in pixels.
         """
-        return self.__window__.__dict__["position"]
+        return self.__state__.position
 
     @property
     def fullscreen(self):
@@ -284,7 +684,7 @@ class Window:
         :return: True if the window is currently displayed in fullscreen mode, False
             otherwise.
         """
-        return self.__window__.__dict__["fullscreen"]
+        return self.__state__.fullscreen
 
     @property
     def visible(self):
@@ -293,7 +693,7 @@ class Window:
 
         :return: True if the window is currently visible, False otherwise.
         """
-        return self.__window__.__dict__["visible"]
+        return self.__state__.visible
 
     @property
     def borderless(self):
@@ -302,7 +702,7 @@ class Window:
 
         :return: True if the window is currently borderless, False otherwise.
         """
-        return self.__window__.__dict__["borderless"]
+        return self.__state__.borderless
 
     @property
     def resizable(self):
@@ -311,7 +711,7 @@ class Window:
 
         :return: True if the window is currently resizable, False otherwise.
         """
-        return self.__window__.__dict__["resizable"]
+        return self.__state__.resizable
 
     @property
     def minimized(self):
@@ -320,7 +720,7 @@ class Window:
 
         :return: True if the window is currently minimized, False otherwise.
         """
-        return self.__window__.__dict__["minimized"]
+        return self.__state__.minimized
 
     @property
     def maximized(self):
@@ -329,7 +729,7 @@ class Window:
 
         :return: True if the window is currently maximized, False otherwise.
         """
-        return self.__window__.__dict__["maximized"]
+        return self.__state__.maximized
 
     # Setters
     @title.setter
@@ -339,7 +739,12 @@ class Window:
 
         :param str new_title: The new title to set.
         """
+        if value == self.__state__.title:
+            return
         self.__window__.title = value
+        if self.__stats__ is not None:
+            self.__stats__.property_calls += 1
+        self.__state__.apply(title=value)
 
     @size.setter
     def size(self, value):
@@ -350,7 +755,19 @@ class Window:
             tuple of two integers representing the width and height of the
             window in pixels.
         """
+        value = tuple(value)
+        if value == self.__state__.size:
+            return
         self.__window__.size = value
+        if self.__stats__ is not None:
+            self.__stats__.property_calls += 1
+        self.__state__.apply(size=value)
+        if self.__resize__ is not None and not self.__resize__.pending:
+            self.__resize__.size = value
+        if self.__renderer__ is not None and (
+            self.__headless__ or self.__resolution__ < 1
+        ):
+            self.__retarget__()
 
     @position.setter
     def position(self, value):
@@ -361,7 +778,14 @@ class Window:
             a tuple of two integers representing the x and y coordinates of the
             top-left corner of the window in pixels.
         """
+        if not isinstance(value, int):
+            value = tuple(value)
+        if value == self.__state__.position:
+            return
         self.__window__.position = value
+        if self.__stats__ is not None:
+            self.__stats__.property_calls += 1
+        self.__state__.apply(position=value)
 
     @fullscreen.setter
     def fullscreen(self, value):
@@ -371,10 +795,16 @@ class Window:
         :param bool value: True if the window should be displayed in fullscreen
             mode, False otherwise.
         """
+        value = bool(value)
+        if value == self.__state__.fullscreen:
+            return
         if value:
             self.__window__.set_fullscreen(True)
         else:
             self.__window__.set_windowed()
+        if self.__stats__ is not None:
+            self.__stats__.property_calls += 1
+        self.__state__.apply(fullscreen=value)
 
     @visible.setter
     def visible(self, value):
@@ -383,10 +813,19 @@ class Window:
 
         :param bool value: True if the window should be visible, False otherwise.
         """
+        value = bool(value)
+        if value == self.__state__.visible:
+            return
+        if self.__headless__:
+            self.__state__.apply(visible=value)
+            return
         if value:
             self.__window__.show()
         else:
             self.__window__.hide()
+        if self.__stats__ is not None:
+            self.__stats__.property_calls += 1
+        self.__state__.apply(visible=value)
 
     @borderless.setter
     def borderless(self, value):
@@ -396,7 +835,13 @@ class Window:
         :param bool value: True if the window should be borderless, False
             otherwise.
         """
-        self.__window__.borderless = not value
+        value = bool(value)
+        if value == self.__state__.borderless:
+            return
+        self.__window__.borderless = value
+        if self.__stats__ is not None:
+            self.__stats__.property_calls += 1
+        self.__state__.apply(borderless=value)
 
     @resizable.setter
     def resizable(self, value):
@@ -406,7 +851,13 @@ class Window:
         :param bool value: True if the window should be resizable, False
             otherwise.
         """
+        value = bool(value)
+        if value == self.__state__.resizable:
+            return
         self.__window__.resizable = value
+        if self.__stats__ is not None:
+            self.__stats__.property_calls += 1
+        self.__state__.apply(resizable=value)
 
     @minimized.setter
     def minimized(self, value):
@@ -416,10 +867,12 @@ class Window:
         :param bool value: True if the window should be maximized, False
             otherwise.
         """
+        if bool(value) == self.__state__.minimized:
+            return
         if value:
-            self.__window__.minimize()
+            self.minimize()
         else:
-            self.__window__.restore()
+            self.restore()
 
     @maximized.setter
     def maximized(self, value):
@@ -429,7 +882,9 @@ class Window:
         :param bool value: True if the window should be minimized, False
             otherwise.
         """
+        if bool(value) == self.__state__.maximized:
+            return
         if value:
-            self.__window__.maximize()
+            self.maximize()
         else:
-            self.__window__.restore()
+            self.restore()
@@ -1,14 +1,103 @@
-from typing import Tuple, Union
+import weakref
+from types import TracebackType
+from typing import Any, Dict, Optional, Tuple, Type, Union
 
-from pygame import Color
-from pygame import _sdl2 as sdl
+from pygame.event import Event
+
+from pygwin.clock import LoopMixin
+from pygwin.draw import ColorValue, DrawMixin
+from pygwin.layer import LayerMixin
+from pygwin.lifecycle import LifecycleMixin, WindowResources
+from pygwin.mirror import MirrorMixin
+from pygwin.record import RecordingMixin
+from pygwin.target import TargetMixin
 
 WINDOWPOS_CENTERED: int
 WINDOWPOS_UNDEFINED: int
+STATE_EVENTS: Dict[int, Dict[str, bool]]
+
+class WindowState:
+    title: str
+    size: Tuple[int, int]
+    position: Union[int, Tuple[int, int]]
+    fullscreen: bool
+    visible: bool
+    borderless: bool
+    resizable: bool
+    minimized: bool
+    maximized: bool
+
+    def __init__(
+        self,
+        *,
+        title: str = "pygame",
+        size: Tuple[int, int] = (640, 480),
+        position: Union[int, Tuple[int, int]] = WINDOWPOS_UNDEFINED,
+        fullscreen: bool = False,
+        visible: bool = False,
+        borderless: bool = False,
+        resizable: bool = False,
+        minimized: bool = False,
+        maximized: bool = False,
+    ) -> None: ...
+    def snapshot(self) -> Dict[str, Any]: ...
+    def apply(
+        self,
+        *,
+        title: str = ...,
+        size: Tuple[int, int] = ...,
+        position: Union[int, Tuple[int, int]] = ...,
+        fullscreen: bool = ...,
+        visible: bool = ...,
+        borderless: bool = ...,
+        resizable: bool = ...,
+        minimized: bool = ...,
+        maximized: bool = ...,
+    ) -> None: ...
+    def apply_event(self, event: Event) -> None: ...
+
+class WindowTransaction:
+    __window__: Window
+    __changes__: Dict[str, Any]
+
+    title: str
+    size: Tuple[int, int]
+    position: Union[int, Tuple[int, int]]
+    fullscreen: bool
+    visible: bool
+    borderless: bool
+    resizable: bool
+    minimized: bool
+    maximized: bool
+
+    def __init__(self, window: Window) -> None: ...
+    def __enter__(self) -> WindowTransaction: ...
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None: ...
+    def commit(self) -> None: ...
+    def rollback(self) -> None: ...
 
-class Window:
-    __window__: sdl.Window
-    __renderer__: sdl.Renderer
+def collapse(changes: Dict[str, Any]) -> Dict[str, Any]: ...
+
+class Window(
+    DrawMixin,
+    TargetMixin,
+    LayerMixin,
+    MirrorMixin,
+    RecordingMixin,
+    LoopMixin,
+    LifecycleMixin,
+):
+    __resources__: WindowResources
+    __finalizer__: weakref.finalize[[WindowResources], None]
+    __options__: Dict[str, int]
+    __state__: WindowState
+    __dirty__: bool
+    __closed__: bool
 
     title: str
     size: Tuple[int, int]
@@ -22,6 +111,12 @@ class Window:
 
     def __init__(
         self,
+        *,
+        vsync: bool = False,
+        accelerated: Optional[bool] = None,
+        target_texture: bool = False,
+        texture_budget: int = ...,
+        headless: bool = False,
         title: str = "pygame",
         size: Tuple[int, int] = (640, 480),
         position: Union[int, Tuple[int, int]] = WINDOWPOS_CENTERED,
@@ -32,11 +127,38 @@ class Window:
         minimized: bool = False,
         maximized: bool = False,
     ) -> None: ...
-    def fill(self, color: Union[Color, Tuple[int, int, int]] = (0, 0, 0)) -> None: ...
+    def fill(self, color: ColorValue = (0, 0, 0)) -> None: ...
     def update(self) -> None: ...
+    def configure(
+        self,
+        *,
+        title: str = ...,
+        size: Tuple[int, int] = ...,
+        position: Union[int, Tuple[int, int]] = ...,
+        fullscreen: bool = ...,
+        visible: bool = ...,
+        borderless: bool = ...,
+        resizable: bool = ...,
+        minimized: bool = ...,
+        maximized: bool = ...,
+    ) -> None: ...
+    def transaction(self) -> WindowTransaction: ...
     def hide(self) -> None: ...
     def show(self) -> None: ...
     def minimize(self) -> None: ...
     def maximize(self) -> None: ...
     def restore(self) -> None: ...
     def destroy(self) -> None: ...
+    def reset(
+        self,
+        *,
+        title: str = ...,
+        size: Tuple[int, int] = ...,
+        position: Union[int, Tuple[int, int]] = ...,
+        fullscreen: bool = ...,
+        visible: bool = ...,
+        borderless: bool = ...,
+        resizable: bool = ...,
+        minimized: bool = ...,
+        maximized: bool = ...,
+    ) -> None: ...
@@ -0,0 +1,102 @@
+import asyncio
+
+import pygame
+
+import pygwin
+
+
+def test_events():
+    pygame.init()
+    window = pygwin.Window()
+    other = pygwin.Window()
+
+    async def main():
+        pump = pygwin.aio.get_pump(rate=500, slice=0.001)
+        assert pump is pygwin.aio.get_pump()
+        assert pump.interval == 1 / 500
+
+        events = window.events()
+        pygame.event.post(
+            pygame.event.Event(pygame.WINDOWMOVED, window=other.__window__, x=1, y=1)
+        )
+        pygame.event.post(
+            pygame.event.Event(pygame.WINDOWMOVED, window=window.__window__, x=5, y=6)
+        )
+        event = await asyncio.wait_for(events.__anext__(), 1)
+        assert event.type == pygame.WINDOWMOVED
+        assert window.position == (5, 6)
+        assert pump.running
+
+        window.destroy()
+        await events.aclose()
+        await asyncio.sleep(pump.interval * 2)
+        assert not pump.running
+        print(pump)
+
+    asyncio.run(main())
+    window.destroy()
+    other.destroy()
+    pygame.quit()
+
+
+def test_unrouted():
+    pygame.init()
+    window = pygwin.Window()
+    handled = []
+
+    async def main():
+        pump = pygwin.aio.EventPump()
+        queue = pump.subscribe(window)
+        await pump.pump()
+        while not queue.empty():
+            queue.get_nowait()
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        assert await pump.pump() == 0
+        assert queue.empty()
+        assert not pygame.event.peek(pygame.QUIT)
+        assert [event.type for event in pump.backlog] == [pygame.QUIT]
+
+        pump.fallback = handled.append
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        assert await pump.pump() == 0
+        assert [event.type for event in handled] == [pygame.QUIT]
+        assert len(pump.backlog) == 1
+        pump.unsubscribe(queue)
+        pump.unsubscribe(queue)
+
+    asyncio.run(main())
+    window.destroy()
+    pygame.quit()
+
+
+def test_frames():
+    pygame.init()
+    window = pygwin.Window()
+    ticks = []
+
+    async def ticker():
+        while len(ticks) < 10:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def frame(window, delta):
+        if len(ticks) >= 10:
+            return False
+        window.fill((255, 0, 0))
+
+    async def main():
+        assert await window.next_frame(fps=200) == 0.0
+        window.fill()
+        assert await window.next_frame(fps=200) > 0
+        assert not window.dirty
+
+        task = asyncio.ensure_future(ticker())
+        pacer = await window.run_async(frame, fps=None)
+        await task
+        return pacer
+
+    pacer = asyncio.run(main())
+    assert pacer.frames > 0
+    assert not window.dirty
+    window.destroy()
+    pygame.quit()
@@ -0,0 +1,42 @@
+import time
+
+import pytest
+
+import pygwin
+
+
+def test_pacer():
+    pacer = pygwin.FramePacer(fps=200)
+    assert pacer.tick() == 0.0
+    assert pacer.fps == 0.0
+    start = time.perf_counter()
+    for _ in range(5):
+        pacer.tick()
+    assert time.perf_counter() - start >= pacer.interval * 4
+    assert pacer.frames == 5
+    assert pacer.fps > 0
+
+    time.sleep(pacer.interval * 3)
+    pacer.tick()
+    assert pacer.overruns == 1
+
+    pacer = pygwin.FramePacer(fps=200, policy=pygwin.PACE_CATCHUP)
+    pacer.tick()
+    time.sleep(pacer.interval * 3)
+    pacer.tick()
+    start = time.perf_counter()
+    pacer.tick()
+    assert time.perf_counter() - start < pacer.interval
+
+    pacer = pygwin.FramePacer(fps=None)
+    pacer.tick()
+    pacer.tick()
+    pacer.reset()
+    assert pacer.tick() == 0.0
+
+    with pytest.raises(ValueError):
+        pygwin.FramePacer(policy="test")
+    with pytest.raises(ValueError):
+        pygwin.FramePacer(fps=-1)
+
+    print(pacer, pygwin.FramePacer())
@@ -0,0 +1,52 @@
+import pickle
+import threading
+
+import pygame
+import pytest
+
+import pygwin
+
+
+def test_commands():
+    numpy = pytest.importorskip("numpy")
+    pygame.init()
+    window = pygwin.Window(size=(8, 8))
+    surface = pygame.Surface((4, 4))
+    lists = []
+
+    def build(index):
+        commands = pygwin.CommandList()
+        commands.fill((index, 0, 0))
+        commands.fill_rects(numpy.array([[0, 0, 2, 2], [4, 4, 2, 2]]), "red")
+        commands.draw_rects([(0, 0, 4, 4)])
+        commands.draw_lines([(0, 0), (7, 7), (0, 7)])
+        commands.draw_points(numpy.zeros((3, 2), dtype=int))
+        commands.blit_array(numpy.zeros((8, 8, 3), dtype=numpy.uint8))
+        lists.append(commands)
+
+    threads = [threading.Thread(target=build, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [len(commands) for commands in lists] == [6] * 4
+    copy = pickle.loads(pickle.dumps(lists[0]))
+    assert list(copy) == list(lists[0])
+
+    lists[0].blit(surface, (2, 2))
+    lists[1].extend(copy)
+    assert len(lists[1]) == 12
+    for commands in lists:
+        window.submit(commands)
+    assert window.dirty
+
+    window.update()
+    assert not window.dirty
+    assert window.replay() == 0
+
+    copy.clear()
+    assert len(copy) == 0
+    print(copy)
+    window.destroy()
+    pygame.quit()
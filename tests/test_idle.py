@@ -0,0 +1,67 @@
+import time
+
+import pygame
+import pytest
+
+import pygwin
+
+
+def event(window, event_type):
+    return pygame.event.Event(event_type, window=window.__window__)
+
+
+def test_throttling():
+    pygame.init()
+    window = pygwin.Window(size=(8, 8))
+    assert window.active
+    policy = window.enable_throttling(unfocused_fps=20, hidden_fps=100)
+
+    assert not window.active
+    window.fill()
+    window.submit(pygwin.CommandList())
+    window.update()
+    assert policy.skipped == 1
+    assert not window.dirty
+    assert window.replay() == 0
+
+    window.show()
+    window.apply_event(event(window, pygame.WINDOWFOCUSLOST))
+    assert not policy.focused
+    assert window.active
+    window.update()
+    assert not window.active
+    assert policy.wait_time(pygwin.window.WindowState(visible=True)) > 0
+    window.update()
+    assert policy.skipped == 2
+    time.sleep(policy.unfocused_interval)
+    assert window.active
+
+    window.update()
+    window.apply_event(event(window, pygame.WINDOWEXPOSED))
+    assert window.active
+    window.update()
+    assert not window.active
+
+    manager = pygwin.WindowManager(window)
+    manager.dispatch(event(window, pygame.WINDOWFOCUSGAINED))
+    assert policy.focused and window.active
+    assert policy.wait_time(pygwin.window.WindowState(visible=True)) == 0.0
+
+    window.minimize()
+    assert not window.active
+    frames = []
+
+    def frame(window, delta):
+        frames.append(time.perf_counter())
+        return len(frames) < 3
+
+    window.run(frame, fps=1000)
+    assert frames[-1] - frames[0] >= policy.hidden_interval * 2
+    print(policy)
+
+    window.disable_throttling()
+    assert window.active
+    with pytest.raises(ValueError):
+        window.enable_throttling(unfocused_fps=0)
+    window.destroy()
+    pygame.quit()
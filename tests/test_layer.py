@@ -0,0 +1,60 @@
+import pygame
+import pytest
+
+import pygwin
+
+
+def test_layers():
+    pygame.init()
+    window = pygwin.Window(headless=True, size=(8, 8))
+    drawn = []
+
+    def background(window):
+        drawn.append("background")
+        window.fill((0, 0, 255))
+
+    def grid(window):
+        drawn.append("grid")
+        window.fill_rects([(0, 0, 2, 2)], (255, 0, 0))
+
+    grid_layer = window.add_layer("grid", grid)
+    window.add_layer("background", background, z=-1)
+    with pytest.raises(ValueError):
+        window.add_layer("grid", grid)
+    assert [layer.name for layer in window.layers] == ["background", "grid"]
+
+    for _ in range(3):
+        window.fill()
+        window.draw_points([(7, 7)], (0, 255, 0))
+        surface = window.renderer.to_surface()
+        assert surface.get_at((4, 4))[:3] == (0, 0, 255)
+        window.update()
+    assert drawn == ["background", "grid"]
+
+    surface = window.renderer.to_surface()
+    assert surface.get_at((0, 0))[:3] == (255, 0, 0)
+    assert surface.get_at((7, 7))[:3] == (0, 255, 0)
+
+    grid_layer.invalidate()
+    window.layers.invalidate("background")
+    window.fill()
+    window.update()
+    assert drawn[2:] == ["background", "grid"]
+
+    grid_layer.z = -2
+    assert window.layers.get("grid") is grid_layer
+    assert [layer.name for layer in window.layers] == ["grid", "background"]
+    window.fill()
+    assert window.renderer.to_surface().get_at((0, 0))[:3] == (0, 0, 255)
+
+    window.size = (4, 4)
+    window.fill()
+    assert grid_layer.texture.width == 4
+    assert window.remove_layer("grid") is grid_layer
+    assert grid_layer.texture is None
+    assert "grid" not in window.layers
+    with pytest.raises(KeyError):
+        window.remove_layer("grid")
+    print(window.layers, grid_layer)
+    window.destroy()
+    pygame.quit()
@@ -0,0 +1,65 @@
+import pygame
+import pytest
+
+import pygwin
+from pygwin.layout import cascade_rects, grid_rects, tile_rects
+
+
+def test_rects():
+    assert tile_rects((0, 0, 300, 200), 3) == [
+        (0, 0, 150, 100),
+        (150, 0, 150, 100),
+        (0, 100, 300, 100),
+    ]
+    assert grid_rects((10, 0, 300, 200), 3, columns=2, gap=10) == [
+        (10, 0, 145, 95),
+        (165, 0, 145, 95),
+        (10, 105, 145, 95),
+    ]
+    assert cascade_rects((0, 0, 100, 100), 3, size=(60, 60), offset=20) == [
+        (0, 0, 60, 60),
+        (20, 20, 60, 60),
+        (40, 40, 60, 60),
+    ]
+    assert cascade_rects((0, 0, 100, 100), 4, size=(60, 60), offset=20)[3][:2] == (
+        0,
+        0,
+    )
+    assert tile_rects((0, 0, 10, 10), 0) == []
+    with pytest.raises(ValueError):
+        grid_rects((0, 0, 10, 10), 1, columns=0)
+
+
+def test_layout():
+    pygame.init()
+    windows = [pygwin.Window(size=(100, 100)) for _ in range(4)]
+    windows[0].show()
+    layout = pygwin.WindowLayout(displays=[(0, 0, 400, 400), (400, 0, 200, 200)])
+
+    assert layout.grid(windows) == 4
+    assert windows[3].position == (200, 200)
+    assert windows[3].size == (200, 200)
+    assert windows[0].visible and not windows[1].visible
+    assert layout.grid(windows) == 0
+    assert layout.moved == 4
+
+    assert layout.tile(windows[:2], display=1) == 2
+    assert windows[1].position == (500, 0)
+
+    rects = [(pygwin.WINDOWPOS_CENTERED,) * 2 + (50, 50), None, (10, 20, 50, 50)]
+    assert layout.place(windows, rects, display=1) == 2
+    assert windows[0].position == (pygwin.WINDOWPOS_CENTERED | 1,) * 2
+    assert windows[2].position == (410, 20)
+    assert windows[0].visible
+
+    assert layout.cascade(windows, size=(100, 100), offset=10) == 4
+    assert windows[3].position == (30, 30)
+
+    layout.refresh()
+    assert layout.displays == [
+        (0, 0) + size for size in pygame.display.get_desktop_sizes()
+    ]
+    print(layout)
+    for window in windows:
+        window.destroy()
+    pygame.quit()
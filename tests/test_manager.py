@@ -0,0 +1,132 @@
+import pygame
+import pytest
+
+import pygwin
+
+
+def test_registry():
+    pygame.init()
+    first = pygwin.Window()
+    second = pygwin.Window()
+    manager = pygwin.WindowManager(first)
+    manager.add(second)
+    manager.add(second)
+
+    assert len(manager) == 2
+    assert list(manager) == [first, second]
+    assert first in manager
+    assert manager.get(second.id) is second
+    assert manager.get(-1) is None
+
+    manager.remove(first)
+    assert first not in manager
+
+    with pytest.raises(KeyError):
+        manager.remove(first)
+
+    with pytest.raises(KeyError):
+        manager.bind(first, pygame.WINDOWCLOSE, print)
+
+    print(manager)
+    first.destroy()
+    second.destroy()
+    pygame.quit()
+
+
+def test_destroyed():
+    pygame.init()
+    first = pygwin.Window()
+    second = pygwin.Window()
+    manager = pygwin.WindowManager(first, second)
+    manager.bind(first, pygame.WINDOWCLOSE, print)
+
+    first.destroy()
+    assert first.id == 0
+    assert first in manager
+    manager.unbind(first, pygame.WINDOWCLOSE)
+    manager.remove(first)
+    assert first not in manager
+    assert list(manager) == [second]
+    with pytest.raises(ValueError):
+        manager.add(first)
+
+    second.fill()
+    second.destroy()
+    assert manager.present_all() == 0
+    assert len(manager) == 0
+    pygame.quit()
+
+
+def test_dispatch():
+    pygame.init()
+    first = pygwin.Window()
+    second = pygwin.Window()
+    manager = pygwin.WindowManager(first, second)
+    calls = []
+
+    def handler(window, event):
+        calls.append((window, event.type))
+
+    manager.bind(first, pygame.WINDOWCLOSE, handler)
+    manager.bind(second, pygame.WINDOWMOVED, handler)
+
+    close = pygame.event.Event(pygame.WINDOWCLOSE, window=first.__window__)
+    moved = pygame.event.Event(pygame.WINDOWMOVED, window=first.__window__, x=0, y=0)
+    assert manager.dispatch(close)
+    assert not manager.dispatch(moved)
+    assert not manager.dispatch(pygame.event.Event(pygame.QUIT))
+    assert calls == [(first, pygame.WINDOWCLOSE)]
+
+    manager.unbind(first, pygame.WINDOWCLOSE, handler)
+    manager.unbind(second, pygame.WINDOWMOVED)
+    assert not manager.dispatch(close)
+
+    manager.bind(first, pygame.USEREVENT, handler)
+    pygame.event.post(pygame.event.Event(pygame.USEREVENT, window=first.__window__))
+    pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+    events = manager.pump()
+    assert [event.type for event in events].count(pygame.USEREVENT) == 1
+    assert calls[-1] == (first, pygame.USEREVENT)
+
+    first.destroy()
+    second.destroy()
+    pygame.quit()
+
+
+def test_present_all():
+    pygame.init()
+    first = pygwin.Window()
+    second = pygwin.Window()
+    manager = pygwin.WindowManager(first, second)
+
+    assert manager.present_all() == 0
+    first.fill((255, 0, 0))
+    assert first.dirty
+    assert not second.dirty
+    assert manager.present_all() == 1
+    assert not first.dirty
+    assert manager.present_all() == 0
+
+    first.destroy()
+    second.destroy()
+    pygame.quit()
+
+
+def test_run():
+    pygame.init()
+    window = pygwin.Window()
+    manager = pygwin.WindowManager(window)
+    frames = []
+
+    def frame(events, delta):
+        frames.append(delta)
+        if len(frames) == 3:
+            return False
+        window.fill()
+        return True
+
+    pacer = manager.run(frame, fps=None)
+    assert pacer.frames == 2
+    assert not window.dirty
+    window.destroy()
+    pygame.quit()
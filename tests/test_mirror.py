@@ -0,0 +1,114 @@
+import time
+
+import pygame
+import pytest
+
+import pygwin
+
+
+def test_mirror():
+    pygame.init()
+    source = pygwin.Window(headless=True, size=(8, 8))
+    preview = pygwin.Window(headless=True, size=(4, 4))
+    scaled = pygwin.Window(headless=True, size=(8, 8))
+
+    mirror = preview.mirror(source, rate=None)
+    half = scaled.mirror(source, scale=0.5, rate=None)
+    assert mirror.source is source and mirror.target is preview
+    assert preview.mirroring is mirror and source.mirroring is None
+    assert half.scale == 0.5
+    with pytest.raises(ValueError):
+        source.mirror(source)
+
+    source.fill((255, 0, 0))
+    source.update()
+    assert preview.dirty and scaled.dirty
+    assert mirror.uploads == 0
+    preview.update()
+    scaled.update()
+    assert mirror.uploads == 1
+    assert preview.renderer.to_surface().get_at((3, 3))[:3] == (255, 0, 0)
+    surface = scaled.renderer.to_surface()
+    assert surface.get_at((3, 3))[:3] == (255, 0, 0)
+    assert surface.get_at((4, 4))[:3] == (0, 0, 0)
+
+    source.update()
+    assert not preview.dirty
+    source.fill((0, 255, 0))
+    source.update()
+    preview.update()
+    scaled.update()
+    assert mirror.uploads == 2
+    assert half.uploads == 2
+
+    assert scaled.unmirror() is half
+    assert scaled.unmirror() is None
+    source.fill()
+    source.update()
+    assert not scaled.dirty
+    source.destroy()
+    assert preview.unmirror() is None
+    assert preview.usage().textures == scaled.usage().textures
+    print(mirror)
+    preview.destroy()
+    scaled.destroy()
+    pygame.quit()
+
+
+def test_rate():
+    pygame.init()
+    source = pygwin.Window(headless=True, size=(4, 4))
+    preview = pygwin.Window(headless=True, size=(4, 4))
+    mirror = preview.mirror(source, rate=1)
+
+    for _ in range(3):
+        source.fill((0, 0, 255))
+        source.update()
+        preview.update()
+    assert mirror.uploads == 1
+    assert preview.renderer.to_surface().get_at((0, 0))[:3] == (0, 0, 255)
+    source.destroy()
+    preview.destroy()
+    pygame.quit()
+
+
+def test_pending():
+    pygame.init()
+    source = pygwin.Window(headless=True, size=(4, 4))
+    preview = pygwin.Window(headless=True, size=(4, 4))
+    manager = pygwin.WindowManager(source, preview)
+    mirror = preview.mirror(source, rate=20)
+
+    source.fill((255, 0, 0))
+    manager.present_all()
+    source.fill((0, 0, 255))
+    manager.present_all()
+    assert source.mirrors.pending
+    assert source.mirrors.skipped == 1
+    deadline = time.perf_counter() + 1
+    while preview.renderer.to_surface().get_at((0, 0))[:3] != (0, 0, 255):
+        assert time.perf_counter() < deadline
+        time.sleep(0.01)
+        manager.present_all()
+    assert not source.mirrors.pending
+    assert mirror.uploads == 2
+    source.destroy()
+    preview.destroy()
+    pygame.quit()
+
+
+def test_present_all():
+    pygame.init()
+    preview = pygwin.Window(headless=True, size=(4, 4))
+    source = pygwin.Window(headless=True, size=(4, 4))
+    manager = pygwin.WindowManager(preview, source)
+    mirror = preview.mirror(source, rate=None)
+
+    source.fill((0, 255, 0))
+    assert manager.present_all() == 2
+    assert mirror.uploads == 1
+    assert preview.renderer.to_surface().get_at((0, 0))[:3] == (0, 255, 0)
+    assert not preview.dirty
+    source.destroy()
+    preview.destroy()
+    pygame.quit()
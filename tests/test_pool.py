@@ -0,0 +1,61 @@
+import pygame
+import pytest
+
+import pygwin
+
+
+def test_pool():
+    pygame.init()
+    pool = pygwin.WindowPool(size=2, limit=2, idle_time=60)
+    assert len(pool) == 2
+
+    window = pool.acquire(title="popup", size=(200, 100))
+    assert pool.hits == 1 and pool.active == 1
+    assert window.usage().renderers == 1
+    assert window.visible
+    assert window.title == "popup"
+    assert window.size == (200, 100)
+
+    window.enable_throttling()
+    window.add_layer("background", lambda target: target.fill((255, 0, 0)))
+    window.fill()
+    pool.release(window)
+    assert len(pool) == 2 and pool.active == 0
+    assert not window.visible
+    assert window.title == "pygame"
+    assert window.size == (640, 480)
+    assert not window.dirty
+    assert len(window.layers) == 0
+    window.fill()
+    window.update()
+    assert window.active
+
+    with pytest.raises(KeyError):
+        pool.release(window)
+    with pytest.raises(AttributeError):
+        pool.acquire(color=1)
+    assert len(pool) == 2
+
+    assert pool.acquire(visible=False) is window
+    assert not window.visible
+    others = [pool.acquire(), pool.acquire()]
+    assert pool.misses == 1
+    for other in others:
+        pool.release(other)
+    pool.release(window)
+    assert len(pool) == 2
+
+    assert pool.evict() == 0
+    assert pool.evict(now=float("inf")) == 2
+    assert len(pool) == 0
+    pool.prewarm(5)
+    assert len(pool) == 2
+    pool.clear()
+    assert len(pool) == 0
+
+    window = pool.acquire()
+    window.destroy()
+    pool.release(window)
+    assert len(pool) == 0 and pool.active == 0
+    print(pool)
+    pygame.quit()
@@ -0,0 +1,47 @@
+import os
+
+import pygame
+import pytest
+
+import pygwin
+
+
+def test_recording(tmp_path):
+    numpy = pytest.importorskip("numpy")
+    pygame.init()
+    window = pygwin.Window(size=(8, 4))
+    path = str(tmp_path / "session.raw")
+
+    recorder = window.start_recording(path)
+    with pytest.raises(RuntimeError):
+        window.start_recording(path)
+    for color in range(100):
+        window.fill((color, 0, 0))
+        window.update()
+    assert window.stop_recording() is recorder
+    assert window.stop_recording() is None
+    assert recorder.frames == 100
+    assert recorder.written + recorder.dropped == 100
+
+    frames = numpy.fromfile(path, numpy.uint8).reshape(-1, 4, 8, 4)
+    assert len(frames) == recorder.written
+    assert (frames[0, :, :, 2] == 0).all()
+    assert (frames[:, :, :, 3] == 255).all()
+    print(recorder)
+
+    directory = str(tmp_path / "frames")
+    recorder = window.start_recording(directory, pygwin.RECORD_PNG, capacity=2)
+    window.fill((255, 0, 0))
+    window.update()
+    window.size = (4, 4)
+    window.update()
+    window.stop_recording()
+    assert recorder.dropped == 1
+    assert os.listdir(directory) == ["frame_000000.png"]
+    image = pygame.image.load(os.path.join(directory, "frame_000000.png"))
+    assert image.get_at((0, 0))[:3] == (255, 0, 0)
+
+    with pytest.raises(ValueError):
+        window.start_recording(path, "gif")
+    window.destroy()
+    pygame.quit()
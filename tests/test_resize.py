@@ -0,0 +1,94 @@
+import pygame
+
+import pygwin
+from pygwin.resize import coalesce
+
+
+def event(window, event_type, x=0, y=0):
+    return pygame.event.Event(event_type, window=window.__window__, x=x, y=y)
+
+
+def test_coalesce():
+    pygame.init()
+    first = pygwin.Window()
+    second = pygwin.Window()
+    events = [
+        event(first, pygame.WINDOWSIZECHANGED, 10, 10),
+        event(first, pygame.WINDOWMOVED, 1, 1),
+        event(second, pygame.WINDOWSIZECHANGED, 30, 30),
+        event(first, pygame.WINDOWSIZECHANGED, 20, 20),
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a),
+    ]
+    coalesced = coalesce(events)
+    assert [e.type for e in coalesced] == [
+        pygame.WINDOWMOVED,
+        pygame.WINDOWSIZECHANGED,
+        pygame.WINDOWSIZECHANGED,
+        pygame.KEYDOWN,
+    ]
+    assert coalesced[2].x == 20
+    assert coalesce(coalesced) is coalesced
+    first.destroy()
+    second.destroy()
+    pygame.quit()
+
+
+def test_debounce():
+    pygame.init()
+    window = pygwin.Window(size=(20, 10), resizable=True)
+    settled = []
+    resize = window.enable_resize_debounce(
+        lambda target, size: settled.append(size), delay=60
+    )
+    assert window.debouncer is resize
+    window.add_layer("grid", lambda target: target.fill((255, 0, 0)))
+    window.fill()
+    window.update()
+    texture = window.layers.get("grid").texture
+
+    window.apply_event(event(window, pygame.WINDOWSIZECHANGED, 40, 30))
+    assert window.resizing
+    assert window.size == (40, 30)
+    assert window.buffer_size == (20, 10)
+    assert window.renderer.logical_size == (20, 10)
+    window.fill()
+    window.update()
+    assert window.layers.get("grid").texture is texture
+    assert window.stream().size == (20, 10)
+    assert not window.settle()
+
+    resize.delay = 0.0
+    assert window.settle()
+    assert settled == [(40, 30)]
+    assert not window.resizing
+    assert window.buffer_size == (40, 30)
+    assert window.renderer.logical_size == (0, 0)
+    window.fill()
+    window.update()
+    assert window.layers.get("grid").texture.width == 40
+    assert window.stream().size == (40, 30)
+
+    window.size = (50, 50)
+    assert window.buffer_size == (50, 50)
+    window.disable_resize_debounce()
+    assert window.debouncer is None
+    assert window.buffer_size == (50, 50)
+    print(resize)
+    window.destroy()
+    pygame.quit()
+
+
+def test_letterbox():
+    pygame.init()
+    window = pygwin.Window(size=(20, 10), resizable=True)
+    window.enable_resize_debounce(delay=60)
+    renderer = window.renderer
+    window.__window__.size = (40, 30)
+    window.apply_event(event(window, pygame.WINDOWSIZECHANGED, 40, 30))
+    assert renderer.logical_size == (20, 10)
+    assert renderer.scale == (2.0, 2.0)
+    viewport = renderer.get_viewport()
+    assert viewport.size == (20, 10)
+    assert viewport.y > 0
+    window.destroy()
+    pygame.quit()
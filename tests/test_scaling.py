@@ -0,0 +1,76 @@
+import pygame
+import pytest
+
+import pygwin
+
+
+def test_controller():
+    controller = pygwin.ResolutionController(0.01, minimum=0.5, cooldown=1)
+    assert controller.scale == 1.0
+    assert controller.record(0.02) == 0.9
+    assert controller.average is None
+    assert controller.record(0.02) == 0.9
+    for _ in range(20):
+        controller.record(0.02)
+    assert controller.scale == 0.5
+
+    for _ in range(20):
+        controller.record(0.001)
+    assert controller.scale == 1.0
+    assert controller.changes == 10
+
+    controller.scale = 0.7
+    controller.reset()
+    assert controller.scale == 1.0
+    print(controller)
+
+    with pytest.raises(ValueError):
+        pygwin.ResolutionController(minimum=0)
+    with pytest.raises(ValueError):
+        pygwin.ResolutionController(frame_time=0)
+
+
+def test_resolution():
+    pygame.init()
+    window = pygwin.Window(headless=True, size=(8, 8))
+    window.resolution_scale = 0.5
+    window.fill((0, 0, 255))
+    assert window.renderer.target.width == 4
+    window.fill_rects([(4, 4, 4, 4)], (255, 0, 0))
+    window.update()
+    assert window.renderer.target.width == 4
+    assert window.renderer.scale == (0.5, 0.5)
+
+    window.fill((0, 0, 255))
+    window.fill_rects([(4, 4, 4, 4)], (255, 0, 0))
+    buffer = bytearray(8 * 8 * 4)
+    window.read_pixels_into(buffer)
+    assert buffer[:3] == bytearray((255, 0, 0))
+    assert buffer[-4:] == bytearray((0, 0, 255, 255))
+
+    window.size = (4, 4)
+    assert window.renderer.target.width == 2
+    with pytest.raises(ValueError):
+        window.resolution_scale = 2
+    window.resolution_scale = 1
+    assert window.renderer.target.width == 4
+    assert window.renderer.scale == (1.0, 1.0)
+
+    frames = []
+
+    def frame(window, delta):
+        if len(frames) == 5:
+            return False
+        frames.append(window.resolution_scale)
+        window.fill()
+
+    scaler = window.enable_dynamic_resolution(1e-9, cooldown=0)
+    assert window.scaler is scaler
+    window.run(frame, fps=None)
+    assert frames == [1.0, 0.9, 0.8, 0.7, 0.6]
+    assert window.adapt_resolution(1) == 0.5
+    window.disable_dynamic_resolution()
+    assert window.resolution_scale == 1.0
+    assert window.adapt_resolution(1) == 1.0
+    window.destroy()
+    pygame.quit()
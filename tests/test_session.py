@@ -0,0 +1,65 @@
+import pygame
+import pytest
+
+import pygwin
+
+
+def test_session(tmp_path):
+    pygame.init()
+    session = pygwin.WindowSession(
+        {
+            "main": {"title": "main", "size": (64, 48), "visible": True},
+            "tools": {"title": "tools", "position": (10, 20), "vsync": True},
+        }
+    )
+    session.add("log", size=(32, 32))
+    tools = session["tools"]
+    assert len(session) == 3 and "log" in session
+    assert session.materialized == 0
+
+    assert tools.title == "tools"
+    assert tools.resizable is False
+    assert session["log"].position == pygwin.WINDOWPOS_CENTERED
+    tools.size = (80, 60)
+    tools.configure(title="palette")
+    tools.hide()
+    assert not tools.materialized
+    assert tools.size == (80, 60)
+
+    assert session.open() == 1
+    assert session["main"].materialized and session["main"].visible
+    assert session.open() == 0
+
+    session["log"].fill()
+    assert session["log"].materialized
+    assert not session["log"].visible
+    assert session["log"].position == pygwin.WINDOWPOS_CENTERED
+    assert session["log"].window.snapshot()["size"] == (32, 32)
+    tools.show()
+    assert tools.window.title == "palette"
+    assert tools.window.size == (80, 60)
+    tools.position = (30, 40)
+
+    path = tmp_path / "session.json"
+    session.save(path)
+    session.close()
+    assert session.materialized == 0
+    assert tools.position == (30, 40)
+
+    loaded = pygwin.WindowSession.load(path)
+    assert loaded.materialized == 0
+    assert loaded["tools"].size == (80, 60)
+    assert loaded["tools"].position == (30, 40)
+    assert loaded["tools"].spec()["vsync"] is True
+    assert [window.name for window in loaded] == ["main", "tools", "log"]
+
+    with pytest.raises(ValueError):
+        loaded.add("main")
+    with pytest.raises(AttributeError):
+        loaded.add("bad", color=1)
+    with pytest.raises(ValueError):
+        pygwin.WindowSession.from_dict({"version": 0, "windows": {}})
+    loaded.remove("log")
+    assert "log" not in loaded
+    print(loaded, tools)
+    pygame.quit()
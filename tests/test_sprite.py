@@ -0,0 +1,66 @@
+import pygame
+import pytest
+
+import pygwin
+
+
+def test_batch():
+    pygame.init()
+    window = pygwin.Window()
+    first = pygame.Surface((8, 8))
+    second = window.textures.get(pygame.Surface((4, 4)))
+
+    with pygwin.SpriteBatch(window) as batch:
+        batch.draw(first, dstrect=(0, 0))
+        batch.draw(second, dstrect=(8, 8), blend_mode=pygame.BLENDMODE_ADD)
+        batch.draw(first, srcrect=(0, 0, 4, 4), dstrect=(4, 4, 4, 4), angle=45)
+        batch.draw(second, dstrect=(0, 0, 2, 2), flip_x=True)
+        assert len(batch) == 4
+    assert len(batch) == 0
+    assert window.dirty
+
+    batch.draw(first)
+    batch.draw(first)
+    assert batch.flush() == 1
+    assert batch.flush() == 0
+
+    second.blend_mode = pygame.BLENDMODE_NONE
+    batch.draw_many(first, [(0, 0), (8, 8)])
+    batch.draw_many(second, [(0, 0, 4, 4)], blend_mode=pygame.BLENDMODE_BLEND)
+    batch.draw_many(first, [(16, 16)])
+    assert len(batch) == 4
+    assert batch.flush() == 2
+    assert second.blend_mode == pygame.BLENDMODE_NONE
+
+    batch = pygwin.SpriteBatch(window, sort=False)
+    batch.draw(first)
+    batch.draw(second)
+    batch.draw(first)
+    assert batch.flush() == 3
+    batch.draw(second, blend_mode=pygame.BLENDMODE_ADD)
+    batch.draw(second, dstrect=(4, 4), blend_mode=pygame.BLENDMODE_ADD)
+    batch.draw(second)
+    assert batch.flush() == 2
+    assert second.blend_mode == pygame.BLENDMODE_NONE
+
+    with pytest.raises(RuntimeError):
+        with batch:
+            batch.draw(first)
+            raise RuntimeError
+    assert len(batch) == 0
+
+    print(batch)
+    window.destroy()
+    pygame.quit()
+
+
+def test_batch_numpy():
+    numpy = pytest.importorskip("numpy")
+    pygame.init()
+    window = pygwin.Window()
+    batch = pygwin.SpriteBatch(window)
+    batch.draw_many(pygame.Surface((4, 4)), numpy.array([[0, 0], [4, 4]]))
+    assert len(batch) == 2
+    assert batch.flush() == 1
+    window.destroy()
+    pygame.quit()
@@ -0,0 +1,61 @@
+import pygame
+
+import pygwin
+
+
+def test_histogram():
+    histogram = pygwin.stats.Histogram()
+    assert histogram.percentile(50) == 0.0
+    assert histogram.mean == 0.0
+    for value in (0.001, 0.002, 0.010, 1.0):
+        histogram.record(value)
+    assert histogram.count == 4
+    assert histogram.max == 1.0
+    assert histogram.percentile(50) == 0.002
+    assert histogram.percentile(100) == 1.0
+    assert histogram.as_dict()["buckets"][-1] == 1
+
+    histogram.reset()
+    assert histogram.count == 0
+    print(histogram)
+
+
+def test_window_stats():
+    pygame.init()
+    exports = []
+    window = pygwin.Window()
+    assert window.stats is None
+
+    stats = window.enable_stats(lambda window, stats: exports.append(stats), 0)
+    assert window.enable_stats(interval=0) is stats
+    stats.hook = lambda window, stats: exports.append(stats)
+    window.fill()
+    window.update()
+    window.update()
+    window.visible = True
+    window.visible = True
+    window.minimize()
+    window.maximize()
+    window.restore()
+
+    window.configure(title="stats", size=(320, 240), position=(0, 0))
+    window.configure(fullscreen=True, borderless=True, resizable=True)
+
+    assert stats.fill_calls == 1
+    assert stats.update_calls == 2
+    assert stats.property_calls == 10
+    assert stats.renderer_time > 0
+    assert stats.frame_times.count == 1
+    assert stats.present_times.count == 2
+    assert exports == [stats]
+    assert stats.as_dict()["update_calls"] == 2
+
+    stats.reset()
+    assert stats.update_calls == 0
+    print(stats)
+
+    window.disable_stats()
+    assert window.stats is None
+    window.update()
+    window.destroy()
+    pygame.quit()
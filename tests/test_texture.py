@@ -0,0 +1,103 @@
+import gc
+
+import pygame
+import pytest
+
+import pygwin
+
+
+def test_cache():
+    pygame.init()
+    window = pygwin.Window()
+    cache = window.textures
+    first = pygame.Surface((16, 16))
+    second = pygame.Surface((16, 16))
+
+    texture = cache.get(first)
+    assert cache.get(first) is texture
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    assert cache.get(first, version=1) is texture
+    assert cache.misses == 2
+
+    cache.get(second)
+    assert len(cache) == 2
+    assert cache.bytes == 2 * 16 * 16 * pygwin.texture.TEXTURE_DEPTH
+
+    cache.budget = 16 * 16 * pygwin.texture.TEXTURE_DEPTH
+    assert len(cache) == 1
+    assert cache.evictions == 1
+
+    cache.invalidate(second)
+    assert len(cache) == 0
+
+    cache.get(second)
+    del second
+    gc.collect()
+    cache.get(first)
+    assert len(cache) == 1
+
+    cache.clear()
+    assert cache.bytes == 0
+
+    print(cache)
+    window.destroy()
+    pygame.quit()
+
+
+def test_blit():
+    pygame.init()
+    window = pygwin.Window(texture_budget=1024)
+    surface = pygame.Surface((8, 8))
+    window.blit(surface)
+    window.blit(surface, (4, 4), area=(0, 0, 4, 4))
+    window.blit(surface, (0, 0, 16, 16))
+    assert window.textures.hits == 2
+    assert window.dirty
+
+    resized = pygame.Surface((32, 32))
+    window.blit(resized)
+    window.textures.get(resized, version=1)
+    assert window.textures.budget == 1024
+    window.update()
+    window.destroy()
+    pygame.quit()
+
+
+def test_stream():
+    pygame.init()
+    window = pygwin.Window(size=(4, 2))
+    stream = window.stream()
+    assert window.stream() is stream
+    assert stream.size == (4, 2)
+    assert stream.format == "RGB"
+    assert window.framebuffer().shape == (2, 4, 3)
+
+    window.framebuffer()[0, 0, 0] = 255
+    window.blit_array()
+    window.blit_array(bytes(4 * 2 * 3))
+    window.blit_array(bytearray(4 * 2 * 4), format="BGRA", dest=(0, 0, 2, 1))
+    assert window.stream("BGRA") is not stream
+    assert window.dirty
+
+    with pytest.raises(ValueError):
+        window.blit_array(bytes(3))
+
+    window.size = (8, 8)
+    assert window.stream("BGRA").size == (8, 8)
+
+    print(window.stream())
+    window.destroy()
+    pygame.quit()
+
+
+def test_stream_numpy():
+    numpy = pytest.importorskip("numpy")
+    pygame.init()
+    window = pygwin.Window(size=(4, 2))
+    frame = numpy.asarray(window.framebuffer())
+    frame[:] = 255
+    window.blit_array()
+    window.blit_array(numpy.zeros((2, 4, 3), dtype=numpy.uint8))
+    window.destroy()
+    pygame.quit()
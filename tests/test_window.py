@@ -1,5 +1,6 @@
 import pygame
 import pytest
+from pygame import _sdl2 as sdl
 
 import pygwin
 
@@ -83,3 +84,377 @@ def test_magic_methods():
 
     print(window)
     pygame.quit()
+
+
+def test_state():
+    pygame.init()
+    window = pygwin.Window(title="state", size=(320, 240))
+    other = pygwin.Window()
+    assert window.title == "state"
+    assert window.size == (320, 240)
+    assert other.title == "pygame"
+    assert other.size == (640, 480)
+
+    window.maximized = True
+    assert window.maximized and not window.minimized
+    window.minimized = True
+    assert window.minimized
+    window.restore()
+    assert not window.minimized and not window.maximized
+
+    moved = pygame.event.Event(pygame.WINDOWMOVED, x=10, y=20)
+    window.apply_event(moved)
+    assert window.position == (10, 20)
+    resized = pygame.event.Event(pygame.WINDOWSIZECHANGED, x=100, y=50)
+    window.apply_event(resized)
+    assert window.size == (100, 50)
+    window.apply_event(pygame.event.Event(pygame.WINDOWSHOWN))
+    assert window.visible
+    window.apply_event(pygame.event.Event(pygame.WINDOWHIDDEN))
+    assert not window.visible
+    window.apply_event(pygame.event.Event(pygame.WINDOWMINIMIZED))
+    assert window.minimized
+    window.apply_event(pygame.event.Event(pygame.WINDOWMAXIMIZED))
+    assert window.maximized and not window.minimized
+    window.apply_event(pygame.event.Event(pygame.WINDOWRESTORED))
+    assert not window.maximized
+
+    for key in ("title", "size", "position", "fullscreen", "visible"):
+        setattr(window, key, getattr(window, key))
+    for key in ("borderless", "resizable", "minimized", "maximized"):
+        setattr(window, key, getattr(window, key))
+
+    print(window)
+    window.destroy()
+    other.destroy()
+    pygame.quit()
+
+
+def test_native_values(monkeypatch):
+    applied = []
+    base = sdl.Window
+
+    class Native(base):
+        @property
+        def position(self):
+            return base.position.__get__(self)
+
+        @position.setter
+        def position(self, value):
+            applied.append(("position", value))
+            base.position.__set__(self, value)
+
+        @property
+        def borderless(self):
+            return base.borderless.__get__(self)
+
+        @borderless.setter
+        def borderless(self, value):
+            applied.append(("borderless", value))
+            base.borderless.__set__(self, value)
+
+    monkeypatch.setattr(sdl, "Window", Native)
+    pygame.init()
+    window = pygwin.Window()
+    assert applied == [("position", pygwin.WINDOWPOS_CENTERED)]
+    assert window.position == pygwin.WINDOWPOS_CENTERED
+
+    window.borderless = True
+    window.borderless = True
+    assert applied[1:] == [("borderless", True)]
+    window.destroy()
+    pygame.quit()
+
+
+def test_configure():
+    pygame.init()
+    window = pygwin.Window(minimized=True, maximized=True)
+    assert window.maximized and not window.minimized
+
+    window.configure(title="configure", size=(320, 240), visible=True)
+    assert window.title == "configure"
+    assert window.size == (320, 240)
+    assert window.visible
+
+    window.configure(maximized=True, minimized=True, visible=False)
+    assert window.minimized
+    assert not window.visible
+
+    with pytest.raises(AttributeError):
+        window.configure(test=None)
+
+    with window.transaction() as transaction:
+        transaction.visible = True
+        transaction.size = (100, 100)
+        transaction.visible = False
+        assert transaction.size == (100, 100)
+        assert transaction.title == "configure"
+    assert window.size == (100, 100)
+    assert not window.visible
+
+    with pytest.raises(RuntimeError):
+        with window.transaction() as transaction:
+            transaction.title = "discarded"
+            raise RuntimeError
+    assert window.title == "configure"
+
+    transaction = window.transaction()
+    with pytest.raises(AttributeError):
+        transaction.test = None
+    with pytest.raises(AttributeError):
+        transaction.test
+
+    window.destroy()
+    pygame.quit()
+
+
+def test_renderer():
+    pygame.init()
+    window = pygwin.Window()
+    assert window.usage().renderers == 0
+    window.update()
+    assert window.usage().renderers == 1
+    assert window.renderer is window.renderer
+    window.destroy()
+
+    window = pygwin.Window(accelerated=False, vsync=False, target_texture=True)
+    window.fill()
+    assert window.usage().renderers == 1
+    window.destroy()
+    pygame.quit()
+
+
+def test_batches():
+    pygame.init()
+    window = pygwin.Window()
+    window.fill("red")
+    window.fill([0, 0, 255])
+    window.fill(pygame.Color(0, 255, 0))
+    assert pygwin.draw.to_color((1, 2, 3)) is pygwin.draw.to_color((1, 2, 3))
+
+    window.update()
+    window.fill_rects([(0, 0, 10, 10), pygame.Rect(10, 10, 5, 5)], (255, 0, 0))
+    assert window.dirty
+    window.draw_rects([(0, 0, 10, 10)])
+    window.draw_lines([(0, 0), (10, 10), (20, 0)])
+    window.draw_points([(1, 1), (2, 2)])
+    window.update()
+    window.destroy()
+    pygame.quit()
+
+
+def test_batches_numpy():
+    numpy = pytest.importorskip("numpy")
+    pygame.init()
+    window = pygwin.Window()
+    rects = numpy.array([[0, 0, 10, 10], [20, 20, 5, 5]])
+    points = numpy.array([[0, 0], [10, 10], [20, 0]])
+    window.fill_rects(rects)
+    window.draw_rects(rects)
+    window.draw_lines(points)
+    window.draw_points(points)
+    window.update()
+    window.destroy()
+    pygame.quit()
+
+
+def test_run():
+    pygame.init()
+    window = pygwin.Window()
+    frames = []
+
+    def frame(window, delta):
+        frames.append(delta)
+        if len(frames) == 3:
+            return False
+        window.fill()
+        return True
+
+    pacer = window.run(frame, fps=500)
+    assert len(frames) == 3
+    assert pacer.frames == 2
+    assert not window.dirty
+    window.destroy()
+    pygame.quit()
+
+
+def test_headless():
+    numpy = pytest.importorskip("numpy")
+    pygame.init()
+    window = pygwin.Window(headless=True, size=(8, 4), visible=True)
+    assert window.headless
+    assert window.visible
+    assert window.usage().textures == 0
+
+    window.fill((10, 20, 30))
+    window.fill_rects([(0, 0, 2, 2)], (255, 0, 0))
+    pixels = numpy.zeros((4, 8, 4), numpy.uint8)
+    assert window.read_pixels_into(pixels) is pixels
+    assert pixels[0, 0].tolist() == [0, 0, 255, 255]
+    assert pixels[3, 7].tolist() == [30, 20, 10, 255]
+    window.update()
+    assert not window.dirty
+
+    window.fill((1, 2, 3))
+    window.read_pixels_into(pixels)
+    assert pixels[0, 0].tolist() == [3, 2, 1, 255]
+
+    rgb = numpy.zeros((4, 8, 3), numpy.uint8)
+    window.read_pixels_into(rgb, "RGB")
+    assert rgb[0, 0].tolist() == [1, 2, 3]
+    with pytest.raises(ValueError):
+        window.read_pixels_into(numpy.zeros((2, 2, 4), numpy.uint8))
+
+    window.size = (4, 4)
+    window.fill((9, 9, 9))
+    small = numpy.zeros((4, 4, 4), numpy.uint8)
+    assert window.read_pixels_into(small)[3, 3].tolist() == [9, 9, 9, 255]
+    window.destroy()
+    pygame.quit()
+
+
+def test_readback_resize():
+    numpy = pytest.importorskip("numpy")
+    pygame.init()
+    window = pygwin.Window(size=(8, 4))
+    pixels = numpy.zeros(8 * 4 * 4, numpy.uint8)
+    window.fill((1, 2, 3))
+    window.read_pixels_into(pixels)
+
+    window.size = (4, 8)
+    window.fill()
+    window.fill_rects([(0, 6, 1, 1)], (255, 0, 0))
+    frame = window.read_pixels_into(pixels).reshape((8, 4, 4))
+    assert frame[6, 0].tolist() == [0, 0, 255, 255]
+    assert frame[0, 0].tolist() == [0, 0, 0, 255]
+    window.destroy()
+    pygame.quit()
+
+
+def test_lifecycle():
+    pygame.init()
+    before = pygwin.lifecycle.usage()
+    with pygwin.Window(size=(8, 4), headless=True) as window:
+        window.add_layer("grid", lambda target: target.fill((255, 0, 0)))
+        window.fill()
+        window.update()
+        usage = window.usage()
+        assert (usage.windows, usage.renderers, usage.textures) == (1, 1, 2)
+        assert usage.bytes == 2 * 8 * 4 * 4
+        assert pygwin.lifecycle.usage().windows == before.windows + 1
+    assert window.closed
+    assert window.usage().windows == 0
+    window.destroy()
+    assert pygwin.lifecycle.usage().windows == before.windows
+
+    leaked = pygwin.Window()
+    leaked.create_renderer()
+    assert pygwin.lifecycle.usage().renderers == before.renderers + 1
+    del leaked
+    after = pygwin.lifecycle.usage()
+    assert after.collected == before.collected + 1
+    assert after.windows == before.windows
+    print(usage)
+    pygame.quit()
+
+
+def test_owned_textures():
+    pygame.init()
+    source = pygwin.Window(headless=True, size=(4, 4))
+    window = pygwin.Window(headless=True, size=(4, 4))
+    resources = window.__resources__
+    window.add_layer("grid", lambda target: target.fill((255, 0, 0)))
+    window.mirror(source, rate=None)
+    source.fill((0, 255, 0))
+    source.update()
+    window.update()
+    assert list(resources.layers) == ["grid"]
+    assert list(resources.streams) == ["mirror"]
+    assert window.usage().textures == 3
+    window.destroy()
+    assert not resources.layers
+    assert not resources.streams
+    source.destroy()
+
+    leaked = pygwin.Window(headless=True, size=(4, 4))
+    resources = leaked.__resources__
+    leaked.add_layer("grid", lambda target: target.fill((255, 0, 0)))
+    leaked.fill()
+    leaked.update()
+    assert list(resources.layers) == ["grid"]
+    del leaked
+    assert not resources.layers
+    assert resources.renderer is None
+    pygame.quit()
+
+
+def test_reset():
+    pygame.init()
+    window = pygwin.Window(title="reset", size=(8, 8), headless=True)
+    renderer = window.create_renderer()
+    window.add_layer("grid", lambda target: target.fill((255, 0, 0)))
+    window.enable_stats()
+    window.resolution_scale = 0.5
+    window.fill()
+    window.reset()
+    assert not window.closed and not window.dirty
+    assert window.renderer is renderer
+    assert window.title == "pygame" and window.size == (640, 480)
+    assert window.stats is None and window.resolution_scale == 1.0
+    assert len(window.layers) == 0
+    window.reset(title="again")
+    assert window.title == "again"
+    window.destroy()
+    with pytest.raises(RuntimeError):
+        window.reset()
+    pygame.quit()
+
+
+def test_destroyed():
+    pygame.init()
+    window = pygwin.Window()
+    other = pygwin.Window()
+    manager = pygwin.WindowManager(window, other)
+    window.fill()
+    window.destroy()
+    assert not window.dirty
+    other.fill()
+    assert manager.present_all() == 1
+    with pytest.raises(RuntimeError):
+        window.renderer
+    with pytest.raises(RuntimeError):
+        window.update()
+    other.destroy()
+    pygame.quit()
+
+
+def test_destroy_recording(tmp_path):
+    pygame.init()
+    before = pygwin.lifecycle.usage()
+    window = pygwin.Window(size=(4, 4))
+    path = tmp_path / "frames"
+    window.start_recording(path, pygwin.RECORD_PNG)
+    path.rmdir()
+    window.fill()
+    window.update()
+    with pytest.raises((OSError, pygame.error)):
+        window.destroy()
+    assert window.closed
+    assert window.id == 0
+    assert pygwin.lifecycle.usage().windows == before.windows
+    pygame.quit()
+
+
+def test_quit():
+    pygame.init()
+    before = pygwin.lifecycle.usage()
+    window = pygwin.Window()
+    window.create_renderer()
+    assert pygwin.lifecycle.usage().renderers == before.renderers + 1
+    pygame.quit()
+    assert window.closed
+    assert window.id == 0
+    after = pygwin.lifecycle.usage()
+    assert after.windows == before.windows
+    assert after.renderers == before.renderers
+    assert after.textures == before.textures